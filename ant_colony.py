@@ -1,5 +1,19 @@
+import copy
 import random
+import time
 from models import Point3D, Satellite, Moon, Rocket
+from constellation import Constellation, node_positions
+from geometry import pairwise_distances
+from telemetry import ConvergenceTelemetry
+from transfer_cost import create_cost_model
+from distance_tensor import (DistanceTensor, ExactDistances, DEFAULT_BIN_WIDTH, MAX_TENSOR_BYTES,
+                             MEMMAP_THRESHOLD, choose_distance_index, estimate_horizon)
+from reachability import ReachabilityIndex, DEFAULT_FUEL_BUCKETS, orbit_distance_bound
+from checkpoint import CheckpointWriter, DEFAULT_EVERY, DEFAULT_INTERVAL
+from route_evaluator import RouteEvaluator
+from heuristics import initial_solutions
+from pareto import ParetoArchive, DEFAULT_CAPACITY
+from scenario_cache import open_cache, scenario_key
 import math
 import numpy as np
 
@@ -7,6 +21,9 @@ class AntColonyOptimization:
     def __init__(self, satellites, moon, rocket, options=None):
         if options is None:
             options = {}
+        self.options = dict(options)  # Kontrol noktasında saklanır
+        if not isinstance(satellites, Constellation):
+            satellites = Constellation.from_satellites(satellites)
         self.satellites = satellites
         self.moon = moon
         self.rocket = rocket
@@ -18,215 +35,415 @@ class AntColonyOptimization:
         self.Q = options.get('Q', 100)
 
         self.num_nodes = len(satellites) + 1
-        self.distances = [[0] * self.num_nodes for _ in range(self.num_nodes)]
-        self.pheromones = [[1] * self.num_nodes for _ in range(self.num_nodes)]
+        self.distances = np.zeros((self.num_nodes, self.num_nodes))
+        self.pheromones = np.ones((self.num_nodes, self.num_nodes))
         self.time_step = 3600  # 1 saatlik zaman adımı (saniye)
         self.fuelConsumptionPerHour = 0.005  # Saatlik yakıt tüketimi
+        self.pheromone_min = 0.1
+        self.pheromone_max = 2.0
 
+        # 'linear' (mesafe tabanlı) veya 'delta_v' (yörünge transferi tabanlı)
+        self.cost_model = create_cost_model(options.get('cost_model', 'linear'),
+                                            self.satellites, moon, rocket)
+
+        # Kayan ufuk planlaması: turun başlangıç durumu ve pencere sınırları
+        self.start_node = options.get('start_node', 0)
+        self.start_fuel = options.get('start_fuel', rocket.max_fuel)
+        self.initial_visited = np.zeros(self.num_nodes - 1, dtype=bool)
+        if options.get('visited') is not None:
+            self.initial_visited[:] = options['visited']
+        self.max_visits = options.get('max_visits')  # Pencere başına ziyaret sayısı
+        self.horizon_time = options.get('horizon_time')  # Pencere süresi (saniye)
+        self.windowed = (self.start_node != 0 or self.initial_visited.any()
+                         or self.max_visits is not None or self.horizon_time is not None)
+        # Pencere planı tek bir uyduyla bitebilir; tam tur Ay + en az iki düğüm içerir
+        self.min_path_length = 2 if self.windowed else 3
+
+        # 'tensor': zaman kovalarında önceden hesaplanmış mesafeler, 'exact': her sorguda hesap,
+        # 'auto': tensör AUTO_TENSOR_BYTES'a sığıyorsa tensör, değilse tam hesap
+        self.distance_index_type = options.get('distance_index', 'auto')
+        self.distance_bin_width = options.get('distance_bin_width', DEFAULT_BIN_WIDTH)
+        self.distance_horizon = options.get('distance_horizon')
+        # Mesafe tensörü ve erişilebilirlik indeksi için disk önbelleği
+        # (True, dizin yolu ya da ScenarioCache); aynı filoda tekrar kurulmaz
+        self.scenario_cache = open_cache(options.get('scenario_cache'))
         self.initialize_distances()
+
+        # tau^alpha * eta^beta önbelleği: eta^beta kova başına bir kez,
+        # tau^alpha her feromon güncellemesinden sonra bir kez hesaplanır
+        self.use_choice_cache = (options.get('choice_cache', True)
+                                 and isinstance(self.distance_index, DistanceTensor)
+                                 and self.distance_index.nbytes <= MEMMAP_THRESHOLD)
+        self.eta_beta = {}
+        self.choice_tau = None
+        self.choice_bins = {}
+
+        # Yakıtla erişilemeyen adayları skorlamadan önce ele
+        self.use_reachability = options.get('reachability', True)
+        self.fuel_buckets = options.get('fuel_buckets', DEFAULT_FUEL_BUCKETS)
+        if self.use_reachability:
+            self.initialize_reachability()
+
+        # Çok amaçlı mod: (mesafe, süre, yakıt, en düşük uydu yakıtı) Pareto
+        # arşivi tutulur ve feromonu arşiv üyeleri bırakır
+        self.multi_objective = options.get('multi_objective', False)
+        self.pareto_archive = ParetoArchive(options.get('pareto_capacity', DEFAULT_CAPACITY))
+
+        # En yakın komşu / en ucuz ekleme ile ilk çözüm ve feromon seviyesi;
+        # sezgiseller tam turu Ay'dan dolu depoyla kurar
+        self.seed_heuristics = options.get('seed_heuristics', True) and not self.windowed
         self.iteration_callback = None
+        self.progress_callback = None
+        self.telemetry = ConvergenceTelemetry(options.get('telemetry_points', 512))
+        self.time_limit = options.get('time_limit')  # Saniye, None ise sınırsız
+        self.verbose = options.get('verbose', True)
+        self.stop_requested = False
+        self.deadline = None
+
+        # Tüm rastgelelik bu üreteçlerden gelir; kontrol noktasından devam
+        # eden çalışma kesintisiz çalışmayla aynı sonucu üretir
+        seed = options.get('seed')
+        self.random = random.Random(seed)
+        self.np_random = np.random.default_rng(seed)
+        self.resume_state = None
+
+        self.checkpoint_writer = None
+        if options.get('checkpoint_path'):
+            self.checkpoint_writer = CheckpointWriter(
+                options['checkpoint_path'],
+                options.get('checkpoint_every', DEFAULT_EVERY),
+                options.get('checkpoint_interval', DEFAULT_INTERVAL)
+            )
 
     def initialize_distances(self):
-        for i in range(self.num_nodes):
-            for j in range(self.num_nodes):
-                if i == j:
-                    continue
-                pos1 = self.moon.get_position() if i == 0 else self.satellites[i - 1].current_position
-                pos2 = self.moon.get_position() if j == 0 else self.satellites[j - 1].current_position
-                self.distances[i][j] = pos1.distance_to(pos2)
-
-    def calculate_priorities(self, satellite_states, current_node, current_fuel, elapsed_time):
-        priorities = []
-        current_pos = self.moon.get_position() if current_node == 0 else satellite_states[current_node - 1]['position']
-        moon_pos = self.moon.get_position()
+        positions = node_positions(self.satellites, self.moon, 0)
+        self.distances = pairwise_distances(positions)
+        horizon = self.distance_horizon
+        if horizon is None:
+            horizon = estimate_horizon(self.satellites, self.moon, self.rocket, self.max_visits)
+        kind = choose_distance_index(self.distance_index_type, self.num_nodes, horizon,
+                                     self.distance_bin_width)
+        if kind == 'exact':
+            self.distance_index = ExactDistances(self.satellites, self.moon)
+            return
+        if self.scenario_cache is None:
+            self.distance_index = DistanceTensor(self.satellites, self.moon, horizon,
+                                                 self.distance_bin_width)
+            return
+        key = scenario_key(self.satellites, self.moon, table='distance_tensor', horizon=horizon,
+                           bin_width=self.distance_bin_width, max_bytes=MAX_TENSOR_BYTES)
+        arrays = self.scenario_cache.get_or_build(key, lambda: {
+            'distances': DistanceTensor(self.satellites, self.moon, horizon,
+                                        self.distance_bin_width).data
+        })
+        self.distance_index = DistanceTensor.from_data(self.satellites, self.moon,
+                                                       arrays['distances'], self.distance_bin_width)
+
+    def initialize_reachability(self):
+        """
+        İki indeks kurulur: ufuk içi kalkışlar için tensörün zaman boyunca
+        en kısa mesafeleriyle sıkı olan, ufuk dışı için yalnızca yörünge
+        yarıçapı farkına dayanan her zaman geçerli olan
+        """
+        if self.scenario_cache is None:
+            self.reachability_any, self.reachability = self.build_reachability()
+            return
+        tensor = isinstance(self.distance_index, DistanceTensor)
+        key = scenario_key(self.satellites, self.moon, self.rocket, table='reachability',
+                           cost_model=type(self.cost_model).__name__, fuel_buckets=self.fuel_buckets,
+                           horizon=self.distance_index.horizon if tensor else None,
+                           bin_width=self.distance_index.bin_width if tensor else None)
+
+        def build():
+            any_index, tight_index = self.build_reachability()
+            return {'any': any_index.first_bucket, 'tight': tight_index.first_bucket}
+
+        arrays = self.scenario_cache.get_or_build(key, build)
+        self.reachability_any = ReachabilityIndex.from_table(
+            arrays['any'], self.rocket.max_fuel, self.fuel_buckets)
+        self.reachability = ReachabilityIndex.from_table(
+            arrays['tight'], self.rocket.max_fuel, self.fuel_buckets)
+
+    def build_reachability(self):
+        """
+        Returns:
+            tuple: (her zaman geçerli indeks, ufuk içi sıkı indeks)
+        """
+        bound = orbit_distance_bound(self.satellites, self.moon)
+        any_index = ReachabilityIndex(
+            self.cost_model.required_fuel(bound), self.rocket.max_fuel, self.fuel_buckets)
+        if not isinstance(self.distance_index, DistanceTensor):
+            return any_index, any_index
+        # float32 yuvarlamasına karşı küçük pay
+        tight = np.maximum(bound, self.distance_index.min_over_time() * (1 - 1e-6))
+        return any_index, ReachabilityIndex(
+            self.cost_model.required_fuel(tight), self.rocket.max_fuel, self.fuel_buckets)
+
+    def reachability_for(self, elapsed_time):
+        if elapsed_time <= self.distance_index.horizon:
+            return self.reachability
+        return self.reachability_any
+
+    def distance(self, from_node, to_nodes, elapsed_time):
+        """Kalkış anı elapsed_time olan bacak(lar)ın mesafesi (tablo okuması)"""
+        return self.distance_index.lookup(from_node, to_nodes, elapsed_time)
+
+    def transfer_fuel(self, from_node, to_nodes, distance, elapsed_time, fuel_on_board):
+        """Seçilen maliyet modeline göre bacak(lar) için gereken yakıt"""
+        return self.cost_model.fuel(from_node, to_nodes, distance, elapsed_time, fuel_on_board)
+
+    def evaluate_routes(self, routes):
+        """Rotaları bu çözücünün mesafe indeksi ve maliyet modeliyle değerlendirir"""
+        return RouteEvaluator.from_optimizer(self).evaluate(routes)
+
+    def invalidate_choice_info(self):
+        """Feromonlar her değiştiğinde çağrılır; önbellek ilk kullanımda yenilenir"""
+        self.choice_tau = None
+        self.choice_bins = {}
+
+    def refresh_choice_info(self):
+        self.choice_tau = self.pheromones ** self.alpha
+        self.choice_bins = {}
+
+    def heuristic_power(self, index):
+        """
+        Zaman kovası için eta^beta matrisi. eta = 1 / (bacak maliyeti + 1);
+        yakıt dolu depoyla hesaplanır. Feromondan bağımsız olduğundan
+        çalışma boyunca saklanır.
+        """
+        if index not in self.eta_beta:
+            distances = self.distance_index.data[index].astype(np.float64)
+            nodes = np.arange(self.num_nodes)
+            fuel = self.transfer_fuel(nodes[:, None], nodes[None, :], distances,
+                                      index * self.distance_index.bin_width, self.rocket.max_fuel)
+            heuristic = 1.0 / (self.cost_model.leg_cost(distances, fuel) + 1)
+            self.eta_beta[index] = (heuristic ** self.beta).astype(np.float32)
+        return self.eta_beta[index]
+
+    def choice_bin(self, index):
+        if index not in self.choice_bins:
+            self.choice_bins[index] = self.choice_tau * self.heuristic_power(index)
+        return self.choice_bins[index]
+
+    def choice_info(self, current_node, targets, elapsed_time):
+        """
+        Önbellekten tau^alpha * eta^beta; iki komşu kova arasında doğrusal
+        interpolasyon. Önbellek kapalıysa ya da an ufuk dışındaysa None.
+        """
+        if not self.use_choice_cache:
+            return None
+        position = elapsed_time / self.distance_index.bin_width
+        if not 0 <= position <= self.distance_index.bins - 1:
+            return None
+        if self.choice_tau is None:
+            self.refresh_choice_info()
+        index = min(int(position), self.distance_index.bins - 2)
+        weight = position - index
+        before = self.choice_bin(index)[current_node, targets]
+        after = self.choice_bin(index + 1)[current_node, targets]
+        return before + weight * (after - before)
+
+    def calculate_priorities(self, satellite_fuel, candidates, current_node,
+                             elapsed_time=0, current_fuel=None):
+        """
+        Aday uyduların seçim skorlarını tek seferde hesaplar
+        Args:
+            satellite_fuel: Uyduların güncel yakıt seviyeleri (N,)
+            candidates: Aday uydu indeksleri (0 tabanlı)
+            current_node: Roketin bulunduğu düğüm
+            elapsed_time: Görev başından beri geçen süre (saniye)
+            current_fuel: Roketteki yakıt (None ise dolu depo)
+        Returns:
+            dict: Her alan adaylarla aynı sırada bir dizi
+        """
+        # Temel faktörler
+        fuel_level = satellite_fuel[candidates] / 100
+        distance_to_target = self.distance(current_node, candidates + 1, elapsed_time)
+        travel_time = distance_to_target / self.rocket.speed
+        if current_fuel is None:
+            current_fuel = self.rocket.max_fuel
         
-        for index, sat in enumerate(satellite_states):
-            # Temel faktörler
-            fuel_level = sat['fuel'] / 100
-            distance_to_target = current_pos.distance_to(sat['position'])
-            travel_time = distance_to_target / self.rocket.speed
-            fuel_needed = self.rocket.calculate_fuel_consumption(distance_to_target)
-            
-            # Feromon değerini al
-            pheromone = self.pheromones[current_node][index + 1]
-            
-            # Sezgisel bilgi hesapla
-            heuristic = 1.0 / (distance_to_target + 1)
-            
-            # Olasılık hesapla (ACO formülü)
+        # Olasılık (ACO formülü): önbellekten satır okuması, yoksa doğrudan hesap.
+        # Önbellek kullanılınca yakıt yalnızca seçilen aday için hesaplanır.
+        fuel_needed = None
+        probability = self.choice_info(current_node, candidates + 1, elapsed_time)
+        if probability is None:
+            fuel_needed = self.transfer_fuel(current_node, candidates + 1, distance_to_target,
+                                             elapsed_time, current_fuel)
+            pheromone = self.pheromones[current_node, candidates + 1]
+            # Sezgisel bilgi (seçilen maliyet modelinin bacak maliyeti)
+            heuristic = 1.0 / (self.cost_model.leg_cost(distance_to_target, fuel_needed) + 1)
             probability = (pheromone ** self.alpha) * (heuristic ** self.beta)
-            
-            # Yakıt ve zaman faktörlerini ekle
-            fuel_factor = (1 - fuel_level) ** 2  # Düşük yakıtlı uyduları tercih et
-            time_factor = 1.0 / (travel_time + 1)
-            
-            # Toplam skoru hesapla
-            total_score = probability * (1 + fuel_factor + time_factor)
-            
-            priorities.append({
-                'index': index,
-                'score': total_score,
-                'probability': probability,
-                'fuel_level': fuel_level,
-                'position': sat['position'],
-                'distance': distance_to_target,
-                'travel_time': travel_time,
-                'fuel_needed': fuel_needed
-            })
         
-        return priorities
+        # Yakıt ve zaman faktörlerini ekle
+        fuel_factor = (1 - fuel_level) ** 2  # Düşük yakıtlı uyduları tercih et
+        time_factor = 1.0 / (travel_time + 1)
+        
+        return {
+            'index': candidates,
+            'score': probability * (1 + fuel_factor + time_factor),
+            'probability': probability,
+            'fuel_level': fuel_level,
+            'distance': distance_to_target,
+            'travel_time': travel_time,
+            'fuel_needed': fuel_needed  # Önbellek kullanıldıysa None
+        }
+
+    def window_open(self, visits, elapsed_time):
+        """Kayan ufuk penceresinde yeni ziyarete yer var mı"""
+        if self.max_visits is not None and visits >= self.max_visits:
+            return False
+        return self.horizon_time is None or elapsed_time < self.horizon_time
 
     def construct_solution(self):
-        visited = set()
-        path = [0]
-        current_node = 0
-        current_fuel = self.rocket.max_fuel
+        visited = self.initial_visited.copy()
+        path = [self.start_node]
+        current_node = self.start_node
+        current_fuel = self.start_fuel
         total_distance = 0
+        total_cost = 0
         elapsed_time = 0
         total_fuel_consumed = 0
-        
-        # Başlangıç durumları...
-        satellite_states = [{
-            'fuel': sat.fuel,
-            'position': sat.current_position,
-            'orbit_radius': sat.orbit_radius,
-            'orbit_speed': sat.orbit_speed,
-            'current_angle': sat.current_angle,
-            'inclination': sat.inclination
-        } for sat in self.satellites]
-
-        while len(visited) < self.num_nodes - 1:
-            self.update_satellite_states(satellite_states, elapsed_time)
-            self.moon.update_position(elapsed_time)
-            
-            current_pos = self.moon.get_position() if current_node == 0 else satellite_states[current_node - 1]['position']
-            moon_pos = self.moon.get_position()
+        blocked = np.zeros(self.num_nodes - 1, dtype=bool)  # Bu durumda denenip ulaşılamayanlar
+        # Her düğüme varış anı ve varıştaki yakıt (kayan ufuk taahhüdü için)
+        arrival_times = [0.0]
+        arrival_fuel = [current_fuel]
+        visits = 0
+
+        while not visited.all() and self.window_open(visits, elapsed_time):
+            satellite_fuel = self.satellites.fuel_at(elapsed_time, self.fuelConsumptionPerHour)
 
             # Ay'a dönüş için gereken yakıt hesabı
-            return_distance = current_pos.distance_to(moon_pos)
-            return_fuel_needed = self.rocket.calculate_fuel_consumption(return_distance)
+            return_distance = self.distance(current_node, 0, elapsed_time)
+            return_fuel_needed = float(self.transfer_fuel(current_node, 0, return_distance,
+                                                          elapsed_time, current_fuel))
 
             # Eğer Ay'a dönecek yakıt kalmadıysa, önce Ay'a git
             if current_fuel < return_fuel_needed and current_node != 0:
                 path.append(0)
                 total_distance += return_distance
+                total_cost += self.cost_model.leg_cost(return_distance, return_fuel_needed)
                 total_fuel_consumed += current_fuel  # Kalan yakıtı kullan
                 elapsed_time += return_distance / self.rocket.speed
                 current_fuel = self.rocket.max_fuel
                 current_node = 0
-                current_pos = moon_pos
+                blocked[:] = False
+                arrival_times.append(elapsed_time)
+                arrival_fuel.append(current_fuel)
                 continue
 
-            # Adayları değerlendir
-            priorities = self.calculate_priorities(satellite_states, current_node, current_fuel, elapsed_time)
-            candidates = [p for p in priorities if p['index'] + 1 not in visited]
-
-            if not candidates:
-                if current_node != 0:
-                    path.append(0)
-                    total_distance += return_distance
-                    total_fuel_consumed += return_fuel_needed
-                    elapsed_time += return_distance / self.rocket.speed
-                break
+            # Adayları değerlendir; erişilemeyecekleri skorlamadan önce ele
+            candidates = np.flatnonzero(~(visited | blocked))
+            if self.use_reachability and len(candidates):
+                index = self.reachability_for(elapsed_time)
+                candidates = candidates[index.candidate_mask(current_node, current_fuel, candidates + 1)]
+            if not len(candidates):
+                return None  # Kalan uydulara hiçbir yoldan ulaşılamıyor
+            priorities = self.calculate_priorities(satellite_fuel, candidates, current_node,
+                                                   elapsed_time, current_fuel)
 
             # Rulet tekerleği seçimi
-            total_score = sum(c['score'] for c in candidates)
-            if total_score == 0:
-                probabilities = [1.0 / len(candidates)] * len(candidates)
+            cumulative = np.cumsum(priorities['score'])
+            total_score = cumulative[-1]
+            if total_score > 0:
+                selected_index = int(np.searchsorted(cumulative, self.random.random() * total_score, side='right'))
+                selected_index = min(selected_index, len(candidates) - 1)
             else:
-                probabilities = [c['score'] / total_score for c in candidates]
-            
-            selected_index = random.choices(range(len(candidates)), probabilities)[0]
-            selected = candidates[selected_index]
+                selected_index = self.random.randrange(len(candidates))
+            target_node = int(candidates[selected_index]) + 1
             
             # Seçilen uyduya gidiş maliyeti
-            distance_to_selected = current_pos.distance_to(selected['position'])
-            fuel_needed = self.rocket.calculate_fuel_consumption(distance_to_selected)
+            distance_to_selected = float(priorities['distance'][selected_index])
+            if priorities['fuel_needed'] is None:
+                fuel_needed = float(self.transfer_fuel(current_node, target_node, distance_to_selected,
+                                                       elapsed_time, current_fuel))
+            else:
+                fuel_needed = float(priorities['fuel_needed'][selected_index])
 
             # Yakıt kontrolü
             if fuel_needed > current_fuel:
                 # Ay üzerinden gitmeyi dene
-                moon_distance = current_pos.distance_to(moon_pos)
-                moon_to_target = moon_pos.distance_to(selected['position'])
-                via_moon_distance = moon_distance + moon_to_target
-                via_moon_fuel = self.rocket.calculate_fuel_consumption(via_moon_distance)
+                moon_distance = return_distance
+                moon_departure = elapsed_time + moon_distance / self.rocket.speed
+                moon_to_target = self.distance(0, target_node, moon_departure)
+                # Ay'a varış yakıtı ile dolu depoyla Ay'dan hedefe gidiş yakıtı
+                moon_to_target_fuel = float(self.transfer_fuel(
+                    0, target_node, moon_to_target, moon_departure, self.rocket.max_fuel))
+                via_moon_fuel = return_fuel_needed + moon_to_target_fuel
 
                 if via_moon_fuel <= self.rocket.max_fuel:
                     # Önce Ay'a git
                     path.append(0)
                     total_distance += moon_distance
+                    total_cost += self.cost_model.leg_cost(moon_distance, return_fuel_needed)
                     total_fuel_consumed += current_fuel
                     elapsed_time += moon_distance / self.rocket.speed
+                    arrival_times.append(elapsed_time)
+                    arrival_fuel.append(self.rocket.max_fuel)
                     
                     # Sonra hedef uyduya git
-                    path.append(selected['index'] + 1)
+                    path.append(target_node)
                     total_distance += moon_to_target
+                    total_cost += self.cost_model.leg_cost(moon_to_target, moon_to_target_fuel)
                     current_fuel = self.rocket.max_fuel - via_moon_fuel
                     total_fuel_consumed += via_moon_fuel
                     elapsed_time += moon_to_target / self.rocket.speed
-                    current_node = selected['index'] + 1
-                    visited.add(current_node)
+                    current_node = target_node
+                    visited[current_node - 1] = True
+                    blocked[:] = False
+                    visits += 1
+                    arrival_times.append(elapsed_time)
+                    arrival_fuel.append(current_fuel)
                 else:
-                    continue  # Bu uyduya gidemiyoruz, başka seç
+                    # Bu uyduya gidemiyoruz; durum değişene kadar tekrar seçilmesin
+                    blocked[target_node - 1] = True
+                    continue
             else:
                 # Direkt gidiş mümkün
-                path.append(selected['index'] + 1)
+                path.append(target_node)
                 total_distance += distance_to_selected
+                total_cost += self.cost_model.leg_cost(distance_to_selected, fuel_needed)
                 current_fuel -= fuel_needed
                 total_fuel_consumed += fuel_needed
                 elapsed_time += distance_to_selected / self.rocket.speed
-                current_node = selected['index'] + 1
-                visited.add(current_node)
-
-        # Son konum Ay değilse, Ay'a dön
-        if path[-1] != 0:
-            final_pos = satellite_states[path[-1] - 1]['position']
-            final_distance = final_pos.distance_to(moon_pos)
-            final_fuel_needed = self.rocket.calculate_fuel_consumption(final_distance)
+                current_node = target_node
+                visited[current_node - 1] = True
+                blocked[:] = False
+                visits += 1
+                arrival_times.append(elapsed_time)
+                arrival_fuel.append(current_fuel)
+
+        # Son konum Ay değilse, Ay'a dön (pencere planı görev sonu değilse dönülmez)
+        if path[-1] != 0 and visited.all():
+            final_distance = self.distance(path[-1], 0, elapsed_time)
+            final_fuel_needed = float(self.transfer_fuel(path[-1], 0, final_distance,
+                                                         elapsed_time, current_fuel))
             
             if final_fuel_needed > current_fuel:
                 # Son kez Ay'a dönüş için yakıt doldurmaya git
                 path.append(0)
                 total_distance += final_distance
+                total_cost += self.cost_model.leg_cost(final_distance, final_fuel_needed)
                 total_fuel_consumed += current_fuel
                 elapsed_time += final_distance / self.rocket.speed
+                arrival_times.append(elapsed_time)
+                arrival_fuel.append(self.rocket.max_fuel)
 
         # Çözüm geçerliliği kontrolü
-        if total_distance <= 0 or len(path) < 3:
+        if total_distance <= 0 or len(path) < self.min_path_length:
             return None
 
         return {
             'path': path,
-            'cost': total_distance,
-            'fuel_states': [sat['fuel'] for sat in satellite_states],
+            'cost': total_cost,
+            'distance': total_distance,
+            'fuel_states': self.satellites.fuel_at(elapsed_time, self.fuelConsumptionPerHour).tolist(),
             'time_elapsed': elapsed_time,
-            'total_fuel_consumption': total_fuel_consumed
+            'total_fuel_consumption': total_fuel_consumed,
+            'arrival_times': arrival_times,
+            'arrival_fuel': arrival_fuel
         }
 
-    def update_satellite_states(self, satellite_states, elapsed_time):
-        """
-        Uyduların pozisyonlarını ve yakıt durumlarını günceller
-        Args:
-            satellite_states: Uydu durumlarını içeren liste
-            elapsed_time: Geçen toplam süre (saniye)
-        """
-        for state in satellite_states:
-            # Açısal hızı kullanarak yeni açıyı hesapla
-            angular_velocity = state['orbit_speed']  # rad/s
-            new_angle = state['current_angle'] + (angular_velocity * elapsed_time)
-            state['current_angle'] = new_angle % (2 * math.pi)  # 0-2π arasında tut
-            
-            # Yeni pozisyonu hesapla
-            x = state['orbit_radius'] * math.cos(state['current_angle'])
-            y = state['orbit_radius'] * math.sin(state['current_angle']) * math.cos(state['inclination'])
-            z = state['orbit_radius'] * math.sin(state['current_angle']) * math.sin(state['inclination'])
-            state['position'] = Point3D(x, y, z)
-
-            # Yakıt tüketimini hesapla
-            hours_passed = elapsed_time / 3600
-            fuel_consumed = hours_passed * self.fuelConsumptionPerHour
-            state['fuel'] = max(0, state['fuel'] - fuel_consumed)
-
     def calculate_dynamic_distance(self, pos1, pos2):
         return pos1.distance_to(pos2)
 
@@ -235,9 +452,7 @@ class AntColonyOptimization:
             return
         
         # Feromonları buharlaştır
-        for i in range(self.num_nodes):
-            for j in range(self.num_nodes):
-                self.pheromones[i][j] *= (1 - self.evaporation_rate)
+        self.pheromones *= (1 - self.evaporation_rate)
         
         # En iyi çözümlere daha fazla feromon ekle
         solutions.sort(key=lambda x: x['cost'])
@@ -269,156 +484,400 @@ class AntColonyOptimization:
             for i in range(len(path) - 1):
                 from_node = path[i]
                 to_node = path[i + 1]
-                self.pheromones[from_node][to_node] += pheromone_amount
-                self.pheromones[to_node][from_node] += pheromone_amount  # Simetrik güncelleme
+                self.pheromones[from_node, to_node] += pheromone_amount
+                self.pheromones[to_node, from_node] += pheromone_amount  # Simetrik güncelleme
+        self.invalidate_choice_info()
+
+    def pheromone_deposit(self, solution):
+        """Çözümün kenarlarına bırakılacak feromon miktarı ve bileşenleri"""
+        # Kalite hesaplamasını düzelt
+        normalized_cost = solution['cost'] / 1000  # km cinsinden
+        quality = 1.0 / (normalized_cost + 1)  # +1 ekleyerek sıfıra bölünmeyi önle
+        
+        # Yakıt faktörünü normalize et
+        total_fuel_saved = sum(100 - fuel for fuel in solution['fuel_states'])
+        max_possible_fuel_save = 100 * len(solution['fuel_states'])  # Maksimum tasarruf
+        fuel_factor = 1 + (total_fuel_saved / max_possible_fuel_save)  # 1-2 arası değer
+        
+        # Zaman faktörünü normalize et
+        time_hours = solution['time_elapsed'] / 3600
+        time_factor = 1 + (1 / (time_hours + 1))  # Daha kısa süre daha iyi
+        
+        return {
+            'normalized_cost': normalized_cost,
+            'quality': quality,
+            'fuel_saved': total_fuel_saved,
+            'max_fuel_save': max_possible_fuel_save,
+            'fuel_factor': fuel_factor,
+            'time_hours': time_hours,
+            'time_factor': time_factor,
+            'amount': min(self.Q * quality * fuel_factor * time_factor, 10.0)  # Üst sınır
+        }
+
+    def add_to_archive(self, solutions):
+        """
+        Çözümleri Pareto arşivine ekler. Karıncaların yakıt toplamı Ay
+        dönüşlerinde depoda kalan yakıtı da sayar; sezgisel tohumlar ise
+        RouteEvaluator ile puanlanır. Amaçların karşılaştırılabilir olması
+        için tam turlar tek seferde RouteEvaluator ile yeniden puanlanır.
+        Pencere planları Ay'da başlamadığından olduğu gibi eklenir.
+        Arşiv yalnızca çok amaçlı modda tutulur; tek amaçlı çalışma her
+        iterasyonda yeniden puanlama yapmaz ve 'pareto_front' boş döner.
+        """
+        if not solutions or not self.multi_objective:
+            return
+        if self.windowed:
+            for solution in solutions:
+                self.pareto_archive.add(solution)
+            return
+        evaluation = self.evaluate_routes([solution['path'] for solution in solutions])
+        for row, solution in enumerate(solutions):
+            self.pareto_archive.add(dict(
+                solution,
+                cost=float(evaluation['cost'][row]),
+                distance=float(evaluation['distance'][row]),
+                time_elapsed=float(evaluation['time_elapsed'][row]),
+                total_fuel_consumption=float(evaluation['fuel_consumed'][row]),
+                fuel_states=evaluation['fuel_states'][row].tolist()
+            ))
+
+    def deposit_from_archive(self):
+        """
+        Çok amaçlı mod: her Pareto arşivi üyesi eşit pay bırakır. Toplam
+        bırakım rho * tau_max olduğundan tüm üyelerde ortak olan kenarlar
+        tau_max'a yakınsar; tek bir ağırlıklandırma öne çıkmaz.
+        """
+        if not len(self.pareto_archive):
+            return
+        amount = self.evaporation_rate * self.pheromone_max / len(self.pareto_archive)
+        for member in self.pareto_archive:
+            path = member['path']
+            np.add.at(self.pheromones, (path[:-1], path[1:]), amount)
+            np.add.at(self.pheromones, (path[1:], path[:-1]), amount)  # Simetrik güncelleme
+        self.log(f"Pareto arşivi: {len(self.pareto_archive)} üye, üye başına feromon {amount:.4f}")
+
+    def warm_start(self, pheromones):
+        """Önceki pencerenin feromonlarıyla başlar (kayan ufuk yeniden planlama)"""
+        self.pheromones = np.array(pheromones, dtype=np.float64)
+        self.invalidate_choice_info()
+        self.seed_heuristics = False
+
+    def seed_from_heuristics(self):
+        """
+        Kurucu sezgisellerle ilk çözümleri üretir ve feromonları başlatır.
+        Tüm kenarlar çözücünün olağan başlangıç seviyesinde (1.0) kalır;
+        sezgisel turların kenarları [pheromone_min, pheromone_max] bandı
+        içinde, en iyi tur pheromone_max'a ulaşacak şekilde maliyetle ters
+        orantılı yükseltilir. Maliyet ölçeği (ör. metre) bu seviyeleri
+        etkilemez.
+        Returns:
+            dict veya None: En iyi sezgisel çözüm
+        """
+        solutions = initial_solutions(RouteEvaluator.from_optimizer(self))
+        if not solutions:
+            return None
+        best = solutions[0]
+        headroom = self.pheromone_max - 1.0  # Feromonlar np.ones ile başlar
+        for solution in solutions:
+            amount = headroom * best['cost'] / max(solution['cost'], 1e-10)
+            path = solution['path']
+            np.add.at(self.pheromones, (path[:-1], path[1:]), amount)
+            np.add.at(self.pheromones, (path[1:], path[:-1]), amount)  # Simetrik güncelleme
+        np.clip(self.pheromones, self.pheromone_min, self.pheromone_max, out=self.pheromones)
+        self.invalidate_choice_info()
+
+        for solution in solutions:
+            self.log(f"Sezgisel ({solution['heuristic']}): maliyet {solution['cost']:.1f}, "
+                     f"{len(solution['path'])} düğüm")
+        return dict(best)
+
+    def log(self, *args, **kwargs):
+        if self.verbose:
+            print(*args, **kwargs)
+
+    def request_stop(self):
+        """
+        Optimizasyonun bir sonraki karınca sınırında durmasını ister.
+        Başka bir thread'den çağrılabilir; optimize() o ana kadarki en iyi
+        çözümü döndürür.
+        """
+        self.stop_requested = True
+
+    def should_stop(self):
+        if self.stop_requested:
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
 
     def set_iteration_callback(self, callback):
         """İterasyon callback'ini ayarlar"""
         self.iteration_callback = callback
 
+    def set_progress_callback(self, callback):
+        """
+        Her iterasyon sonunda çağrılacak callback'i ayarlar. Callback
+        iteration, iterations, best_cost ve best_path alanlarını içeren
+        bir sözlük alır.
+        """
+        self.progress_callback = callback
+
+    def report_progress(self, iteration, best_solution, iteration_solutions, stagnation_counter):
+        """Yakınsama ölçümlerini kaydeder ve ilerleme callback'ini çağırır"""
+        point = self.telemetry.record(
+            iteration + 1,
+            [solution['cost'] for solution in iteration_solutions],
+            best_solution['cost'] if best_solution else None,
+            self.pheromones,
+            stagnation_counter
+        )
+        if not self.progress_callback:
+            return
+        self.progress_callback({
+            'iteration': iteration + 1,
+            'iterations': self.iterations,
+            'best_cost': best_solution['cost'] if best_solution else None,
+            'best_path': list(best_solution['path']) if best_solution else None,
+            'telemetry': point
+        })
+
+    def scenario(self):
+        """Optimizasyonu yeniden kurmak için gereken senaryo verisi"""
+        satellites = self.satellites
+        return {
+            'satellites': {
+                'ids': satellites.ids.copy(),
+                'orbit_radius': satellites.orbit_radius.copy(),
+                'angle': satellites.angle.copy(),
+                'inclination': satellites.inclination.copy(),
+                'fuel': satellites.fuel.copy()
+            },
+            'moon_angle': self.moon.current_angle,
+            'rocket': {
+                name: getattr(self.rocket, name)
+                for name in ('max_fuel', 'speed', 'fuel_consumption_rate', 'dry_mass', 'specific_impulse')
+            }
+        }
+
+    def get_state(self, iteration, best_solution, stagnation_counter,
+                  random_state=None, numpy_state=None):
+        """
+        İterasyon sınırındaki tam optimizasyon durumu
+        Args:
+            iteration: Sıradaki iterasyon (0 tabanlı)
+            random_state, numpy_state: Verilmezse üreteçlerin güncel durumu
+        """
+        return {
+            'iteration': iteration,
+            'pheromones': self.pheromones.copy(),
+            'best_solution': copy.deepcopy(best_solution),
+            'stagnation_counter': stagnation_counter,
+            'random_state': random_state if random_state is not None else self.random.getstate(),
+            'numpy_state': numpy_state if numpy_state is not None else self.np_random.bit_generator.state,
+            'telemetry': copy.deepcopy(self.telemetry),
+            'pareto_archive': copy.deepcopy(self.pareto_archive),
+            'scenario': self.scenario(),
+            'options': dict(self.options)
+        }
+
+    def restore_state(self, state):
+        """get_state() ile alınan durumu yükler; optimize() kaldığı yerden devam eder"""
+        self.pheromones = np.array(state['pheromones'], dtype=np.float64)
+        self.invalidate_choice_info()
+        self.random.setstate(state['random_state'])
+        self.np_random.bit_generator.state = state['numpy_state']
+        self.telemetry = copy.deepcopy(state['telemetry'])
+        self.pareto_archive = copy.deepcopy(state['pareto_archive'])
+        self.resume_state = state
+
+    def save_checkpoint(self, iteration, best_solution, stagnation_counter,
+                        random_state=None, numpy_state=None, force=False):
+        if self.checkpoint_writer is None:
+            return
+        if force or self.checkpoint_writer.due(iteration):
+            self.checkpoint_writer.submit(self.get_state(
+                iteration, best_solution, stagnation_counter, random_state, numpy_state))
+
     def optimize(self):
+        try:
+            return self.run_iterations()
+        finally:
+            if self.checkpoint_writer is not None:
+                self.checkpoint_writer.close()
+                if self.checkpoint_writer.error is not None:
+                    self.log(f"Kontrol noktası yazılamadı: {self.checkpoint_writer.error}")
+
+    def run_iterations(self):
         best_solution = None
         all_solutions = []
         stagnation_counter = 0
+        start_iteration = 0
+        if self.resume_state is not None:
+            start_iteration = self.resume_state['iteration']
+            best_solution = copy.deepcopy(self.resume_state['best_solution'])
+            stagnation_counter = self.resume_state['stagnation_counter']
+        stopped = False
+        if self.time_limit:
+            self.deadline = time.monotonic() + self.time_limit
         
-        print("\nKarınca Kolonisi Optimizasyonu Başlıyor...")
-        print("=" * 50)
+        self.log("\nKarınca Kolonisi Optimizasyonu Başlıyor...")
+        self.log("=" * 50)
+        if self.resume_state is None and self.seed_heuristics:
+            best_solution = self.seed_from_heuristics()
+            if best_solution:
+                self.add_to_archive([best_solution])
+        if start_iteration:
+            self.log(f"Kontrol noktasından devam ediliyor: iterasyon {start_iteration + 1}")
         
-        for iteration in range(self.iterations):
+        for iteration in range(start_iteration, self.iterations):
             if self.iteration_callback:
                 self.iteration_callback(iteration)
+            # Yarıda kalan iterasyon bu durumdan yeniden başlatılabilsin
+            iteration_start = (best_solution, stagnation_counter,
+                               self.random.getstate(), self.np_random.bit_generator.state)
             
-            print(f"\nİterasyon {iteration + 1}/{self.iterations}")
-            print("-" * 30)
+            self.log(f"\nİterasyon {iteration + 1}/{self.iterations}")
+            self.log("-" * 30)
             
             iteration_solutions = []
             
             # Her karınca için çözüm oluştur
             for ant in range(self.num_ants):
+                if self.should_stop():
+                    stopped = True
+                    break
                 solution = self.construct_solution()
-                if solution and solution['path'] and len(solution['path']) >= 3:
+                if solution and solution['path'] and len(solution['path']) >= self.min_path_length:
                     iteration_solutions.append(solution)
                     
-                    print(f"\nKarınca {ant + 1}:")
-                    print(f"Yol: {' -> '.join(map(str, solution['path']))}")
-                    print(f"Mesafe: {solution['cost']/1000:.1f} km")
-                    print(f"Geçen Süre: {solution['time_elapsed']/3600:.1f} saat")
-                    print(f"Yakıt Tüketimi: {solution['total_fuel_consumption']:.1f} birim")
+                    self.log(f"\nKarınca {ant + 1}:")
+                    self.log(f"Yol: {' -> '.join(map(str, solution['path']))}")
+                    self.log(f"Mesafe: {solution['distance']/1000:.1f} km")
+                    self.log(f"Geçen Süre: {solution['time_elapsed']/3600:.1f} saat")
+                    self.log(f"Yakıt Tüketimi: {solution['total_fuel_consumption']:.1f} birim")
                     
                     # En iyi çözümü güncelle
                     if not best_solution or solution['cost'] < best_solution['cost']:
                         best_solution = solution.copy()
                         stagnation_counter = 0
-                        print("*** Yeni en iyi çözüm! ***")
+                        self.log("*** Yeni en iyi çözüm! ***")
                     else:
                         stagnation_counter += 1
             
+            if stopped:
+                self.log("\n!!! Optimizasyon durduruldu, en iyi çözüm döndürülüyor !!!")
+                # Kayıt iterasyon başındaki durumdur; yarım iterasyonun
+                # karıncaları arşive ancak kayıttan sonra eklenir
+                self.save_checkpoint(iteration, *iteration_start, force=True)
+                self.add_to_archive(iteration_solutions)
+                self.report_progress(iteration, best_solution, iteration_solutions, stagnation_counter)
+                break
+            self.add_to_archive(iteration_solutions)
+            
             # Feromon güncellemesi detayları
-            print("\nFeromon Güncellemesi:")
-            print("-" * 20)
+            self.log("\nFeromon Güncellemesi:")
+            self.log("-" * 20)
             
             if not iteration_solutions:
-                print("Bu iterasyonda geçerli çözüm bulunamadı.")
+                self.log("Bu iterasyonda geçerli çözüm bulunamadı.")
+                self.report_progress(iteration, best_solution, iteration_solutions, stagnation_counter)
+                self.save_checkpoint(iteration + 1, best_solution, stagnation_counter,
+                                     force=iteration + 1 == self.iterations)
                 continue
             
             # Feromon buharlaşması
-            old_pheromones = [row[:] for row in self.pheromones]
-            for i in range(self.num_nodes):
-                for j in range(self.num_nodes):
-                    self.pheromones[i][j] *= (1 - self.evaporation_rate)
+            self.pheromones *= (1 - self.evaporation_rate)
             
-            print(f"Buharlaşma oranı: {self.evaporation_rate}")
+            self.log(f"Buharlaşma oranı: {self.evaporation_rate}")
             
             # En iyi çözümleri seç (solutions yerine iteration_solutions kullan)
             iteration_solutions.sort(key=lambda x: x['cost'])
             top_solutions = iteration_solutions[:max(1, len(iteration_solutions)//4)]
-            print(f"En iyi {len(top_solutions)} çözüm için feromon güncelleniyor")
+            if self.multi_objective:
+                self.deposit_from_archive()
+                top_solutions = []
+            else:
+                self.log(f"En iyi {len(top_solutions)} çözüm için feromon güncelleniyor")
             
             # Her çözüm için feromon güncelle
             for idx, solution in enumerate(top_solutions):
                 if solution['cost'] == 0:
                     continue
                     
-                # Kalite hesaplamasını düzelt
-                normalized_cost = solution['cost'] / 1000  # km cinsinden
-                quality = 1.0 / (normalized_cost + 1)  # +1 ekleyerek sıfıra bölünmeyi önle
-                
-                # Yakıt faktörünü normalize et
-                total_fuel_saved = sum(100 - fuel for fuel in solution['fuel_states'])
-                max_possible_fuel_save = 100 * len(solution['fuel_states'])  # Maksimum tasarruf
-                fuel_factor = 1 + (total_fuel_saved / max_possible_fuel_save)  # 1-2 arası değer
-                
-                # Zaman faktörünü normalize et
-                time_hours = solution['time_elapsed'] / 3600
-                time_factor = 1 + (1 / (time_hours + 1))  # Daha kısa süre daha iyi
-                
-                # Feromon miktarını hesapla
-                pheromone_amount = min(
-                    self.Q * quality * fuel_factor * time_factor,
-                    10.0  # Üst sınır
-                )
+                deposit = self.pheromone_deposit(solution)
+                pheromone_amount = deposit['amount']
                 
-                print(f"\nÇözüm {idx + 1} Detayları:")
-                print(f"Maliyet: {normalized_cost:.2f} km")
-                print(f"Kalite: {quality:.6f}")
-                print(f"Yakıt Tasarrufu: {total_fuel_saved:.1f}/{max_possible_fuel_save}")
-                print(f"Yakıt Faktörü: {fuel_factor:.2f}")
-                print(f"Süre: {time_hours:.1f} saat")
-                print(f"Zaman Faktörü: {time_factor:.2f}")
-                print(f"Feromon Miktarı: {pheromone_amount:.2f}")
+                self.log(f"\nÇözüm {idx + 1} Detayları:")
+                self.log(f"Maliyet: {deposit['normalized_cost']:.2f} km")
+                self.log(f"Kalite: {deposit['quality']:.6f}")
+                self.log(f"Yakıt Tasarrufu: {deposit['fuel_saved']:.1f}/{deposit['max_fuel_save']}")
+                self.log(f"Yakıt Faktörü: {deposit['fuel_factor']:.2f}")
+                self.log(f"Süre: {deposit['time_hours']:.1f} saat")
+                self.log(f"Zaman Faktörü: {deposit['time_factor']:.2f}")
+                self.log(f"Feromon Miktarı: {pheromone_amount:.2f}")
                 
                 # Yol üzerindeki kenarları güncelle
                 path = solution['path']
                 for i in range(len(path) - 1):
                     from_node = path[i]
                     to_node = path[i + 1]
-                    old_value = self.pheromones[from_node][to_node]
+                    old_value = self.pheromones[from_node, to_node]
                     new_value = old_value + pheromone_amount
-                    self.pheromones[from_node][to_node] = new_value
-                    self.pheromones[to_node][from_node] = new_value  # Simetrik güncelleme
-                    print(f"Kenar {from_node}->{to_node}: {old_value:.2f} -> {new_value:.2f}")
+                    self.pheromones[from_node, to_node] = new_value
+                    self.pheromones[to_node, from_node] = new_value  # Simetrik güncelleme
+                    self.log(f"Kenar {from_node}->{to_node}: {old_value:.2f} -> {new_value:.2f}")
             
             # Feromon sınırlaması
-            for i in range(self.num_nodes):
-                for j in range(self.num_nodes):
-                    self.pheromones[i][j] = max(0.1, min(2.0, self.pheromones[i][j]))
+            np.clip(self.pheromones, self.pheromone_min, self.pheromone_max, out=self.pheromones)
             
             # Durağanlık kontrolü
             if stagnation_counter > 20:
-                print("\n!!! Çözüm iyileşmiyor, feromon matrisi yenileniyor !!!")
-                reset_count = 0
-                for i in range(self.num_nodes):
-                    for j in range(self.num_nodes):
-                        if random.random() < 0.5:
-                            self.pheromones[i][j] = 1.0
-                            reset_count += 1
-                print(f"Sıfırlanan feromon sayısı: {reset_count}")
+                self.log("\n!!! Çözüm iyileşmiyor, feromon matrisi yenileniyor !!!")
+                reset_mask = self.np_random.random(self.pheromones.shape) < 0.5
+                self.pheromones[reset_mask] = 1.0
+                reset_count = int(reset_mask.sum())
+                self.log(f"Sıfırlanan feromon sayısı: {reset_count}")
                 stagnation_counter = 0
+            self.invalidate_choice_info()
             
             all_solutions.extend(iteration_solutions)
             
-            print(f"\nİterasyon {iteration + 1} tamamlandı")
-            print(f"En iyi çözüm maliyeti: {best_solution['cost']/1000:.1f} km")
-            print(f"Durağanlık sayacı: {stagnation_counter}")
+            self.log(f"\nİterasyon {iteration + 1} tamamlandı")
+            self.log(f"En iyi çözüm mesafesi: {best_solution['distance']/1000:.1f} km")
+            self.log(f"Durağanlık sayacı: {stagnation_counter}")
+            self.report_progress(iteration, best_solution, iteration_solutions, stagnation_counter)
+            self.save_checkpoint(iteration + 1, best_solution, stagnation_counter,
+                                 force=iteration + 1 == self.iterations)
         
         # Final sonuçları
-        if best_solution and best_solution['path'] and len(best_solution['path']) >= 3:
-            print("\n=== Optimizasyon Tamamlandı ===")
-            print(f"En iyi çözüm maliyeti: {best_solution['cost']/1000:.1f} km")
-            print(f"En iyi yol: {' -> '.join(map(str, best_solution['path']))}")
-            print(f"Toplam süre: {best_solution['time_elapsed']/3600:.1f} saat")
-            print(f"Toplam yakıt: {best_solution['total_fuel_consumption']:.1f} birim")
+        if best_solution and best_solution['path'] and len(best_solution['path']) >= self.min_path_length:
+            self.log("\n=== Optimizasyon Tamamlandı ===")
+            self.log(f"En iyi çözüm maliyeti ({self.cost_model.name}): {best_solution['cost']:.1f}")
+            self.log(f"En iyi çözüm mesafesi: {best_solution['distance']/1000:.1f} km")
+            self.log(f"En iyi yol: {' -> '.join(map(str, best_solution['path']))}")
+            self.log(f"Toplam süre: {best_solution['time_elapsed']/3600:.1f} saat")
+            self.log(f"Toplam yakıt: {best_solution['total_fuel_consumption']:.1f} birim")
             return {
                 'solution': best_solution['path'],
                 'cost': best_solution['cost'],
+                'distance': best_solution['distance'],
+                'cost_model': self.cost_model.name,
                 'fuel_states': best_solution['fuel_states'],
-                'time_elapsed': best_solution['time_elapsed']
+                'time_elapsed': best_solution['time_elapsed'],
+                'arrival_times': best_solution.get('arrival_times'),
+                'arrival_fuel': best_solution.get('arrival_fuel'),
+                'pareto_front': self.pareto_archive.to_list(),
+                'telemetry': self.telemetry.to_dict(),
+                'stopped': stopped
             }
         else:
-            print("\n!!! Geçerli bir çözüm bulunamadı !!!")
+            self.log("\n!!! Geçerli bir çözüm bulunamadı !!!")
             return {
                 'solution': None,
                 'cost': float('inf'),
+                'distance': float('inf'),
+                'cost_model': self.cost_model.name,
                 'fuel_states': [],
-                'time_elapsed': 0
+                'time_elapsed': 0,
+                'pareto_front': [],
+                'telemetry': self.telemetry.to_dict(),
+                'stopped': stopped
             }
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+asyncio uyumlu çözücü arayüzü. CPU işi bir executor'da çalışır; ilerleme
+olayları olay döngüsüne call_soon_threadsafe ile aktarılır.
+
+    result = await solve({'num_satellites': 20, 'seed': 1}, {'iterations': 50})
+
+    run = start_solve(scenario, options)
+    async for event in run.events():
+        print(event['type'], event['best_cost'])
+    result = await run.result()
+"""
+import asyncio
+import concurrent.futures
+import os
+from main import Simulation
+
+_executor = None
+
+
+def default_executor():
+    """Çözümler için paylaşılan sınırlı thread havuzu"""
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4,
+            thread_name_prefix='aco-solver'
+        )
+    return _executor
+
+
+class SolverRun:
+    """
+    Çalışan tek bir çözüm. Olaylar sırayla 'progress', en iyi maliyet
+    düştüğünde ek olarak 'improved' ve en sonda 'finished' tipindedir.
+    """
+
+    def __init__(self, simulation, loop, executor=None):
+        self.simulation = simulation
+        self.loop = loop
+        self._queue = asyncio.Queue()
+        self._best_cost = None
+        simulation.set_progress_listener(self._on_progress)
+        self._future = loop.run_in_executor(executor or default_executor(), self._run)
+
+    def _run(self):
+        try:
+            result = self.simulation.calculate_path()
+        except BaseException:
+            self.loop.call_soon_threadsafe(self._queue.put_nowait, None)
+            raise
+        self.loop.call_soon_threadsafe(self._queue.put_nowait, dict(result, type='finished'))
+        return result
+
+    def _on_progress(self, progress):
+        # Çözücü thread'inde çağrılır
+        event = dict(progress, type='progress')
+        self.loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        best_cost = progress['best_cost']
+        if best_cost is not None and (self._best_cost is None or best_cost < self._best_cost):
+            self._best_cost = best_cost
+            self.loop.call_soon_threadsafe(self._queue.put_nowait, dict(progress, type='improved'))
+
+    async def events(self):
+        """Çözüm bitene kadar olayları verir; 'finished' son olaydır"""
+        while True:
+            event = await self._queue.get()
+            if event is None:  # Çözücü hata ile sonlandı, hata result() ile alınır
+                return
+            yield event
+            if event['type'] == 'finished':
+                return
+
+    def cancel(self):
+        """Çözücüyü bir sonraki karınca sınırında durdurur"""
+        self.simulation.request_stop()
+
+    @property
+    def done(self):
+        return self._future.done()
+
+    async def result(self):
+        """
+        Sonucu bekler. Bekleyen görev iptal edilirse çözücü durdurulur ve
+        o ana kadarki en iyi çözüm ('stopped': True) döndürülür.
+        """
+        try:
+            return await asyncio.shield(self._future)
+        except asyncio.CancelledError:
+            self.cancel()
+            task = asyncio.current_task()
+            if task is not None and hasattr(task, 'uncancel'):
+                task.uncancel()  # Python 3.11+: iptal tüketildi, sonuç döndürülecek
+            return await self._future
+
+
+def create_simulation(scenario=None, options=None):
+    simulation = Simulation(**(scenario or {}))
+    simulation.aco_options = dict(options or {})
+    simulation.aco_options.setdefault('verbose', False)
+    return simulation
+
+
+def start_solve(scenario=None, options=None, simulation=None, executor=None):
+    """
+    Çözümü arka planda başlatır
+    Args:
+        scenario: Simulation argümanları (num_satellites, rocket_fuel, seed, catalog_path)
+        options: ACO seçenekleri (time_limit dahil)
+        simulation: Hazır Simulation nesnesi (verilirse scenario/options yok sayılır)
+        executor: concurrent.futures executor; varsayılan paylaşılan thread havuzu
+    Returns:
+        SolverRun
+    """
+    if simulation is None:
+        simulation = create_simulation(scenario, options)
+    return SolverRun(simulation, asyncio.get_running_loop(), executor)
+
+
+async def solve(scenario=None, options=None, simulation=None, executor=None, on_event=None):
+    """
+    Çözer ve sonucu döndürür. on_event verilirse her olay için çağrılır
+    (fonksiyon veya coroutine fonksiyonu olabilir). Görev iptal edilirse
+    en iyi ara çözüm döndürülür.
+    """
+    run = start_solve(scenario, options, simulation, executor)
+    if on_event is None:
+        return await run.result()
+
+    async def forward():
+        async for event in run.events():
+            outcome = on_event(event)
+            if asyncio.iscoroutine(outcome):
+                await outcome
+
+    forwarder = asyncio.ensure_future(forward())
+    try:
+        return await run.result()
+    finally:
+        if not forwarder.done():
+            await asyncio.wait([forwarder], timeout=1.0)
+            forwarder.cancel()
@@ -0,0 +1,320 @@
+"""
+Kalite-süre kıyaslama takımı: her CPU saniyesinin rota kalitesine etkisi.
+
+    python benchmark.py                              # tümü, kayıtlı temel değerlerle karşılaştır
+    python benchmark.py --scenarios small_tight --configs default --budgets 2 5
+    python benchmark.py --save-baseline              # sonuçları temel değer olarak yaz
+
+Sabit seed'li referans senaryolar (küçük/orta/büyük filo, bol/kısıtlı
+roket yakıtı) her ACO yapılandırmasıyla sabit duvar saati bütçelerinde
+çalıştırılır. Her çalışmanın zamana karşı en iyi maliyet eğrisi (anytime
+eğrisi) kaydedilir; bütçenin belirli kesirlerindeki maliyetler kayıtlı
+temel değerlerle, küçük senaryolarda ise kaba kuvvetle bulunan
+optimumla karşılaştırılır. Bir hızlandırmanın çözüm kalitesini sessizce
+düşürüp düşürmediği böyle doğrulanır; gerileme varsa çıkış kodu 1'dir.
+
+Temel değerler makineye bağlıdır; aynı makinede üretilmiş dosyayla
+karşılaştırın. Çözücü yakıtı yetmeyen son Ay dönüşünü de uçtuğundan
+kısıtlı yakıtlı senaryolarda en iyi rota kesin yakıt kontrolünü
+geçmeyebilir; bu çalışmalar optimumla karşılaştırılmaz.
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import statistics
+import time
+import numpy as np
+from ant_colony import AntColonyOptimization
+from main import Simulation
+from route_evaluator import RouteEvaluator
+
+BENCHMARK_VERSION = 1
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baselines.json')
+LOOSE_FUEL = 200000  # Tüm tur tek depoyla uçulabilir
+TIGHT_FUEL = 90000  # Turun ortasında en az bir Ay dönüşü gerekir
+DEFAULT_BUDGETS = (5.0, 20.0)  # Saniye; kurulum (tensör, sezgiseller) dahil
+DEFAULT_REPEATS = 3
+DEFAULT_TOLERANCE = 0.02  # Temel değere göre izin verilen bağıl kötüleşme
+CURVE_FRACTIONS = (0.1, 0.25, 0.5, 1.0)  # Eğrinin karşılaştırıldığı bütçe kesirleri
+BRUTE_FORCE_LIMIT = 7  # Bu kadar uyduya kadar optimum kaba kuvvetle bulunur
+MAX_ITERATIONS = 10 ** 6  # Çalışmayı bütçe sonlandırır
+
+REFERENCE_SCENARIOS = {
+    'small_loose': {'num_satellites': 6, 'rocket_fuel': LOOSE_FUEL, 'seed': 11},
+    'small_tight': {'num_satellites': 6, 'rocket_fuel': TIGHT_FUEL, 'seed': 11},
+    'medium_loose': {'num_satellites': 60, 'rocket_fuel': LOOSE_FUEL, 'seed': 12},
+    'medium_tight': {'num_satellites': 60, 'rocket_fuel': TIGHT_FUEL, 'seed': 12},
+    'large_loose': {'num_satellites': 400, 'rocket_fuel': LOOSE_FUEL, 'seed': 13},
+    'large_tight': {'num_satellites': 400, 'rocket_fuel': TIGHT_FUEL, 'seed': 13}
+}
+
+# Simulation.solver_options() varsayılanlarını ezen ACO seçenekleri
+CONFIGURATIONS = {
+    'default': {},
+    'unseeded': {'seed_heuristics': False},
+    'direct_choice': {'choice_cache': False, 'reachability': False}
+}
+
+
+def brute_force_optimum(sim, cost_model='linear'):
+    """
+    Çözücünün rota uzayında en düşük maliyet: Ay'dan başlayan her uydu
+    sırası, ardışık uydular arasında isteğe bağlı Ay dönüşleriyle. Her bacak
+    roketteki yakıtla uçulabilmeli ve rota uyduda bitiyorsa oradan Ay'a
+    dönecek yakıt kalmalıdır (dönüş bacağı maliyete eklenmez). Bacaklar
+    çözücüyle aynı mesafe tensörüyle değerlendirilir.
+    Returns:
+        dict veya None: cost ve path
+    """
+    count = sim.num_satellites
+    evaluator = RouteEvaluator(sim.satellites, sim.moon, sim.rocket, cost_model)
+    routes = []
+    for order in itertools.permutations(range(1, count + 1)):
+        for mask in range(2 ** max(count - 1, 0)):
+            route = [0, order[0]]
+            for position in range(1, count):
+                if mask >> (position - 1) & 1:
+                    route.append(0)
+                route.append(order[position])
+            routes.append(route)
+
+    closed = evaluator.evaluate([route + [0] for route in routes])
+    open_ended = evaluator.evaluate(routes)
+    # Uyduda biten rota, Ay'a dönüş bacağı da uçulabiliyorsa geçerlidir
+    usable = closed['feasible'] & closed['complete']
+    costs = np.where(usable, np.minimum(closed['cost'], open_ended['cost']), np.inf)
+    if not usable.any():
+        return None
+    best = int(np.argmin(costs))
+    path = routes[best] if open_ended['cost'][best] <= closed['cost'][best] else routes[best] + [0]
+    return {'cost': float(costs[best]), 'path': path}
+
+
+def cost_at(curve, elapsed):
+    """Anytime eğrisinde elapsed saniyeye kadar bulunan en iyi maliyet (yoksa inf)"""
+    best = float('inf')
+    for point_time, point_cost in curve:
+        if point_time > elapsed:
+            break
+        best = point_cost
+    return best
+
+
+def run_case(scenario, config, budget, seed):
+    """
+    Tek çalışma
+    Args:
+        scenario: REFERENCE_SCENARIOS değeri
+        config: CONFIGURATIONS değeri
+        budget: Kurulum dahil duvar saati bütçesi (saniye)
+        seed: ACO seed'i
+    Returns:
+        dict: final_cost, curve [(saniye, en iyi maliyet)], iterations,
+        setup_time, feasible (en iyi rota RouteEvaluator'ın kesin yakıt
+        kontrolünden geçiyor mu)
+    """
+    sim = Simulation(**scenario)
+    sim.aco_options = dict(config, iterations=MAX_ITERATIONS, verbose=False, seed=seed)
+    curve = []
+
+    start = time.perf_counter()
+    aco = AntColonyOptimization(sim.satellites, sim.moon, sim.rocket, sim.solver_options())
+    setup_time = time.perf_counter() - start
+    aco.time_limit = max(budget - setup_time, 1e-3)
+
+    def record(progress):
+        if progress['best_cost'] is not None:
+            curve.append((time.perf_counter() - start, float(progress['best_cost'])))
+
+    aco.set_progress_callback(record)
+    result = aco.optimize()
+    feasible = False
+    if result['solution']:
+        feasible = aco.evaluate_routes([result['solution']])['feasible'][0]
+    return {
+        'final_cost': float(result['cost']),
+        'curve': curve,
+        'iterations': len(curve),
+        'setup_time': setup_time,
+        'feasible': bool(feasible)
+    }
+
+
+def summarize(runs, budget):
+    """Tekrarların medyanları: bütçe kesirlerindeki maliyet ve son maliyet"""
+    return {
+        'cost_at': {
+            str(fraction): statistics.median(cost_at(run['curve'], fraction * budget) for run in runs)
+            for fraction in CURVE_FRACTIONS
+        },
+        'final_cost': statistics.median(run['final_cost'] for run in runs),
+        'iterations': statistics.median(run['iterations'] for run in runs),
+        'setup_time': statistics.median(run['setup_time'] for run in runs),
+        'feasible': all(run['feasible'] for run in runs)
+    }
+
+
+def compare(summary, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Returns:
+        list: Temel değerden tolerans kadar kötüleşen (kesir, güncel, temel) üçlüleri
+    """
+    regressions = []
+    for fraction, cost in summary['cost_at'].items():
+        reference = baseline['cost_at'].get(fraction)
+        if reference is None:
+            continue
+        if cost > reference * (1 + tolerance):
+            regressions.append((fraction, cost, reference))
+    return regressions
+
+
+def run_benchmark(scenarios=None, configs=None, budgets=DEFAULT_BUDGETS, repeats=DEFAULT_REPEATS,
+                  log=print):
+    """
+    Returns:
+        dict: scenario -> {'optimum', 'configs': config -> bütçe -> {'summary', 'runs'}}
+    """
+    results = {}
+    for scenario_name in scenarios or list(REFERENCE_SCENARIOS):
+        scenario = REFERENCE_SCENARIOS[scenario_name]
+        optimum = None
+        if scenario['num_satellites'] <= BRUTE_FORCE_LIMIT:
+            optimum = brute_force_optimum(Simulation(**scenario))
+        results[scenario_name] = {'optimum': optimum, 'configs': {}}
+
+        for config_name in configs or list(CONFIGURATIONS):
+            per_budget = {}
+            for budget in budgets:
+                runs = [run_case(scenario, CONFIGURATIONS[config_name], budget, seed)
+                        for seed in range(repeats)]
+                per_budget[str(budget)] = {'summary': summarize(runs, budget), 'runs': runs}
+                log(f"{scenario_name:13s} {config_name:14s} {budget:6.1f}s "
+                    f"maliyet {per_budget[str(budget)]['summary']['final_cost']:.4g}")
+            results[scenario_name]['configs'][config_name] = per_budget
+    return results
+
+
+def baseline_from(results):
+    """Sonuçlardan eğriler olmadan temel değer dosyası içeriği"""
+    return {
+        'version': BENCHMARK_VERSION,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'machine': {
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'python': platform.python_version(),
+            'numpy': np.__version__
+        },
+        'results': {
+            scenario_name: {
+                'optimum': entry['optimum'],
+                'configs': {
+                    config_name: {budget: data['summary'] for budget, data in per_budget.items()}
+                    for config_name, per_budget in entry['configs'].items()
+                }
+            }
+            for scenario_name, entry in results.items()
+        }
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    """
+    Raises:
+        ValueError: Dosya bu sürümle uyumlu değilse
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BENCHMARK_VERSION:
+        raise ValueError(f"Desteklenmeyen temel değer dosyası: {path}")
+    return baseline
+
+
+def report(results, baseline=None, tolerance=DEFAULT_TOLERANCE):
+    """
+    Sonuç tablosunu yazdırır
+    Returns:
+        int: Gerileme sayısı
+    """
+    regressions = 0
+    fractions = ' '.join(f"{f'@{fraction:g}':>11s}" for fraction in CURVE_FRACTIONS)
+    print(f"\n{'senaryo':13s} {'yapılandırma':14s} {'bütçe':>6s} {fractions} {'optimuma':>9s} {'temele':>8s}")
+    for scenario_name, entry in results.items():
+        optimum = entry['optimum']
+        for config_name, per_budget in entry['configs'].items():
+            for budget, data in per_budget.items():
+                summary = data['summary']
+                costs = ' '.join(f"{summary['cost_at'][str(f)]:11.4g}" for f in CURVE_FRACTIONS)
+                gap = '-'
+                # Kesin kontrolü geçmeyen rotalar optimumun uzayında değildir
+                if optimum is not None and optimum['cost'] > 0 and summary['feasible']:
+                    gap = f"{100 * (summary['final_cost'] / optimum['cost'] - 1):+.1f}%"
+                versus = '-'
+                reference = None
+                if baseline is not None:
+                    reference = (baseline['results'].get(scenario_name, {}).get('configs', {})
+                                 .get(config_name, {}).get(budget))
+                if reference is not None:
+                    versus = f"{100 * (summary['final_cost'] / reference['final_cost'] - 1):+.1f}%"
+                note = '' if summary['feasible'] else '  (kesin yakıt kontrolünü geçmiyor)'
+                print(f"{scenario_name:13s} {config_name:14s} {float(budget):6.1f} {costs} "
+                      f"{gap:>9s} {versus:>8s}{note}")
+                if reference is not None:
+                    for fraction, cost, previous in compare(summary, reference, tolerance):
+                        regressions += 1
+                        print(f"    GERİLEME @{float(fraction):g}: {cost:.6g} > {previous:.6g}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ACO kalite-süre kıyaslaması")
+    parser.add_argument('--scenarios', nargs='+', choices=list(REFERENCE_SCENARIOS))
+    parser.add_argument('--configs', nargs='+', choices=list(CONFIGURATIONS))
+    parser.add_argument('--budgets', nargs='+', type=float, default=list(DEFAULT_BUDGETS),
+                        help="Duvar saati bütçeleri (saniye)")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="Seed başına tekrar")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Temel değer dosyası")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Sonuçları temel değer dosyasına yaz")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--output', help="Tüm eğrilerin yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.scenarios, args.configs, args.budgets, args.repeats)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        baseline = load_baseline(args.baseline)
+    regressions = report(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        saved = baseline_from(results)
+        if os.path.exists(args.baseline):
+            # Yalnızca çalıştırılan senaryo/yapılandırmalar güncellenir
+            previous = load_baseline(args.baseline)['results']
+            for scenario_name, entry in saved['results'].items():
+                merged = previous.setdefault(scenario_name, {'optimum': None, 'configs': {}})
+                merged['optimum'] = entry['optimum']
+                for config_name, per_budget in entry['configs'].items():
+                    merged['configs'].setdefault(config_name, {}).update(per_budget)
+            saved['results'] = previous
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, indent=2)
+        print(f"\nTemel değerler yazıldı: {args.baseline}")
+    elif baseline is None:
+        print("\nKarşılaştırılacak temel değer dosyası yok (--save-baseline ile oluşturun)")
+    elif regressions:
+        print(f"\n{regressions} gerileme bulundu")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
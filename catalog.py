@@ -0,0 +1,179 @@
+import hashlib
+import itertools
+import math
+import os
+import numpy as np
+from constellation import Constellation, GM_EARTH
+
+EARTH_RADIUS = 6371e3  # metre
+CATALOG_CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.catalog_cache')
+DEFAULT_CHUNK_SIZE = 65536  # Her seferde okunacak satır sayısı
+
+CSV_COLUMNS = ('id', 'orbit_radius', 'initial_angle', 'inclination', 'fuel')
+
+
+def file_hash(path, block_size=1 << 20):
+    """Dosya içeriğinin SHA-256 özetini blok blok okuyarak hesaplar"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def detect_format(path):
+    """Dosya uzantısından katalog formatını tahmin eder"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.tle', '.3le'):
+        return 'tle'
+    return 'csv'
+
+
+def _iter_chunks(f, chunk_size):
+    """Dosyayı chunk_size satırlık parçalar halinde okur"""
+    start_line = 1
+    while True:
+        lines = list(itertools.islice(f, chunk_size))
+        if not lines:
+            return
+        yield start_line, lines
+        start_line += len(lines)
+
+
+def _parse_csv(f, chunk_size):
+    """
+    Başlık satırlı CSV dosyasını parça parça okur
+    Sütunlar: id, orbit_radius (m), initial_angle (rad), inclination (rad), fuel (%)
+    """
+    header = f.readline()
+    names = [name.strip().lower() for name in header.split(',')]
+    missing = [col for col in CSV_COLUMNS if col not in names]
+    if missing:
+        raise ValueError(f"Katalog başlığında eksik sütunlar: {', '.join(missing)}")
+    usecols = [names.index(col) for col in CSV_COLUMNS]
+
+    chunks = []
+    for start_line, lines in _iter_chunks(f, chunk_size):
+        try:
+            data = np.loadtxt(lines, delimiter=',', usecols=usecols, ndmin=2, dtype=np.float64)
+        except ValueError as e:
+            raise ValueError(f"Satır {start_line + 1} civarında ayrıştırma hatası: {e}") from e
+        if len(data):
+            chunks.append(data)
+    return chunks
+
+
+def _parse_tle(f, chunk_size, default_fuel):
+    """
+    Basitleştirilmiş TLE benzeri formatı parça parça okur.
+    Yalnızca '2 ' ile başlayan satırlar kullanılır:
+        2 <id> <eğim°> <RAAN°> <eksantrisite> <perige arg.°> <ort. anomali°> <ort. hareket rev/gün> [yakıt]
+    İsim satırları ve '1 ' satırları atlanır.
+    """
+    chunks = []
+    for start_line, lines in _iter_chunks(f, chunk_size):
+        rows = []
+        for offset, line in enumerate(lines):
+            if not line.startswith('2 '):
+                continue
+            fields = line.split()
+            if len(fields) < 8:
+                raise ValueError(f"Satır {start_line + offset}: TLE satırında eksik alan")
+            try:
+                values = [float(v) for v in fields[1:9]]
+            except ValueError as e:
+                raise ValueError(f"Satır {start_line + offset}: {e}") from e
+            if len(values) == 7:
+                values.append(default_fuel)
+            rows.append(values)
+        if not rows:
+            continue
+
+        raw = np.array(rows, dtype=np.float64)
+        ids, incl, raan, _ecc, argp, mean_anomaly, mean_motion, fuel = raw.T
+        # Ortalama hareketten (rev/gün) yörünge yarıçapı: a = (GM / n^2)^(1/3)
+        n = mean_motion * 2 * math.pi / 86400
+        with np.errstate(divide='ignore'):
+            radius = np.cbrt(GM_EARTH / (n * n))
+        # Dairesel yörünge kabulüyle konum açısı
+        angle = np.radians(raan + argp + mean_anomaly) % (2 * math.pi)
+        chunks.append(np.column_stack((ids, radius, angle, np.radians(incl), fuel)))
+    return chunks
+
+
+def validate_catalog(data):
+    """
+    Ayrıştırılmış katalog verisini doğrular
+    Args:
+        data: (N, 5) boyutlu dizi [id, orbit_radius, angle, inclination, fuel]
+    """
+    if len(data) == 0:
+        raise ValueError("Katalogda uydu bulunamadı")
+    bad = ~np.isfinite(data).all(axis=1)
+    if bad.any():
+        raise ValueError(f"{int(bad.sum())} kayıtta geçersiz sayı var (ilk id: {data[bad][0, 0]:.0f})")
+    ids, radius, _angle, inclination, fuel = data.T
+    if (ids != np.round(ids)).any():
+        raise ValueError("Uydu id değerleri tamsayı olmalı")
+    if len(np.unique(ids)) != len(ids):
+        raise ValueError("Katalogda tekrarlanan uydu id değerleri var")
+    low = radius <= EARTH_RADIUS
+    if low.any():
+        raise ValueError(f"{int(low.sum())} uydunun yörünge yarıçapı Dünya yarıçapından küçük")
+    if (np.abs(inclination) > math.pi).any():
+        raise ValueError("Yörünge eğimi [-π, π] aralığında olmalı")
+    if ((fuel < 0) | (fuel > 100)).any():
+        raise ValueError("Uydu yakıt seviyeleri 0-100 aralığında olmalı")
+
+
+def _cache_path(cache_dir, digest, fmt, default_fuel=None):
+    # Varsayılan yakıt ayrıştırılan veriye yazıldığından anahtarın parçasıdır
+    fuel = '' if default_fuel is None else f"_fuel{float(default_fuel)!r}"
+    return os.path.join(cache_dir, f"{digest}_{fmt}{fuel}_v{CATALOG_CACHE_VERSION}.npy")
+
+
+def load_catalog(path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, cache_dir=DEFAULT_CACHE_DIR,
+                 default_fuel=100.0):
+    """
+    CSV veya TLE benzeri katalog dosyasından Constellation yükler.
+    Ayrıştırılmış sonuç dosya özetine göre önbelleğe alınır; aynı dosya
+    tekrar yüklendiğinde ayrıştırma atlanır.
+    Args:
+        path: Katalog dosyası
+        fmt: 'csv' veya 'tle' (None ise uzantıdan tahmin edilir)
+        chunk_size: Her seferde okunacak satır sayısı
+        cache_dir: Önbellek dizini (None ise önbellek kullanılmaz)
+        default_fuel: TLE kayıtlarında yakıt alanı yoksa kullanılacak değer
+    Returns:
+        Constellation: Yüklenen filo
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in ('csv', 'tle'):
+        raise ValueError(f"Bilinmeyen katalog formatı: {fmt}")
+
+    cached = None
+    if cache_dir:
+        # CSV kayıtlarının yakıtı dosyadadır; varsayılan yalnızca TLE'yi etkiler
+        cached = _cache_path(cache_dir, file_hash(path), fmt, default_fuel if fmt == 'tle' else None)
+        if os.path.exists(cached):
+            data = np.load(cached)
+            return Constellation(data[:, 0], data[:, 1], data[:, 2], data[:, 3], data[:, 4])
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if fmt == 'csv':
+            chunks = _parse_csv(f, chunk_size)
+        else:
+            chunks = _parse_tle(f, chunk_size, default_fuel)
+
+    data = np.concatenate(chunks) if chunks else np.empty((0, 5))
+    validate_catalog(data)
+
+    if cached:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cached}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, data)
+        os.replace(tmp_path, cached)
+
+    return Constellation(data[:, 0], data[:, 1], data[:, 2], data[:, 3], data[:, 4])
@@ -0,0 +1,154 @@
+"""
+Uzun optimizasyonlar için kontrol noktası (checkpoint) kaydı ve devam.
+
+    python checkpoint.py checkpoints/run.ckpt --output sonuc.json
+
+Kontrol noktası iterasyon sınırındaki tüm optimizasyon durumunu (feromon
+matrisi, en iyi çözüm, durağanlık sayacı, sıradaki iterasyon, RNG
+durumları, telemetri) ve senaryoyu içerir; devam eden çalışma kesintisiz
+çalışmayla bit düzeyinde aynı sonucu üretir.
+"""
+import argparse
+import json
+import os
+import pickle
+import threading
+import time
+from log_pipeline import LatestValue
+
+CHECKPOINT_VERSION = 2
+DEFAULT_EVERY = 10  # İterasyon
+DEFAULT_INTERVAL = 60.0  # Saniye
+
+
+def write_checkpoint(state, path):
+    """Durumu atomik olarak yazar: geçici dosya, fsync, yeniden adlandırma"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(dict(state, version=CHECKPOINT_VERSION), f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Kontrol noktasını okur
+    Raises:
+        ValueError: Dosya bu sürümle uyumlu değilse
+    """
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    if not isinstance(state, dict) or state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Desteklenmeyen kontrol noktası: {path}")
+    return state
+
+
+class CheckpointWriter:
+    """
+    Kontrol noktalarını arka plan thread'inde yazar; optimizasyon döngüsü
+    yalnızca durumun kopyasını bırakır. Yazıcı meşgulken gelen yeni
+    anlık görüntü bekleyenin yerini alır, böylece karıncalar hiç beklemez.
+    """
+
+    def __init__(self, path, every=DEFAULT_EVERY, interval=DEFAULT_INTERVAL):
+        self.path = path
+        self.every = every
+        self.interval = interval
+        self.error = None
+        self.written = 0
+        self._pending = LatestValue()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._last_iteration = None
+        self._last_time = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name='checkpoint-writer', daemon=True)
+        self._thread.start()
+
+    def due(self, iteration):
+        """iteration (tamamlanan iterasyon sayısı) için kayıt zamanı geldi mi"""
+        if self._last_iteration is None:
+            return iteration >= self.every
+        return (iteration - self._last_iteration >= self.every
+                or time.monotonic() - self._last_time >= self.interval)
+
+    def submit(self, state):
+        self._last_iteration = state['iteration']
+        self._last_time = time.monotonic()
+        self._pending.set(state)
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            closed = self._closed  # close() son anlık görüntüden sonra çağrılır
+            state = self._pending.take()
+            if state is not None:
+                try:
+                    write_checkpoint(state, self.path)
+                    self.written += 1
+                except OSError as e:
+                    self.error = e
+            if closed:
+                return
+
+    def close(self, timeout=None):
+        """Bekleyen anlık görüntüyü yazar ve thread'i sonlandırır"""
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+
+
+def build_optimizer(state, options=None):
+    """Kontrol noktasındaki senaryodan optimizasyonu kurar ve durumunu yükler"""
+    from ant_colony import AntColonyOptimization
+    from constellation import Constellation
+    from models import Moon, Rocket
+
+    scenario = state['scenario']
+    moon = Moon()
+    moon.current_angle = scenario['moon_angle']
+    rocket = Rocket(scenario['rocket']['max_fuel'])
+    for name, value in scenario['rocket'].items():
+        setattr(rocket, name, value)
+
+    aco_options = dict(state['options'])
+    aco_options.update(options or {})
+    aco = AntColonyOptimization(Constellation(**scenario['satellites']), moon, rocket, aco_options)
+    aco.restore_state(state)
+    return aco
+
+
+def resume_optimization(path, options=None):
+    """
+    Kontrol noktasından optimizasyona devam eder
+    Args:
+        path: Kontrol noktası dosyası
+        options: Kayıtlı ACO seçeneklerini ezecek değerler (ör. verbose)
+    Returns:
+        dict: AntColonyOptimization.optimize() sonucu
+    """
+    return build_optimizer(load_checkpoint(path), options).optimize()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kontrol noktasından optimizasyona devam eder")
+    parser.add_argument('checkpoint', help="Kontrol noktası dosyası")
+    parser.add_argument('--output', help="Sonucun yazılacağı JSON dosyası")
+    parser.add_argument('--quiet', action='store_true', help="İterasyon loglarını gizle")
+    args = parser.parse_args()
+
+    result = resume_optimization(args.checkpoint, {'verbose': not args.quiet})
+    summary = {key: result[key] for key in ('solution', 'cost', 'distance', 'time_elapsed', 'stopped')}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4, default=float)
+    else:
+        print(json.dumps(summary, default=float))
+
+
+if __name__ == '__main__':
+    main()
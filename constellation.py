@@ -0,0 +1,223 @@
+import math
+import numpy as np
+from geometry import Point3D
+
+GM_EARTH = 3.986e14  # Dünya'nın standart kütleçekim parametresi (m^3/s^2)
+GEO_RADIUS = 42164e3  # Jeosenkron yörünge yarıçapı
+GEO_VARIATION = 1000e3  # Varyasyon
+
+
+class SatelliteView:
+    """
+    Constellation içindeki tek bir uyduya Satellite benzeri erişim sağlar.
+    Veri kopyalanmaz, tüm okuma/yazma işlemleri dizilere yönlendirilir.
+    """
+    __slots__ = ('_constellation', '_index')
+
+    def __init__(self, constellation, index):
+        self._constellation = constellation
+        self._index = index
+
+    @property
+    def id(self):
+        return int(self._constellation.ids[self._index])
+
+    @property
+    def orbit_radius(self):
+        return float(self._constellation.orbit_radius[self._index])
+
+    @property
+    def current_angle(self):
+        return float(self._constellation.angle[self._index])
+
+    @current_angle.setter
+    def current_angle(self, value):
+        self._constellation.angle[self._index] = value
+
+    @property
+    def inclination(self):
+        return float(self._constellation.inclination[self._index])
+
+    @property
+    def fuel(self):
+        return float(self._constellation.fuel[self._index])
+
+    @fuel.setter
+    def fuel(self, value):
+        self._constellation.fuel[self._index] = value
+
+    @property
+    def orbit_speed(self):
+        return float(self._constellation.orbit_speed[self._index])
+
+    @property
+    def current_position(self):
+        x, y, z = self._constellation.positions(self._index)
+        return Point3D(float(x), float(y), float(z))
+
+    def update_position(self, time_step):
+        c = self._constellation
+        c.angle[self._index] += c.angular_velocity[self._index] * time_step
+
+    def __repr__(self):
+        return f"SatelliteView(id={self.id}, orbit_radius={self.orbit_radius:.0f})"
+
+
+class Constellation:
+    """
+    Uydu filosunu yapı-dizisi (structure-of-arrays) olarak tutar.
+    Her alan ardışık bir NumPy dizisidir; konum sorguları tek seferde
+    tüm filo için hesaplanır.
+    """
+
+    def __init__(self, ids, orbit_radius, angle, inclination, fuel):
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.orbit_radius = np.ascontiguousarray(orbit_radius, dtype=np.float64)
+        self.angle = np.array(angle, dtype=np.float64)
+        self.inclination = np.ascontiguousarray(inclination, dtype=np.float64)
+        self.fuel = np.array(fuel, dtype=np.float64)
+
+        count = len(self.ids)
+        for name in ('orbit_radius', 'angle', 'inclination', 'fuel'):
+            if getattr(self, name).shape != (count,):
+                raise ValueError(f"'{name}' dizisi {count} elemanlı olmalı")
+
+        self.orbit_speed = np.sqrt(GM_EARTH / self.orbit_radius)  # Kepler'in 3. yasası (m/s)
+        self.angular_velocity = self.orbit_speed / self.orbit_radius  # rad/s
+
+    @classmethod
+    def random_geo(cls, count, rng=None):
+        """
+        GEO civarında rastgele bir filo oluşturur
+        Args:
+            count: Uydu sayısı
+            rng: numpy.random.Generator ya da seed değeri
+        """
+        rng = np.random.default_rng(rng)
+        ids = np.arange(count)
+        angle = (2 * math.pi * ids) / max(count, 1)
+        orbit_radius = GEO_RADIUS + (rng.random(count) - 0.5) * GEO_VARIATION
+        inclination = (rng.random(count) - 0.5) * math.pi / 90
+        fuel = 60 + rng.random(count) * 20
+        return cls(ids, orbit_radius, angle, inclination, fuel)
+
+    @classmethod
+    def from_satellites(cls, satellites):
+        """Satellite nesnelerinden (veya view'lardan) bir Constellation oluşturur"""
+        satellites = list(satellites)
+        return cls(
+            [sat.id for sat in satellites],
+            [sat.orbit_radius for sat in satellites],
+            [sat.current_angle for sat in satellites],
+            [sat.inclination for sat in satellites],
+            [sat.fuel for sat in satellites]
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        count = len(self.ids)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("uydu indeksi aralık dışında")
+        return SatelliteView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.ids)):
+            yield SatelliteView(self, index)
+
+    def copy(self):
+        return Constellation(self.ids, self.orbit_radius, self.angle.copy(),
+                             self.inclination, self.fuel.copy())
+
+    def _positions_for(self, angle, indices):
+        radius = self.orbit_radius if indices is None else self.orbit_radius[indices]
+        inclination = self.inclination if indices is None else self.inclination[indices]
+        sin_angle = np.sin(angle)
+        return np.stack((
+            radius * np.cos(angle),
+            radius * sin_angle * np.cos(inclination),
+            radius * sin_angle * np.sin(inclination)
+        ), axis=-1)
+
+    def positions(self, indices=None):
+        """
+        Güncel konumları döndürür
+        Args:
+            indices: None (tüm filo), tek indeks ya da indeks dizisi
+        Returns:
+            np.ndarray: (N, 3) veya (3,) boyutlu konum dizisi
+        """
+        angle = self.angle if indices is None else self.angle[indices]
+        return self._positions_for(angle, indices)
+
+    def positions_at(self, elapsed_time, indices=None):
+        """
+        Mevcut durumdan elapsed_time saniye sonraki konumları, durumu
+        değiştirmeden hesaplar
+        """
+        elapsed_time = np.asarray(elapsed_time, dtype=np.float64)
+        if elapsed_time.ndim:
+            # Zaman dizisi verildiyse sonuç (T, N, 3) boyutlu olur
+            elapsed_time = elapsed_time[..., None]
+        if indices is None:
+            angle = self.angle + self.angular_velocity * elapsed_time
+        else:
+            angle = self.angle[indices] + self.angular_velocity[indices] * elapsed_time
+        return self._positions_for(angle, indices)
+
+    def fuel_at(self, elapsed_time, consumption_per_hour):
+        """Uyduların elapsed_time saniye sonraki yakıt seviyeleri"""
+        return np.maximum(self.fuel - (elapsed_time / 3600) * consumption_per_hour, 0)
+
+    def update_positions(self, time_step):
+        """Tüm uyduları time_step saniye ilerletir"""
+        self.angle += self.angular_velocity * time_step
+        np.remainder(self.angle, 2 * math.pi, out=self.angle)
+
+
+def node_positions(constellation, moon, elapsed_time):
+    """
+    Çözücünün düğüm numaralandırmasıyla konumlar: 0 Ay, 1..N uydular
+    Returns:
+        np.ndarray: (N + 1, 3) boyutlu konum dizisi; elapsed_time bir
+        dizi ise (T, N + 1, 3)
+    """
+    shape = np.shape(elapsed_time)
+    positions = np.empty(shape + (len(constellation) + 1, 3))
+    positions[..., 0, :] = moon.positions_at(elapsed_time)
+    positions[..., 1:, :] = constellation.positions_at(elapsed_time)
+    return positions
+
+
+def node_positions_of(constellation, moon, nodes, elapsed_time):
+    """
+    node_positions() ile aynı konumlar, yalnızca istenen düğümler için;
+    her düğümün kendi zamanı olabilir. Birkaç düğümlük sorgularda tüm
+    filonun konumunu hesaplamaz.
+    Args:
+        nodes: (M,) düğüm dizisi (0 Ay)
+        elapsed_time: Tek zaman ya da (M,) zaman dizisi
+    Returns:
+        np.ndarray: (M, 3) boyutlu konum dizisi
+    """
+    nodes = np.asarray(nodes, dtype=np.intp)
+    times = np.asarray(elapsed_time, dtype=np.float64)
+    at_moon = nodes == 0
+    if at_moon.all():
+        return moon.positions_at(np.broadcast_to(times, nodes.shape))
+    if not at_moon.any():
+        indices = nodes - 1
+        angle = constellation.angle[indices] + constellation.angular_velocity[indices] * times
+        return constellation._positions_for(angle, indices)
+
+    times = np.broadcast_to(times, nodes.shape)
+    positions = np.empty(nodes.shape + (3,))
+    positions[at_moon] = moon.positions_at(times[at_moon])
+    at_satellite = ~at_moon
+    indices = nodes[at_satellite] - 1
+    angle = constellation.angle[indices] + constellation.angular_velocity[indices] * times[at_satellite]
+    positions[at_satellite] = constellation._positions_for(angle, indices)
+    return positions
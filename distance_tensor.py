@@ -0,0 +1,233 @@
+import math
+import tempfile
+import numpy as np
+from constellation import node_positions, node_positions_of
+from geometry import distances_from, pairwise_distances
+
+DEFAULT_BIN_WIDTH = 3600  # Saniye; çözücünün zaman adımıyla aynı
+MEMMAP_THRESHOLD = 256 * 1024 ** 2  # Bundan büyük tensörler diskte tutulur (bayt)
+MAX_TENSOR_BYTES = 4 * 1024 ** 3  # Ufuk bu boyuta sığacak şekilde kısaltılır
+# 'auto' modunda bundan büyük tensör kurulmaz, her sorgu tam hesaplanır.
+# N=1000 için tam ufuk ~4 GB ve ~20 s kurulum demektir; kazancı karşılamaz.
+AUTO_TENSOR_BYTES = 256 * 1024 ** 2
+DISTANCE_INDEX_TYPES = ('auto', 'tensor', 'exact')
+
+
+def estimate_horizon(constellation, moon, rocket, visits=None):
+    """
+    Görev süresi için kaba tahmin: düğüm sayısı kadar ortalama uzunlukta
+    bacak. Ufuk dışındaki sorgular yine de tam hesapla yanıtlanır.
+    Args:
+        visits: Kayan ufuk penceresindeki ziyaret sayısı; verilirse her
+            ziyaret için bir Ay dönüşü de hesaba katılır
+    """
+    distances = pairwise_distances(node_positions(constellation, moon, 0))
+    count = len(distances)
+    mean_distance = distances.sum() / max(count * (count - 1), 1)
+    legs = count + 1 if visits is None else 2 * visits + 1
+    return legs * mean_distance / rocket.speed
+
+
+def tensor_bins(num_nodes, horizon, bin_width=DEFAULT_BIN_WIDTH, max_bytes=MAX_TENSOR_BYTES):
+    """
+    Ufku kapsayan kova sayısı; max_bytes'a sığacak şekilde kısaltılır
+    Raises:
+        ValueError: İki kova (en kısa tensör) bile max_bytes'a sığmıyorsa
+    """
+    bin_bytes = num_nodes * num_nodes * np.dtype(np.float32).itemsize
+    if 2 * bin_bytes > max_bytes:
+        raise ValueError(f"{num_nodes} düğümlük mesafe tensörü {max_bytes} bayta sığmıyor")
+    bins = int(math.ceil(max(horizon, 0) / bin_width)) + 1
+    return max(2, min(bins, max_bytes // bin_bytes))
+
+
+def choose_distance_index(kind, num_nodes, horizon, bin_width=DEFAULT_BIN_WIDTH,
+                          auto_bytes=AUTO_TENSOR_BYTES):
+    """
+    Args:
+        kind: 'tensor', 'exact' ya da 'auto' (tensör auto_bytes'a sığıyorsa tensör)
+    Returns:
+        str: 'tensor' veya 'exact'
+    """
+    if kind not in DISTANCE_INDEX_TYPES:
+        raise ValueError(f"Bilinmeyen mesafe indeksi: {kind}")
+    if kind != 'auto':
+        return kind
+    bin_bytes = num_nodes * num_nodes * np.dtype(np.float32).itemsize
+    bins = int(math.ceil(max(horizon, 0) / bin_width)) + 1
+    return 'tensor' if max(2, bins) * bin_bytes <= auto_bytes else 'exact'
+
+
+def exact_distances_from(constellation, moon, from_node, to_nodes, elapsed_time):
+    """
+    Aynı anda kalkan bacakların mesafeleri; yalnızca ilgili düğümlerin
+    konumu hesaplanır
+    Returns:
+        np.ndarray: (M,) mesafe dizisi
+    """
+    to_nodes = np.asarray(to_nodes, dtype=np.intp)
+    origin = node_positions_of(constellation, moon, [from_node], elapsed_time)[0]
+    return distances_from(origin, node_positions_of(constellation, moon, to_nodes, elapsed_time))
+
+
+def exact_pair_distances(constellation, moon, from_nodes, to_nodes, elapsed_times):
+    """
+    Her biri kendi kalkış anına sahip bacakların mesafeleri
+    Args:
+        from_nodes, to_nodes: (M,) düğüm dizileri
+        elapsed_times: (M,) kalkış anları (saniye)
+    Returns:
+        np.ndarray: (M,) mesafe dizisi
+    """
+    elapsed_times = np.asarray(elapsed_times, dtype=np.float64)
+    if not len(elapsed_times):
+        return np.zeros(0)
+    diff = (node_positions_of(constellation, moon, from_nodes, elapsed_times)
+            - node_positions_of(constellation, moon, to_nodes, elapsed_times))
+    return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+
+class DistanceTensor:
+    """
+    Zaman-genişletilmiş mesafe indeksi: tüm düğüm çiftleri arasındaki
+    mesafeler K kalkış zamanı kovasında (float32) önceden hesaplanır; ara
+    zamanlar iki komşu kova arasında doğrusal interpolasyonla okunur.
+    Büyük filolarda tensör geçici bir dosyaya bellek eşlemeli (memmap) yazılır.
+    """
+
+    def __init__(self, constellation, moon, horizon, bin_width=DEFAULT_BIN_WIDTH,
+                 max_bytes=MAX_TENSOR_BYTES, memmap_threshold=MEMMAP_THRESHOLD, directory=None):
+        self.constellation = constellation
+        self.moon = moon
+        self.num_nodes = len(constellation) + 1
+        self.bin_width = float(bin_width)
+
+        bin_bytes = self.num_nodes * self.num_nodes * np.dtype(np.float32).itemsize
+        self.bins = tensor_bins(self.num_nodes, horizon, self.bin_width, max_bytes)
+        self.horizon = (self.bins - 1) * self.bin_width
+
+        shape = (self.bins, self.num_nodes, self.num_nodes)
+        self._file = None
+        if self.bins * bin_bytes > memmap_threshold:
+            # Dosya kapatılınca işletim sistemi siler
+            self._file = tempfile.TemporaryFile(prefix='distance_tensor_', dir=directory)
+            self.data = np.memmap(self._file, dtype=np.float32, mode='w+', shape=shape)
+        else:
+            self.data = np.empty(shape, dtype=np.float32)
+
+        for index in range(self.bins):
+            positions = node_positions(constellation, moon, index * self.bin_width)
+            self.data[index] = pairwise_distances(positions)
+
+    @classmethod
+    def from_data(cls, constellation, moon, data, bin_width=DEFAULT_BIN_WIDTH):
+        """
+        Önceden hesaplanmış (K, N + 1, N + 1) mesafe dizisini saran tensör
+        (ör. senaryo önbelleğinden bellek eşlemeli okunan dizi)
+        """
+        tensor = cls.__new__(cls)
+        tensor.constellation = constellation
+        tensor.moon = moon
+        tensor.num_nodes = data.shape[1]
+        tensor.bin_width = float(bin_width)
+        tensor.bins = data.shape[0]
+        tensor.horizon = (tensor.bins - 1) * tensor.bin_width
+        tensor._file = None
+        tensor.data = data
+        return tensor
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    @property
+    def is_memmap(self):
+        return isinstance(self.data, np.memmap)
+
+    def min_over_time(self):
+        """Her düğüm çifti için ufuk boyunca en kısa mesafe (interpolasyonun alt sınırı)"""
+        result = np.array(self.data[0], dtype=np.float64)
+        for index in range(1, self.bins):
+            np.minimum(result, self.data[index], out=result)
+        return result
+
+    def close(self):
+        if self._file is not None:
+            self.data = None
+            self._file.close()
+            self._file = None
+
+    def exact(self, from_node, to_nodes, elapsed_time):
+        """Ufuk dışı sorgular için konumlardan doğrudan hesap"""
+        return exact_distances_from(self.constellation, self.moon, from_node, to_nodes, elapsed_time)
+
+    def lookup(self, from_node, to_nodes, elapsed_time):
+        """
+        Kalkış anı elapsed_time olan bacak(lar)ın mesafesi
+        Args:
+            from_node: Kalkış düğümü
+            to_nodes: Varış düğümü ya da düğüm dizisi
+            elapsed_time: Görev başından beri geçen süre (saniye)
+        Returns:
+            float veya np.ndarray (float64)
+        """
+        position = elapsed_time / self.bin_width
+        if not 0 <= position <= self.bins - 1:
+            distance = self.exact(from_node, np.atleast_1d(to_nodes), elapsed_time)
+            return distance if np.ndim(to_nodes) else float(distance[0])
+        index = min(int(position), self.bins - 2)
+        weight = position - index
+        before = self.data[index, from_node, to_nodes].astype(np.float64)
+        after = self.data[index + 1, from_node, to_nodes].astype(np.float64)
+        distance = before + weight * (after - before)
+        return distance if np.ndim(to_nodes) else float(distance)
+
+    def lookup_pairs(self, from_nodes, to_nodes, elapsed_times):
+        """
+        lookup() ile aynı değerler; her bacağın kendi kalkış anı vardır
+        Args:
+            from_nodes, to_nodes, elapsed_times: (M,) diziler
+        Returns:
+            np.ndarray: (M,) mesafe dizisi (float64)
+        """
+        from_nodes = np.asarray(from_nodes, dtype=np.intp)
+        to_nodes = np.asarray(to_nodes, dtype=np.intp)
+        elapsed_times = np.asarray(elapsed_times, dtype=np.float64)
+        position = elapsed_times / self.bin_width
+        inside = (position >= 0) & (position <= self.bins - 1)
+
+        distance = np.empty(len(position))
+        index = np.minimum(position[inside].astype(np.intp), self.bins - 2)
+        weight = position[inside] - index
+        before = self.data[index, from_nodes[inside], to_nodes[inside]].astype(np.float64)
+        after = self.data[index + 1, from_nodes[inside], to_nodes[inside]].astype(np.float64)
+        distance[inside] = before + weight * (after - before)
+
+        outside = ~inside
+        if outside.any():
+            distance[outside] = exact_pair_distances(
+                self.constellation, self.moon, from_nodes[outside], to_nodes[outside],
+                elapsed_times[outside])
+        return distance
+
+
+class ExactDistances:
+    """DistanceTensor ile aynı arayüz; her sorguyu konumlardan hesaplar"""
+
+    def __init__(self, constellation, moon):
+        self.constellation = constellation
+        self.moon = moon
+        self.bins = 0
+        self.horizon = 0.0
+
+    def close(self):
+        pass
+
+    def lookup(self, from_node, to_nodes, elapsed_time):
+        distance = exact_distances_from(self.constellation, self.moon, from_node,
+                                        np.atleast_1d(to_nodes), elapsed_time)
+        return distance if np.ndim(to_nodes) else float(distance[0])
+
+    def lookup_pairs(self, from_nodes, to_nodes, elapsed_times):
+        return exact_pair_distances(self.constellation, self.moon, np.asarray(from_nodes),
+                                    np.asarray(to_nodes), elapsed_times)
@@ -0,0 +1,65 @@
+import math
+from typing import NamedTuple
+import numpy as np
+
+
+class Point3D(NamedTuple):
+    """
+    Değiştirilemez 3 boyutlu nokta. Tuple tabanlı olduğu için nesne başına
+    __dict__ tutmaz, hashlenebilir ve doğrudan np.asarray ile diziye çevrilir.
+    """
+    x: float
+    y: float
+    z: float
+
+    def distance_to(self, other):
+        return math.dist(self, other)
+
+    def as_array(self):
+        return np.array(self, dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values):
+        return cls(float(values[0]), float(values[1]), float(values[2]))
+
+
+def as_points_array(points):
+    """Point3D listesini (veya benzerini) (N, 3) boyutlu float64 diziye çevirir"""
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+
+def distances_from(point, points):
+    """
+    Tek bir noktadan çok sayıda noktaya olan mesafeler
+    Args:
+        point: (3,) boyutlu dizi ya da Point3D
+        points: (N, 3) boyutlu dizi
+    Returns:
+        np.ndarray: (N,) boyutlu mesafe dizisi
+    """
+    diff = np.asarray(points, dtype=np.float64) - np.asarray(point, dtype=np.float64)
+    return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+
+def pairwise_distances(a, b=None):
+    """
+    İki nokta kümesi arasındaki tüm mesafeler
+    Args:
+        a: (N, 3) boyutlu dizi
+        b: (M, 3) boyutlu dizi (None ise a kullanılır)
+    Returns:
+        np.ndarray: (N, M) boyutlu mesafe matrisi
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = a if b is None else np.asarray(b, dtype=np.float64)
+    # (N, M, 3) ara dizi oluşturmamak için eksen eksen topla
+    result = np.zeros((len(a), len(b)))
+    for axis in range(3):
+        diff = a[:, axis, None] - b[None, :, axis]
+        result += diff * diff
+    return np.sqrt(result, out=result)
+
+
+def midpoints(a, b):
+    """İki nokta (veya nokta dizisi) arasındaki orta noktalar"""
+    return (np.asarray(a, dtype=np.float64) + np.asarray(b, dtype=np.float64)) * 0.5
@@ -0,0 +1,226 @@
+"""
+Koloniyi beslemek için hızlı kurucu sezgiseller. Üretilen rotalar
+RouteEvaluator ile, yani çözücünün mesafe indeksi ve maliyet modeliyle
+puanlanır; sonuçlar çözücünün çözüm sözlüğü biçimindedir.
+"""
+import heapq
+import numpy as np
+from constellation import node_positions
+from geometry import pairwise_distances
+
+DEFAULT_CANDIDATES = 32  # En acil kaç uydu arasından en yakını seçilir
+URGENCY_WEIGHT = 1.0  # Yakıt seviyesinin bacak maliyetine etkisi
+
+
+class RouteBuilder:
+    """
+    Rotayı bacak bacak kurar. Bir bacak ancak varıştan sonra Ay'a dönecek
+    yakıt da kalıyorsa doğrudan uçulur; aksi halde önce Ay'a dönülür.
+    Böylece kurulan rotalar her zaman uygulanabilirdir.
+    """
+
+    def __init__(self, evaluator):
+        self.evaluator = evaluator
+        self.rocket = evaluator.rocket
+        self.route = [0]
+        self.current_node = 0
+        self.elapsed_time = 0.0
+        self.fuel = float(self.rocket.max_fuel)
+
+    def legs(self, targets):
+        """
+        Bulunulan düğümden hedeflere bacaklar
+        Returns:
+            tuple: (mesafe, yakıt, bacak maliyeti, doğrudan uçulabilir mi)
+        """
+        evaluator = self.evaluator
+        cost_model = evaluator.cost_model
+        distance = evaluator.distance_index.lookup(self.current_node, targets, self.elapsed_time)
+        fuel = cost_model.fuel(self.current_node, targets, distance, self.elapsed_time, self.fuel)
+        arrival = self.elapsed_time + distance / self.rocket.speed
+        moon = np.zeros(len(targets), dtype=np.intp)
+        return_distance = evaluator.distance_index.lookup_pairs(targets, moon, arrival)
+        return_fuel = cost_model.fuel(targets, moon, return_distance, arrival, self.fuel - fuel)
+        feasible = fuel + return_fuel <= self.fuel
+        return distance, fuel, cost_model.leg_cost(distance, fuel), feasible
+
+    def move(self, target, distance, fuel):
+        self.route.append(int(target))
+        self.elapsed_time += float(distance) / self.rocket.speed
+        self.fuel -= float(fuel)
+        self.current_node = int(target)
+
+    def refuel(self):
+        """Ay'a dönüp depoyu doldurur"""
+        distance = self.evaluator.distance_index.lookup(self.current_node, 0, self.elapsed_time)
+        self.route.append(0)
+        self.elapsed_time += distance / self.rocket.speed
+        self.fuel = float(self.rocket.max_fuel)
+        self.current_node = 0
+
+    def visit(self, target):
+        """
+        Hedefe gerekiyorsa Ay üzerinden gider
+        Returns:
+            bool: Hedefe dolu depoyla bile ulaşılamıyorsa False
+        """
+        targets = np.array([target])
+        distance, fuel, _, feasible = self.legs(targets)
+        if not feasible[0] and self.current_node != 0:
+            self.refuel()
+            distance, fuel, _, feasible = self.legs(targets)
+        if not feasible[0]:
+            return False
+        self.move(target, distance[0], fuel[0])
+        return True
+
+
+def nearest_neighbour_route(evaluator, candidates=DEFAULT_CANDIDATES, urgency_weight=URGENCY_WEIGHT):
+    """
+    Yakıt aciliyetiyle ağırlıklandırılmış en yakın komşu. Uydular yakıt
+    seviyesine göre bir yığında (heap) tutulur; her adımda en acil
+    `candidates` uydu arasından bacak maliyeti * (1 + w * yakıt / 100) en
+    küçük olana gidilir. Uyduların yakıtı aynı hızla azaldığından yığın
+    sırası görev boyunca geçerli kalır.
+    Returns:
+        list: Ay'da (0) başlayan düğüm listesi
+    """
+    satellites = evaluator.satellites
+    heap = [(float(fuel), index) for index, fuel in enumerate(satellites.fuel)]
+    heapq.heapify(heap)
+    builder = RouteBuilder(evaluator)
+
+    while heap:
+        popped = [heapq.heappop(heap) for _ in range(min(candidates, len(heap)))]
+        indices = np.array([index for _, index in popped])
+        distance, fuel, leg_cost, feasible = builder.legs(indices + 1)
+
+        if not feasible.any():
+            if builder.current_node != 0:
+                builder.refuel()
+                for entry in popped:
+                    heapq.heappush(heap, entry)
+            # Ay'dan dolu depoyla da gidilemeyen uydular rotaya girmez
+            continue
+
+        level = satellites.fuel_at(builder.elapsed_time, evaluator.fuel_consumption_per_hour)[indices]
+        score = np.where(feasible, leg_cost * (1 + urgency_weight * level / 100), np.inf)
+        chosen = int(np.argmin(score))
+        builder.move(indices[chosen] + 1, distance[chosen], fuel[chosen])
+        for position, entry in enumerate(popped):
+            if position != chosen:
+                heapq.heappush(heap, entry)
+    return builder.route
+
+
+def cheapest_insertion_order(costs):
+    """
+    Ay'dan başlayıp Ay'a dönen turu en ucuz ekleme ile kurar. Her
+    eklenmemiş düğüm için en ucuz ekleme kenarı tutulur; bir ekleme
+    sonrası yalnızca iki yeni kenar tüm düğümlere karşı denenir ve en iyi
+    kenarı bozulan düğümler yeniden hesaplanır.
+    Args:
+        costs: (N + 1, N + 1) zamandan bağımsız bacak maliyetleri
+    Returns:
+        list: Ay hariç ziyaret sırası (uydu düğümleri)
+    """
+    # Yalnızca sıra üretildiğinden float32 yeterli; bellek trafiği yarıya iner
+    costs = np.asarray(costs, dtype=np.float32)
+    costs_by_target = np.ascontiguousarray(costs.T)
+    count = len(costs)
+    following = np.zeros(count, dtype=np.intp)  # Tur bağlı listesi: kenar i -> following[i]
+    in_tour = np.zeros(count, dtype=bool)
+    in_tour[0] = True
+    best_from = np.zeros(count, dtype=np.intp)
+    best_cost = costs[0, :] + costs[:, 0] - costs[0, 0]
+    best_cost[0] = np.inf
+
+    for _ in range(count - 1):
+        node = int(np.argmin(best_cost))
+        start = int(best_from[node])
+        end = int(following[start])
+        following[start] = node
+        following[node] = end
+        in_tour[node] = True
+        best_cost[node] = np.inf
+
+        remaining = np.flatnonzero(~in_tour)
+        if not len(remaining):
+            break
+        broken = remaining[best_from[remaining] == start]
+        intact = remaining[best_from[remaining] != start]
+
+        # Yeni kenarlar: start -> node ve node -> end
+        for edge_start, edge_end in ((start, node), (node, end)):
+            cost = costs[edge_start, intact] + costs[intact, edge_end] - costs[edge_start, edge_end]
+            better = cost < best_cost[intact]
+            best_cost[intact[better]] = cost[better]
+            best_from[intact[better]] = edge_start
+
+        if len(broken):
+            # Satır satır okuma: (bozulan düğüm, tur kenarı) matrisi
+            starts = np.flatnonzero(in_tour)
+            ends = following[starts]
+            cost = costs_by_target[broken][:, starts]
+            cost += costs[broken][:, ends]
+            cost -= costs[starts, ends]
+            best = np.argmin(cost, axis=1)
+            best_cost[broken] = cost[np.arange(len(broken)), best]
+            best_from[broken] = starts[best]
+
+    order = []
+    node = int(following[0])
+    while node != 0:
+        order.append(node)
+        node = int(following[node])
+    return order
+
+
+def cheapest_insertion_route(evaluator):
+    """
+    En ucuz ekleme turu; gerektiğinde Ay'da yakıt ikmali duraklarıyla
+    Returns:
+        list: Ay'da (0) başlayan düğüm listesi
+    """
+    positions = node_positions(evaluator.satellites, evaluator.moon, 0)
+    costs = evaluator.cost_model.static_leg_costs(pairwise_distances(positions))
+    builder = RouteBuilder(evaluator)
+    for node in cheapest_insertion_order(costs):
+        builder.visit(node)
+    return builder.route
+
+
+HEURISTICS = {
+    'nearest_neighbour': nearest_neighbour_route,
+    'cheapest_insertion': cheapest_insertion_route
+}
+
+
+def initial_solutions(evaluator, names=None):
+    """
+    Sezgisel rotaları kurar ve tek seferde puanlar
+    Args:
+        evaluator: RouteEvaluator
+        names: Kullanılacak sezgiseller (None ise hepsi)
+    Returns:
+        list: Tüm uyduları ziyaret eden uygulanabilir çözümler, maliyete göre sıralı
+    """
+    names = list(HEURISTICS) if names is None else list(names)
+    routes = [HEURISTICS[name](evaluator) for name in names]
+    evaluation = evaluator.evaluate(routes)
+
+    solutions = []
+    for row, (name, route) in enumerate(zip(names, routes)):
+        if not (evaluation['feasible'][row] and evaluation['complete'][row]) or len(route) < 3:
+            continue
+        solutions.append({
+            'path': route,
+            'cost': float(evaluation['cost'][row]),
+            'distance': float(evaluation['distance'][row]),
+            'fuel_states': evaluation['fuel_states'][row].tolist(),
+            'time_elapsed': float(evaluation['time_elapsed'][row]),
+            'total_fuel_consumption': float(evaluation['fuel_consumed'][row]),
+            'heuristic': name
+        })
+    solutions.sort(key=lambda solution: solution['cost'])
+    return solutions
@@ -4,45 +4,63 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QProgressBar, QFileDialog)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 import sys
-from main import Simulation
 import json
 from datetime import datetime
 import time
 from PyQt5.QtCore import QTimer
+from log_pipeline import LogBuffer, LatestValue
+
+LOG_DRAIN_INTERVAL = 100  # ms, log tamponunun GUI'ye aktarılma aralığı
+LOG_MAX_LINES = 5000  # Log penceresinde tutulacak en fazla satır
 
 class SimulationThread(QThread):
-    progress = pyqtSignal(int)
     finished = pyqtSignal(dict)
-    log = pyqtSignal(str)
 
     def __init__(self, params):
         super().__init__()
         self.params = params
         self.is_running = True
+        self.simulation = None
+        # İşçi thread yalnızca bu tamponlara yazar, GUI zamanlayıcıyla okur
+        self.log_buffer = LogBuffer()
+        self.progress_state = LatestValue()  # Yüzde
+        self.iteration_state = LatestValue()  # İterasyon ayrıntısı
+
+    def log(self, message):
+        self.log_buffer.append(message)
 
     def run(self):
+        from main import Simulation  # Çözücü ilk simülasyonda yüklenir
         try:
-            sim = Simulation(
-                num_satellites=self.params['simulation']['num_satellites'],
-                rocket_fuel=self.params['simulation']['rocket_fuel']
-            )
-            sim.rocket.speed = self.params['simulation']['rocket_speed']
-            sim.aco_options = self.params['aco']
+            if self.params.get('resume'):
+                # Senaryo ve ACO seçenekleri kontrol noktasından gelir
+                sim = Simulation.from_checkpoint(self.params['resume'])
+                self.log(f"Kontrol noktasından devam ediliyor: {self.params['resume']}")
+            else:
+                sim = Simulation(
+                    num_satellites=self.params['simulation']['num_satellites'],
+                    rocket_fuel=self.params['simulation']['rocket_fuel'],
+                    catalog_path=self.params['simulation'].get('catalog')
+                )
+                sim.rocket.speed = self.params['simulation']['rocket_speed']
+                sim.aco_options = self.params['aco']
             
             def progress_callback(percent, message):
                 if not self.is_running:  # Durdurma kontrolü
                     raise InterruptedError("Simülasyon durduruldu")
-                self.progress.emit(percent)
-                self.log.emit(message)
+                self.progress_state.set(percent)
+                self.log(message)
             
             sim.set_callback(progress_callback)
+            sim.set_progress_listener(self.iteration_state.set)
+            self.simulation = sim
             result = sim.calculate_path()
             
             if self.is_running:  # Sadece hala çalışıyorsa sonucu gönder
                 self.finished.emit(result)
             
         except InterruptedError as e:
-            self.log.emit(f"\n{str(e)}")
+            self.log(f"\n{str(e)}")
             self.finished.emit({  # Durdurma durumunda boş sonuç gönder
                 'solution': None,
                 'cost': float('inf'),
@@ -50,11 +68,75 @@ class SimulationThread(QThread):
                 'time_elapsed': 0
             })
         except Exception as e:
-            self.log.emit(f"Hata: {str(e)}")
+            self.log(f"Hata: {str(e)}")
 
     def stop(self):
         """Thread'i güvenli bir şekilde durdur"""
         self.is_running = False
+        if self.simulation is not None:
+            # Optimizasyon karınca sınırında durur ve kontrol noktası yazar
+            self.simulation.request_stop()
+
+class ConvergencePlot(QWidget):
+    """En iyi / ortalama maliyet geçmişini canlı çizen küçük grafik"""
+
+    def __init__(self):
+        super().__init__()
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from telemetry import DecimatedHistory, TELEMETRY_METRICS
+
+        self.history = DecimatedHistory(TELEMETRY_METRICS)
+        figure = Figure(figsize=(5, 2.5), tight_layout=True)
+        self.canvas = FigureCanvas(figure)
+        self.ax = figure.add_subplot(111)
+        self.ax.set_xlabel('İterasyon')
+        self.ax.set_ylabel('Maliyet (km)')
+        self.best_line, = self.ax.plot([], [], color='green', label='En iyi')
+        self.mean_line, = self.ax.plot([], [], color='orange', alpha=0.7, label='Ortalama')
+        self.worst_line, = self.ax.plot([], [], color='red', alpha=0.4, label='En kötü')
+        self.ax.legend(loc='upper right', fontsize='small')
+        self.status = QLabel("")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+        layout.addWidget(self.status)
+
+    def reset(self):
+        from telemetry import DecimatedHistory, TELEMETRY_METRICS
+        self.history = DecimatedHistory(TELEMETRY_METRICS)
+        self.redraw()
+
+    def add_point(self, point):
+        """İşçiden gelen son telemetri noktasını ekler"""
+        from telemetry import TELEMETRY_METRICS
+        self.history.append(point['iteration'], [point[name] for name in TELEMETRY_METRICS])
+        self.status.setText(
+            f"Entropi: {point['entropy']:.3f}   Durağanlık: {int(point['stagnation'])}"
+        )
+        self.redraw()
+
+    def set_history(self, telemetry):
+        """Sonuçtaki tam (seyreltilmiş) geçmişle grafiği değiştirir"""
+        iterations = telemetry['iteration']
+        self.redraw(iterations, telemetry['best_so_far']['min'],
+                    telemetry['mean']['last'], telemetry['worst']['max'])
+
+    def redraw(self, iterations=None, best=None, mean=None, worst=None):
+        if iterations is None:
+            history = self.history
+            iterations = history.iterations[:history.size]
+            best = history.series('best_so_far', 'min')
+            mean = history.series('mean', 'last')
+            worst = history.series('worst', 'max')
+        to_km = lambda values: [v / 1000 if v is not None else float('nan') for v in values]
+        self.best_line.set_data(iterations, to_km(best))
+        self.mean_line.set_data(iterations, to_km(mean))
+        self.worst_line.set_data(iterations, to_km(worst))
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
 
 class EditableSpinBox(QSpinBox):
     def __init__(self):
@@ -76,6 +158,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Uydu Yakıt İkmal Simülasyonu")
         self.setMinimumWidth(1000)
         self.simulation_result = None
+        self.simulation = None  # Sonucun ait olduğu senaryo
+        self.viewer_server = None  # Görüntüleyici sunucusu (ilk kullanımda başlar)
+        self.catalog_path = None
         
         # Ana widget ve layout
         main_widget = QWidget()
@@ -114,6 +199,12 @@ class MainWindow(QMainWindow):
         self.rocket_speed.setStyleSheet("QDoubleSpinBox { padding: 5px; }")
         sim_form.addRow("Roket Hızı (m/s):", self.rocket_speed)
 
+        self.viewer_port = EditableSpinBox()
+        self.viewer_port.setRange(0, 65535)  # 0: boş bir port seç
+        self.viewer_port.setValue(8000)
+        self.viewer_port.setStyleSheet("QSpinBox { padding: 5px; }")
+        sim_form.addRow("Görüntüleyici Portu:", self.viewer_port)
+
         sim_group.setLayout(sim_form)
         left_layout.addWidget(sim_group)
 
@@ -235,6 +326,14 @@ class MainWindow(QMainWindow):
         self.load_path_button = QPushButton("Yol Yükle")
         self.load_path_button.clicked.connect(self.load_path)
         control_layout.addWidget(self.load_path_button)
+
+        self.load_catalog_button = QPushButton("Katalog Yükle")
+        self.load_catalog_button.clicked.connect(self.load_catalog)
+        control_layout.addWidget(self.load_catalog_button)
+
+        self.resume_button = QPushButton("Checkpoint'ten Devam Et")
+        self.resume_button.clicked.connect(self.resume_simulation)
+        control_layout.addWidget(self.resume_button)
         
         self.show_3d_button = QPushButton("3D Görünüm")
         self.show_3d_button.clicked.connect(self.show_3d)
@@ -248,10 +347,19 @@ class MainWindow(QMainWindow):
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
         
+        self.convergence_plot = ConvergencePlot()
+        right_layout.addWidget(self.convergence_plot)
+        
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         right_layout.addWidget(self.log_text)
         
+        # İşçi thread'in log ve ilerleme tamponlarını toplu olarak boşaltan timer
+        self.log_timer = QTimer()
+        self.log_timer.timeout.connect(self.drain_simulation_output)
+        self.log_timer.setInterval(LOG_DRAIN_INTERVAL)
+        
         layout.addWidget(left_panel)
         layout.addWidget(right_panel)
 
@@ -262,7 +370,8 @@ class MainWindow(QMainWindow):
                 'num_satellites': self.num_satellites.value(),
                 'rocket_fuel': self.rocket_fuel.value(),
                 'time_step': self.time_step.value(),
-                'rocket_speed': self.rocket_speed.value()  # Yeni parametre
+                'rocket_speed': self.rocket_speed.value(),  # Yeni parametre
+                'catalog': self.catalog_path
             },
             'aco': {
                 'num_ants': self.num_ants.value(),
@@ -287,6 +396,26 @@ class MainWindow(QMainWindow):
 
     def start_simulation(self):
         """Simülasyonu başlatır"""
+        params = self.get_parameters()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        params['aco']['checkpoint_path'] = f"checkpoints/run_{timestamp}.ckpt"
+        self.launch_simulation(params)
+
+    def resume_simulation(self):
+        """Kaydedilmiş kontrol noktasından optimizasyona devam eder"""
+        filename, _ = QFileDialog.getOpenFileName(
+            self,
+            "Kontrol Noktası Seç",
+            "checkpoints",
+            "Kontrol Noktaları (*.ckpt);;Tüm Dosyalar (*)"
+        )
+        if filename:
+            params = self.get_parameters()
+            params['resume'] = filename
+            self.launch_simulation(params)
+
+    def launch_simulation(self, params):
+        """Verilen parametrelerle simülasyon thread'ini başlatır"""
         self.progress_bar.setValue(0)
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)  # Durdurma butonunu aktif et
@@ -297,14 +426,40 @@ class MainWindow(QMainWindow):
         self.simulation_start_time = datetime.now()
         self.timer.start()
         
-        params = self.get_parameters()
+        self.convergence_plot.reset()
+        
+        # Canlı ilerleme tarayıcıya SSE ile gönderilir
+        try:
+            self.ensure_viewer_server()
+        except OSError as e:
+            self.log_text.append(f"Görüntüleyici sunucusu başlatılamadı: {str(e)}")
         
         # Simülasyonu ayrı thread'de başlat
         self.sim_thread = SimulationThread(params)
-        self.sim_thread.progress.connect(self.update_progress)
         self.sim_thread.finished.connect(self.simulation_finished)
-        self.sim_thread.log.connect(self.log_text.append)
         self.sim_thread.start()
+        self.log_timer.start()
+
+    def drain_simulation_output(self):
+        """İşçi thread'in biriktirdiği logları ve son ilerlemeyi GUI'ye aktarır"""
+        if not hasattr(self, 'sim_thread'):
+            return
+        messages, dropped = self.sim_thread.log_buffer.drain()
+        if dropped:
+            messages.insert(0, f"... {dropped} mesaj atlandı ...")
+        if messages:
+            # Her mesaj için ayrı append yerine tek blok ekle
+            self.log_text.append("\n".join(messages))
+
+        percent = self.sim_thread.progress_state.take()
+        if percent is not None:
+            self.update_progress(percent)
+
+        iteration = self.sim_thread.iteration_state.take()
+        if iteration is not None:
+            self.convergence_plot.add_point(iteration['telemetry'])
+            if self.viewer_server is not None:
+                self.viewer_server.publish('progress', iteration)
 
     def stop_simulation(self):
         """Simülasyonu durdurur"""
@@ -315,8 +470,10 @@ class MainWindow(QMainWindow):
             if not self.sim_thread.wait(3000):  # 3 saniye bekle
                 self.sim_thread.terminate()  # Hala durmadıysa zorla sonlandır
             
-            # Timer'ı durdur
+            # Timer'ları durdur
             self.timer.stop()
+            self.log_timer.stop()
+            self.drain_simulation_output()
             
             # Butonları güncelle
             self.start_button.setEnabled(True)
@@ -337,16 +494,28 @@ class MainWindow(QMainWindow):
     def simulation_finished(self, result):
         """Simülasyon tamamlandığında çağrılır"""
         self.simulation_result = result
+        self.simulation = self.sim_thread.simulation
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)  # Durdurma butonunu devre dışı bırak
         self.show_path_button.setEnabled(True)
         self.show_3d_button.setEnabled(True)
         
-        # Timer'ı durdur
+        # Timer'ları durdur, kalan logları aktar
         self.timer.stop()
+        self.log_timer.stop()
+        self.drain_simulation_output()
         
         self.log_text.append("Simülasyon tamamlandı!")
         
+        if self.viewer_server is not None and result:
+            self.viewer_server.publish('finished', {
+                'best_cost': result['cost'] if result.get('solution') else None,
+                'best_path': result.get('solution')
+            })
+        
+        if result.get('telemetry'):
+            self.convergence_plot.set_history(result['telemetry'])
+        
         if result:
             self.log_text.append(f"Bulunan yol: {result['solution']}")
             self.log_text.append(f"Toplam mesafe: {result['cost']/1000:.2f} km")
@@ -373,66 +542,58 @@ class MainWindow(QMainWindow):
             
             self.log_text.append(f"Yol {filename} dosyasına kaydedildi.")
 
+    def ensure_viewer_server(self):
+        """Görüntüleyici sunucusunu ilk kullanımda bir kez başlatır"""
+        from server import get_server
+        started = self.viewer_server is None
+        self.viewer_server = get_server(port=self.viewer_port.value())
+        if started:
+            self.log_text.append(f"Sunucu {self.viewer_server.url()} adresinde başlatıldı")
+        return self.viewer_server
+
     def show_3d(self):
         """3D görünümü web tarayıcısında gösterir"""
         if self.simulation_result:
             try:
                 import webbrowser
                 import os
-                import http.server
-                import socketserver
-                import threading
                 
                 # Proje kök dizinini bul
                 root_dir = os.path.dirname(os.path.abspath(__file__))
+                server = self.ensure_viewer_server()
                 
-                # Web sunucusu için port
-                PORT = 8000
-                
-                # Mevcut dizini değiştir
-                os.chdir(root_dir)
-                
-                # UTF-8 destekli HTTP handler
-                class UTF8Handler(http.server.SimpleHTTPRequestHandler):
-                    def end_headers(self):
-                        self.send_header('Content-Type', 'text/html; charset=utf-8')
-                        super().end_headers()
-                    
-                    def log_message(self, format, *args):
-                        # Sunucu loglarını devre dışı bırak
-                        pass
-                
-                # Basit HTTP sunucusu
-                def run_server():
-                    try:
-                        with socketserver.TCPServer(("", PORT), UTF8Handler) as httpd:
-                            self.log_text.append(f"Sunucu http://localhost:{PORT} adresinde başlatıldı")
-                            httpd.serve_forever()
-                    except OSError as e:
-                        if e.errno == 98:  # Port zaten kullanımda
-                            self.log_text.append("Sunucu zaten çalışıyor, yeni pencere açılıyor...")
-                        else:
-                            raise e
-                
-                # Sunucuyu arka planda başlat
-                server_thread = threading.Thread(target=run_server)
-                server_thread.daemon = True
-                server_thread.start()
-                
-                # Simülasyon verilerini hazırla ve kaydet
-                # ... (önceki simülasyon veri hazırlama kodu aynı)
-                
-                # Kısa bir bekleme ekle
-                time.sleep(0.5)  # Sunucunun başlaması için bekle
+                # Görev zaman çizelgesini görüntüleyici için yaz
+                self.export_timeline(os.path.join(root_dir, 'templates'))
                 
                 # Tarayıcıda aç
-                webbrowser.open(f'http://localhost:{PORT}/templates/index.html')
+                webbrowser.open(server.url('/templates/index.html'))
                 
                 self.log_text.append("3D görünüm web tarayıcısında açıldı.")
                 
             except Exception as e:
                 self.log_text.append(f"3D görünüm hatası: {str(e)}")
 
+    def export_timeline(self, directory):
+        """Sonucun zaman çizelgesini ikili dosya + JSON manifest olarak yazar"""
+        from main import Simulation
+        from timeline import build_timeline, write_timeline
+
+        sim = self.simulation
+        if sim is None:
+            # Yüklenen yollar için mevcut parametrelerle senaryo oluştur
+            params = self.get_parameters()['simulation']
+            sim = Simulation(
+                num_satellites=params['num_satellites'],
+                rocket_fuel=params['rocket_fuel'],
+                catalog_path=params.get('catalog')
+            )
+            sim.rocket.speed = params['rocket_speed']
+
+        timeline = build_timeline(sim.satellites, sim.moon, sim.rocket,
+                                  self.simulation_result['solution'],
+                                  cost_model=self.simulation_result.get('cost_model', 'linear'))
+        write_timeline(timeline, directory)
+
     def save_path(self):
         """Yolu TXT dosyasına kaydeder"""
         if self.simulation_result and self.simulation_result['solution']:
@@ -512,6 +673,8 @@ class MainWindow(QMainWindow):
                             self.simulation_result['cost'] = float(distance_str) * 1000
                             break
                     
+                    self.validate_loaded_path()
+                    
                     # Butonları aktifleştir
                     self.show_path_button.setEnabled(True)
                     self.save_path_button.setEnabled(True)
@@ -524,6 +687,52 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.log_text.append(f"Yol yükleme hatası: {str(e)}")
 
+    def validate_loaded_path(self):
+        """
+        Yüklenen yolu son simülasyonun senaryosunda yeniden hesaplar; dosyadaki
+        maliyet yerine hesaplanan değerler kullanılır
+        """
+        path = self.simulation_result['solution']
+        sim = self.simulation
+        if sim is None or max(path) > sim.num_satellites:
+            self.simulation = None
+            self.log_text.append("Uyumlu senaryo yok; yol doğrulanamadı, dosyadaki mesafe kullanılıyor.")
+            return
+
+        evaluation = sim.evaluate_routes([path])
+        self.simulation_result.update({
+            'cost': float(evaluation['cost'][0]),
+            'distance': float(evaluation['distance'][0]),
+            'time_elapsed': float(evaluation['time_elapsed'][0]),
+            'fuel_states': evaluation['fuel_states'][0].tolist()
+        })
+        if not evaluation['feasible'][0]:
+            leg = int(evaluation['failed_leg'][0])
+            reason = f"{leg + 1}. bacakta yakıt yetersiz" if leg >= 0 else "geçersiz rota"
+            self.log_text.append(f"Uyarı: Yol bu senaryoda uygulanamaz ({reason}).")
+        elif not evaluation['complete'][0]:
+            self.log_text.append("Uyarı: Yol tüm uyduları ziyaret etmiyor.")
+
+    def load_catalog(self):
+        """Uydu filosunu CSV/TLE katalog dosyasından yükler"""
+        try:
+            filename, _ = QFileDialog.getOpenFileName(
+                self,
+                "Katalog Yükle",
+                "",
+                "Katalog Dosyaları (*.csv *.tle *.3le);;Tüm Dosyalar (*)"
+            )
+
+            if filename:
+                from catalog import load_catalog
+                constellation = load_catalog(filename)
+                self.catalog_path = filename
+                self.num_satellites.setValue(min(len(constellation), self.num_satellites.maximum()))
+                self.log_text.append(f"Katalog {filename} dosyasından yüklendi ({len(constellation)} uydu).")
+
+        except Exception as e:
+            self.log_text.append(f"Katalog yükleme hatası: {str(e)}")
+
     def load_parameters(self):
         """Kaydedilmiş parametreleri yükler"""
         try:
@@ -543,6 +752,7 @@ class MainWindow(QMainWindow):
                 self.num_satellites.setValue(sim_params['num_satellites'])
                 self.rocket_fuel.setValue(sim_params['rocket_fuel'])
                 self.time_step.setValue(sim_params['time_step'])
+                self.catalog_path = sim_params.get('catalog')
                 
                 # ACO parametrelerini güncelle
                 aco_params = params['aco']
@@ -0,0 +1,708 @@
+"""
+Yerel HTTP/JSON iş servisi: Simulation.calculate_path() çağrısını GUI'siz
+çalıştırır.
+
+    python job_server.py serve --port 8100 --workers 2
+    python job_server.py worker --connect sunucu:50000 --authkey gizli
+
+İşler sınırlı bir kuyruğa alınır ve BaseManager soketi üzerinden bağlanan
+işçi süreçleri (yerel veya başka makinelerdeki) tarafından çalıştırılır.
+"""
+import argparse
+import http.server
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import queue
+import secrets
+import socket
+import threading
+import time
+from multiprocessing.managers import BaseManager
+from server import json_safe
+from transfer_cost import COST_MODELS
+
+DEFAULT_PORT = 8100
+DEFAULT_MANAGER_PORT = 50000
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUED = 16  # Kuyruk doluysa yeni işler 503 ile reddedilir
+DEFAULT_TIME_BUDGET = 300  # Saniye
+MAX_TIME_BUDGET = 3600
+MAX_FINISHED_JOBS = 1000  # Bellekte tutulan tamamlanmış iş sayısı
+CANCEL_POLL_INTERVAL = 0.5  # İşçinin iptal isteğini kontrol etme aralığı (saniye)
+KEEPALIVE_INTERVAL = 15
+MAX_BODY_SIZE = 1 << 20
+# Bütçe dolduktan sonra sonuç için beklenecek ek süre (kurulum, aktarım);
+# aşılırsa işçinin öldüğü ya da bağlantının koptuğu varsayılır
+JOB_GRACE_PERIOD = 60
+
+# İstemci değerlerinin üst sınırları: tek bir iş saatlerce süren ya da
+# gigabaytlarca bellek tutan bir çalışma kuyruğa alamasın
+INTEGER_LIMITS = {
+    'num_satellites': 1000,
+    'num_ants': 500,
+    'iterations': 10000,
+    'telemetry_points': 4096
+}
+MAX_ROCKET_FUEL = 1e9
+MAX_OPTION_VALUE = 1e6  # alpha, beta, Q
+
+SCENARIO_KEYS = ('num_satellites', 'rocket_fuel', 'seed', 'catalog_path')
+ACO_OPTION_KEYS = ('num_ants', 'iterations', 'evaporation_rate', 'alpha', 'beta', 'Q',
+                   'telemetry_points', 'cost_model', 'multi_objective')
+FINAL_STATES = ('succeeded', 'cancelled', 'failed')
+
+
+class QueueFullError(RuntimeError):
+    """Bekleyen iş sayısı sınıra ulaştığında fırlatılır"""
+
+
+class JobControl:
+    """İptal bayraklarını işçilerle paylaşılan nesne (manager üzerinden vekil ile)"""
+
+    def __init__(self):
+        self._cancelled = set()
+        self._lock = threading.Lock()
+
+    def cancel(self, job_id):
+        with self._lock:
+            self._cancelled.add(job_id)
+
+    def is_cancelled(self, job_id):
+        with self._lock:
+            return job_id in self._cancelled
+
+    def discard(self, job_id):
+        with self._lock:
+            self._cancelled.discard(job_id)
+
+
+class _SchedulerManager(BaseManager):
+    pass
+
+
+# İşçi tarafı: nesneler sunucuda yaşar, burada yalnızca isimler kaydedilir
+_SchedulerManager.register('get_tasks')
+_SchedulerManager.register('get_events')
+_SchedulerManager.register('get_control')
+
+
+def parse_address(text, default_port=DEFAULT_MANAGER_PORT):
+    """'host:port' metnini (host, port) ikilisine çevirir"""
+    host, _, port = text.rpartition(':')
+    if not host:
+        return text, default_port
+    return host, int(port)
+
+
+def resolve_catalog_path(path, catalog_dir):
+    """
+    İstemcinin verdiği katalog yolunu izinli dizin içinde çözer
+    Raises:
+        ValueError: Katalog kapalıysa, yol dizin dışına çıkıyorsa ya da dosya yoksa
+    """
+    if not catalog_dir:
+        raise ValueError("Bu sunucuda katalog yükleme kapalı (--catalog-dir verilmedi)")
+    if not isinstance(path, str):
+        raise ValueError("catalog_path metin olmalı")
+    root = os.path.realpath(catalog_dir)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError("catalog_path katalog dizininin dışında")
+    if not os.path.isfile(resolved):
+        raise ValueError(f"Katalog dosyası bulunamadı: {path}")
+    return resolved
+
+
+def _is_integer(value):
+    # bool, int'in alt sınıfıdır; JSON true/false sayı yerine kabul edilmez
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value):
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)
+            and math.isfinite(value))
+
+
+def validate_job_request(data, catalog_dir=None):
+    """
+    İstek gövdesini doğrular ve normalize eder
+    Args:
+        catalog_dir: catalog_path'in çözüleceği izinli dizin (None ise
+            istemci katalog veremez)
+    Returns:
+        tuple: (scenario, options, time_budget)
+    Raises:
+        ValueError: Geçersiz alan veya değer varsa
+    """
+    if not isinstance(data, dict):
+        raise ValueError("İstek gövdesi JSON nesnesi olmalı")
+    unknown = set(data) - {'scenario', 'options', 'time_budget'}
+    if unknown:
+        raise ValueError(f"Bilinmeyen alanlar: {sorted(unknown)}")
+
+    scenario = data.get('scenario') or {}
+    options = data.get('options') or {}
+    if not isinstance(scenario, dict) or not isinstance(options, dict):
+        raise ValueError("scenario ve options JSON nesnesi olmalı")
+    unknown = set(scenario) - set(SCENARIO_KEYS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen senaryo alanları: {sorted(unknown)}")
+    unknown = set(options) - set(ACO_OPTION_KEYS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen ACO seçenekleri: {sorted(unknown)}")
+
+    for key, maximum in INTEGER_LIMITS.items():
+        source = scenario if key in SCENARIO_KEYS else options
+        if key in source and not (_is_integer(source[key]) and 1 <= source[key] <= maximum):
+            raise ValueError(f"{key} 1 ile {maximum} arasında tam sayı olmalı")
+    if 'evaporation_rate' in options and not (_is_number(options['evaporation_rate'])
+                                              and 0 < options['evaporation_rate'] < 1):
+        raise ValueError("evaporation_rate 0 ile 1 arasında (uçlar hariç) olmalı")
+    for key in ('alpha', 'beta', 'Q'):
+        if key in options and not (_is_number(options[key]) and 0 <= options[key] <= MAX_OPTION_VALUE):
+            raise ValueError(f"{key} 0 ile {MAX_OPTION_VALUE:g} arasında sayı olmalı")
+    if 'multi_objective' in options and not isinstance(options['multi_objective'], bool):
+        raise ValueError("multi_objective true/false olmalı")
+    if 'cost_model' in options and options['cost_model'] not in COST_MODELS:
+        raise ValueError(f"cost_model şunlardan biri olmalı: {sorted(COST_MODELS)}")
+    if 'rocket_fuel' in scenario and not (_is_number(scenario['rocket_fuel'])
+                                          and 0 < scenario['rocket_fuel'] <= MAX_ROCKET_FUEL):
+        raise ValueError(f"rocket_fuel 0 ile {MAX_ROCKET_FUEL:g} arasında olmalı")
+    if scenario.get('seed') is not None and not _is_integer(scenario['seed']):
+        raise ValueError("seed tam sayı olmalı")
+    if scenario.get('catalog_path') is not None:
+        scenario = dict(scenario, catalog_path=resolve_catalog_path(scenario['catalog_path'], catalog_dir))
+
+    time_budget = data.get('time_budget', DEFAULT_TIME_BUDGET)
+    if not _is_number(time_budget) or not 0 < time_budget <= MAX_TIME_BUDGET:
+        raise ValueError(f"time_budget 0 ile {MAX_TIME_BUDGET} saniye arasında olmalı")
+    return scenario, options, float(time_budget)
+
+
+def _plain(value):
+    # numpy skalerleri ve dizileri JSON'a uygun yerleşik tiplere çevir
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _run_job(task, events, control, worker_name, scenario_cache=None):
+    from main import Simulation  # Ağır bağımlılıklar yalnızca işçide yüklenir
+
+    job_id = task['id']
+    if control.is_cancelled(job_id):
+        events.put(('cancelled', job_id, None))
+        return
+    events.put(('started', job_id, {'worker': worker_name}))
+
+    done = threading.Event()
+    watcher = None
+    try:
+        # Senaryo hataları (bozuk katalog vb.) da işin hatası olarak bildirilir;
+        # işçi süreci ayakta kalır
+        sim = Simulation(**task['scenario'])
+        sim.aco_options = dict(task['options'], time_limit=task['time_budget'], verbose=False)
+        if scenario_cache:
+            # Dizin istemciden değil işçinin komut satırından gelir
+            sim.aco_options['scenario_cache'] = scenario_cache
+        sim.set_progress_listener(lambda progress: events.put(('progress', job_id, _plain({
+            'iteration': progress['iteration'],
+            'iterations': progress['iterations'],
+            'best_cost': progress['best_cost'],
+            'best_path': progress['best_path']
+        }))))
+
+        def watch_cancel():
+            while not done.wait(CANCEL_POLL_INTERVAL):
+                if control.is_cancelled(job_id):
+                    sim.request_stop()
+                    return
+
+        watcher = threading.Thread(target=watch_cancel, name=f'cancel-{job_id}', daemon=True)
+        watcher.start()
+        result = sim.calculate_path()
+    except Exception as e:
+        events.put(('failed', job_id, {'error': f"{type(e).__name__}: {e}"}))
+        return
+    finally:
+        done.set()
+        if watcher is not None:
+            watcher.join()
+
+    status = 'cancelled' if control.is_cancelled(job_id) else 'succeeded'
+    events.put((status, job_id, {'result': _plain(result)}))
+
+
+def run_worker(address, authkey, name=None, scenario_cache=None):
+    """
+    Zamanlayıcıya bağlanır ve kuyruktaki işleri sırayla çalıştırır. Sunucu
+    kapanınca veya kuyruktan None alınca döner.
+    Args:
+        scenario_cache: Senaryo önbelleği dizini; aynı makinedeki işçiler
+            paylaşabilir (None ise önbellek kullanılmaz)
+    """
+    if name is None:
+        name = f"{socket.gethostname()}:{os.getpid()}"
+    manager = _SchedulerManager(address=address, authkey=authkey)
+    manager.connect()
+    tasks = manager.get_tasks()
+    events = manager.get_events()
+    control = manager.get_control()
+
+    while True:
+        try:
+            task = tasks.get(timeout=1.0)
+        except queue.Empty:
+            continue
+        except (EOFError, OSError):
+            break  # Sunucu kapandı
+        if task is None:
+            break
+        try:
+            _run_job(task, events, control, name, scenario_cache)
+        except (EOFError, OSError):
+            break
+
+
+class JobScheduler:
+    """
+    İş kaydını tutar, işleri paylaşılan kuyruğa koyar ve işçilerden gelen
+    olaylarla iş durumlarını günceller. Yerel işçiler de uzak işçiler gibi
+    manager soketi üzerinden bağlanır.
+    """
+
+    def __init__(self, num_workers=DEFAULT_WORKERS, max_queued=DEFAULT_MAX_QUEUED,
+                 manager_address=('127.0.0.1', 0), authkey=None, scenario_cache=None,
+                 catalog_dir=None, grace_period=JOB_GRACE_PERIOD):
+        self.num_workers = num_workers
+        self.scenario_cache = scenario_cache  # Yerel işçilerin ortak önbellek dizini
+        # İstemcilerin katalog okuyabileceği tek dizin; uzak işçilerde aynı yolda olmalı
+        self.catalog_dir = catalog_dir
+        self.grace_period = grace_period
+        self.max_queued = max_queued
+        self.manager_address = manager_address
+        self.authkey = authkey if authkey is not None else secrets.token_hex(16).encode('ascii')
+
+        self.tasks = queue.Queue()
+        self.events = queue.Queue()
+        self.control = JobControl()
+
+        self.jobs = {}
+        self.changed = threading.Condition()
+        self._ids = itertools.count(1)
+        self.workers = []
+        self.manager_server = None
+        self._running = False
+
+    @property
+    def address(self):
+        return self.manager_server.address if self.manager_server else None
+
+    def start(self):
+        tasks, events, control = self.tasks, self.events, self.control
+
+        class _ServerManager(_SchedulerManager):
+            pass
+
+        _ServerManager.register('get_tasks', callable=lambda: tasks)
+        _ServerManager.register('get_events', callable=lambda: events)
+        _ServerManager.register('get_control', callable=lambda: control)
+
+        manager = _ServerManager(address=self.manager_address, authkey=self.authkey)
+        self.manager_server = manager.get_server()
+        self._running = True
+        threading.Thread(target=self.manager_server.serve_forever,
+                         name='job-manager', daemon=True).start()
+        threading.Thread(target=self._consume_events, name='job-events', daemon=True).start()
+        threading.Thread(target=self._watch_deadlines, name='job-deadlines', daemon=True).start()
+
+        for index in range(self.num_workers):
+            self.workers.append(self._spawn_worker(index))
+        if self.num_workers:
+            threading.Thread(target=self._monitor_workers, name='job-monitor', daemon=True).start()
+        return self
+
+    def stop(self):
+        self._running = False
+        for _ in self.workers:
+            self.tasks.put(None)
+        for process in self.workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.workers = []
+        if self.manager_server is not None:
+            self.manager_server.stop_event.set()
+            self.manager_server = None
+
+    def _spawn_worker(self, index):
+        address = self.manager_server.address
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(address, self.authkey, f"local-{index}", self.scenario_cache),
+            name=f"job-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def _monitor_workers(self):
+        # Çöken yerel işçinin işini başarısız say ve işçiyi yeniden başlat
+        while self._running:
+            time.sleep(1.0)
+            for index, process in enumerate(self.workers):
+                if process.is_alive() or not self._running:
+                    continue
+                name = f"local-{index}"
+                with self.changed:
+                    for job in self.jobs.values():
+                        if job['status'] == 'running' and job['worker'] == name:
+                            self.control.discard(job['id'])
+                            self._finish(job, 'failed', error="İşçi süreci beklenmedik şekilde sonlandı")
+                self.workers[index] = self._spawn_worker(index)
+
+    def _watch_deadlines(self):
+        # Uzak işçiler izlenemez: bütçe + ek süre içinde son olay gelmeyen
+        # çalışan işler başarısız sayılır. İşçi hâlâ yaşıyorsa iptal bayrağıyla
+        # durur; geç gelen sonuç _consume_events'te yok sayılır.
+        while self._running:
+            time.sleep(1.0)
+            now = time.time()
+            with self.changed:
+                for job in self.jobs.values():
+                    if job['status'] != 'running':
+                        continue
+                    if now - job['started'] > job['time_budget'] + self.grace_period:
+                        self.control.cancel(job['id'])
+                        self._finish(job, 'failed',
+                                     error="İşçiden süresi içinde sonuç gelmedi (işçi kopmuş olabilir)")
+
+    def submit(self, scenario, options, time_budget):
+        """
+        Yeni iş kuyruğa alır
+        Raises:
+            QueueFullError: Bekleyen iş sayısı max_queued'a ulaştıysa
+        """
+        with self.changed:
+            queued = sum(1 for job in self.jobs.values() if job['status'] == 'queued')
+            if queued >= self.max_queued:
+                raise QueueFullError("İş kuyruğu dolu")
+            job_id = f"job-{next(self._ids)}"
+            job = {
+                'id': job_id,
+                'status': 'queued',
+                'scenario': scenario,
+                'options': options,
+                'time_budget': time_budget,
+                'submitted': time.time(),
+                'started': None,
+                'finished': None,
+                'worker': None,
+                'progress': None,
+                'result': None,
+                'error': None,
+                'version': 0
+            }
+            self.jobs[job_id] = job
+            self._evict_finished()
+        self.tasks.put({'id': job_id, 'scenario': scenario, 'options': options,
+                        'time_budget': time_budget})
+        return job
+
+    def cancel(self, job_id):
+        """İşi iptal eder; çalışıyorsa işçi en iyi ara çözümü döndürür"""
+        with self.changed:
+            job = self.jobs.get(job_id)
+            if job is None or job['status'] in FINAL_STATES:
+                return job
+            self.control.cancel(job_id)
+            if job['status'] == 'queued':
+                # İşçi kuyruktan aldığında atlayacak
+                self._finish(job, 'cancelled')
+            return job
+
+    def get(self, job_id):
+        with self.changed:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list(self):
+        with self.changed:
+            return [dict(job) for job in self.jobs.values()]
+
+    def wait_for_update(self, job_id, version, timeout):
+        """İşin sürümü version'dan farklı olana veya zaman aşımına kadar bekler"""
+        with self.changed:
+            self.changed.wait_for(
+                lambda: job_id not in self.jobs or self.jobs[job_id]['version'] != version,
+                timeout=timeout
+            )
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _consume_events(self):
+        while self._running:
+            try:
+                kind, job_id, payload = self.events.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            with self.changed:
+                job = self.jobs.get(job_id)
+                if job is None:
+                    continue
+                if kind == 'started':
+                    if job['status'] == 'queued':
+                        job['status'] = 'running'
+                        job['started'] = time.time()
+                        job['worker'] = payload['worker']
+                        self._touch(job)
+                elif kind == 'progress':
+                    job['progress'] = payload
+                    self._touch(job)
+                else:
+                    # İşçi işi bitirdi; kuyrukta iptal edilen iş zaten sonlanmış olabilir
+                    self.control.discard(job_id)
+                    if job['status'] not in FINAL_STATES:
+                        payload = payload or {}
+                        self._finish(job, kind, result=payload.get('result'),
+                                     error=payload.get('error'))
+
+    def _touch(self, job):
+        job['version'] += 1
+        self.changed.notify_all()
+
+    def _finish(self, job, status, result=None, error=None):
+        job['status'] = status
+        job['finished'] = time.time()
+        job['result'] = result
+        job['error'] = error
+        self._touch(job)
+
+    def _evict_finished(self):
+        finished = [job for job in self.jobs.values() if job['status'] in FINAL_STATES]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job['id']]
+
+
+def job_summary(job, include_result=False):
+    summary = {key: job[key] for key in ('id', 'status', 'submitted', 'started', 'finished',
+                                         'worker', 'time_budget', 'progress', 'error')}
+    if job['result'] is not None:
+        summary['cost'] = job['result'].get('cost')
+        summary['solution'] = job['result'].get('solution')
+        summary['stopped'] = job['result'].get('stopped')
+    if include_result:
+        summary['result'] = job['result']
+    return summary
+
+
+class _JobRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    POST   /jobs              iş gönder (202, kuyruk doluysa 503)
+    GET    /jobs              iş listesi
+    GET    /jobs/<id>         durum ve ilerleme
+    GET    /jobs/<id>/result  sonuç (iş bitmediyse 409)
+    GET    /jobs/<id>/events  durum değişiklikleri (SSE)
+    DELETE /jobs/<id>         iptal
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def route(self):
+        parts = [part for part in self.path.split('?', 1)[0].split('/') if part]
+        if not parts or parts[0] != 'jobs' or len(parts) > 3:
+            return None, None
+        job_id = parts[1] if len(parts) > 1 else None
+        action = parts[2] if len(parts) > 2 else None
+        return job_id, action
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(json_safe(data), default=float).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message, headers=None):
+        self.send_json(status, {'error': message}, headers)
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0].rstrip('/') != '/jobs':
+            self.send_error_json(404, "Bulunamadı")
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_SIZE:
+            self.send_error_json(413, "İstek gövdesi çok büyük")
+            return
+        try:
+            data = json.loads(self.rfile.read(length) or b'{}')
+            scenario, options, time_budget = validate_job_request(
+                data, self.server.scheduler.catalog_dir)
+        except ValueError as e:
+            self.send_error_json(400, str(e))
+            return
+        try:
+            job = self.server.scheduler.submit(scenario, options, time_budget)
+        except QueueFullError as e:
+            self.send_error_json(503, str(e), {'Retry-After': '5'})
+            return
+        self.send_json(202, job_summary(job), {'Location': f"/jobs/{job['id']}"})
+
+    def do_GET(self):
+        job_id, action = self.route()
+        scheduler = self.server.scheduler
+        if job_id is None:
+            if self.path.split('?', 1)[0].rstrip('/') == '/jobs':
+                self.send_json(200, [job_summary(job) for job in scheduler.list()])
+            else:
+                self.send_error_json(404, "Bulunamadı")
+            return
+
+        job = scheduler.get(job_id)
+        if job is None:
+            self.send_error_json(404, "İş bulunamadı")
+        elif action is None:
+            self.send_json(200, job_summary(job))
+        elif action == 'result':
+            if job['status'] not in FINAL_STATES:
+                self.send_error_json(409, "İş henüz tamamlanmadı")
+            else:
+                self.send_json(200, job_summary(job, include_result=True))
+        elif action == 'events':
+            self.handle_events(job)
+        else:
+            self.send_error_json(404, "Bulunamadı")
+
+    def do_DELETE(self):
+        job_id, action = self.route()
+        if job_id is None or action is not None:
+            self.send_error_json(404, "Bulunamadı")
+            return
+        job = self.server.scheduler.cancel(job_id)
+        if job is None:
+            self.send_error_json(404, "İş bulunamadı")
+            return
+        self.send_json(202, job_summary(job))
+
+    def handle_events(self, job):
+        """İşin her durum/ilerleme değişikliğini SSE olayı olarak gönderir"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        scheduler = self.server.scheduler
+        try:
+            while job is not None:
+                event = 'finished' if job['status'] in FINAL_STATES else 'status'
+                payload = json.dumps(json_safe(job_summary(job)), default=float)
+                self.wfile.write(f"event: {event}\ndata: {payload}\n\n".encode('utf-8'))
+                self.wfile.flush()
+                if event == 'finished':
+                    break
+                version = job['version']
+                while True:
+                    job = scheduler.wait_for_update(job['id'], version, KEEPALIVE_INTERVAL)
+                    if job is None or job['version'] != version:
+                        break
+                    self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class _JobHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, handler, scheduler):
+        super().__init__(address, handler)
+        self.scheduler = scheduler
+
+
+class JobServer:
+    """HTTP/JSON API'sini ve zamanlayıcıyı birlikte başlatıp durdurur"""
+
+    def __init__(self, scheduler, host='127.0.0.1', port=DEFAULT_PORT):
+        self.scheduler = scheduler
+        self.host = host
+        self.port = port
+        self.httpd = None
+
+    def start(self):
+        self.scheduler.start()
+        self.httpd = _JobHTTPServer((self.host, self.port), _JobRequestHandler, self.scheduler)
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, name='job-http', daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+        self.scheduler.stop()
+
+    def url(self, path='/'):
+        return f"http://{self.host}:{self.port}/{path.lstrip('/')}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uydu rota optimizasyonu iş servisi")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="HTTP API ve zamanlayıcıyı başlatır")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                       help="Yerel işçi süreci sayısı")
+    serve.add_argument('--max-queued', type=int, default=DEFAULT_MAX_QUEUED)
+    serve.add_argument('--manager', default=f"127.0.0.1:{DEFAULT_MANAGER_PORT}",
+                       help="Uzak işçilerin bağlanacağı adres (host:port)")
+    serve.add_argument('--authkey', default=os.environ.get('JOB_SERVER_AUTHKEY'))
+    serve.add_argument('--scenario-cache', help="Yerel işçilerin paylaşacağı senaryo önbelleği dizini")
+    serve.add_argument('--catalog-dir', help="İstemcilerin catalog_path ile okuyabileceği dizin")
+
+    worker = commands.add_parser('worker', help="Uzak bir zamanlayıcıya işçi olarak bağlanır")
+    worker.add_argument('--connect', required=True, help="Zamanlayıcı adresi (host:port)")
+    worker.add_argument('--authkey', default=os.environ.get('JOB_SERVER_AUTHKEY'))
+    worker.add_argument('--scenario-cache', help="Senaryo önbelleği dizini")
+
+    args = parser.parse_args()
+    if args.command == 'worker':
+        if not args.authkey:
+            parser.error("--authkey veya JOB_SERVER_AUTHKEY gerekli")
+        run_worker(parse_address(args.connect), args.authkey.encode('utf-8'),
+                   scenario_cache=args.scenario_cache)
+        return
+
+    authkey = args.authkey.encode('utf-8') if args.authkey else None
+    scheduler = JobScheduler(args.workers, args.max_queued, parse_address(args.manager), authkey,
+                             args.scenario_cache, args.catalog_dir)
+    server = JobServer(scheduler, args.host, args.port).start()
+    print(f"İş servisi: {server.url('/jobs')}")
+    print(f"İşçi adresi: {scheduler.address[0]}:{scheduler.address[1]}")
+    if args.authkey is None:
+        print(f"İşçi anahtarı: {scheduler.authkey.decode('ascii')} (uzak işçiler için --authkey ile verin)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import threading
+from collections import deque
+
+
+class LogBuffer:
+    """
+    İşçi thread'in yazdığı, GUI'nin zamanlayıcıyla toplu olarak boşalttığı
+    sınırlı halka tampon. Dolduğunda en eski mesajlar atılır.
+    """
+
+    def __init__(self, maxlen=2000):
+        self._messages = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._dropped = 0
+
+    def append(self, message):
+        with self._lock:
+            if len(self._messages) == self._messages.maxlen:
+                self._dropped += 1
+            self._messages.append(message)
+
+    def drain(self):
+        """
+        Biriken tüm mesajları alır ve tamponu boşaltır
+        Returns:
+            tuple: (mesaj listesi, son boşaltmadan beri atılan mesaj sayısı)
+        """
+        with self._lock:
+            messages = list(self._messages)
+            self._messages.clear()
+            dropped, self._dropped = self._dropped, 0
+        return messages, dropped
+
+
+class LatestValue:
+    """Sık güncellenen bir değeri yalnızca en sonuncusu kalacak şekilde tutar"""
+
+    def __init__(self):
+        self._value = None
+        self._lock = threading.Lock()
+
+    def set(self, value):
+        with self._lock:
+            self._value = value
+
+    def take(self):
+        """Son değeri döndürür ve temizler; yeni değer yoksa None döner"""
+        with self._lock:
+            value, self._value = self._value, None
+        return value
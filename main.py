@@ -1,78 +1,141 @@
+import numpy as np
 from models import Point3D, Satellite, Moon, Rocket
 from ant_colony import AntColonyOptimization
-import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-import math
-import random
-from matplotlib.animation import FuncAnimation
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from constellation import Constellation
+from catalog import load_catalog
+from checkpoint import load_checkpoint
+from route_evaluator import RouteEvaluator
+
 
 class Simulation:
-    def __init__(self, num_satellites=10, rocket_fuel=200000):
+    def __init__(self, num_satellites=10, rocket_fuel=200000, seed=None, catalog_path=None):
         self.num_satellites = num_satellites
+        self.seed = seed
+        self.catalog_path = catalog_path
         self.moon = Moon()
         self.rocket = Rocket(rocket_fuel)
         self.satellites = self.create_satellites()
+        self.num_satellites = len(self.satellites)
         self.time = 0
         self.time_step = 3600  # 1 saat
         self.best_path = None
         self.current_path_index = 0
         self.rocket_position = self.moon.get_position()  # Roket başlangıçta Ay'da
         self.target_position = None
+        self.current_trajectory = None  # Mevcut bacağın Bezier yörüngesi
         self.movement_progress = 0  # 0 ile 1 arası, hedef noktaya ilerleme
         self.movement_speed = 0.05  # Her frame'de ne kadar ilerleyeceği
         self.aco_options = {}
         self.progress_callback = None  # Callback fonksiyonu için
+        self.renderer = None  # 3D görünüm açıldığında oluşturulur
+        self.progress_listener = None  # İterasyon sonu ayrıntılı ilerleme
+        self.aco = None  # Çalışan optimizasyon
+        self.stop_requested = False
+        self.resume_state = None  # Kontrol noktasından devam edilecek durum
+        # Kayan ufuk modu: plan_rolling_horizon() argümanları, None ise tek tur
+        self.rolling_horizon = None
 
-    def create_satellites(self):
-        satellites = []
-        GEO_RADIUS = 42164e3  # Jeosenkron yörünge yarıçapı
-        GEO_VARIATION = 1000e3  # Varyasyon
-
-        for i in range(self.num_satellites):
-            initial_angle = (2 * math.pi * i) / self.num_satellites
-            orbit_radius = GEO_RADIUS + (random.random() - 0.5) * GEO_VARIATION
-            inclination = (random.random() - 0.5) * math.pi / 90
-            initial_fuel = 60 + random.random() * 20
-
-            satellite = Satellite(
-                i, orbit_radius, initial_angle, inclination, initial_fuel
-            )
-            satellites.append(satellite)
+    @classmethod
+    def from_checkpoint(cls, path):
+        """
+        Kontrol noktasındaki senaryo ve ACO seçenekleriyle simülasyon kurar;
+        calculate_path() optimizasyona kaldığı iterasyondan devam eder
+        Raises:
+            ValueError: Dosya bu sürümle uyumlu değilse
+        """
+        state = load_checkpoint(path)
+        scenario = state['scenario']
+        sim = cls(num_satellites=len(scenario['satellites']['ids']),
+                  rocket_fuel=scenario['rocket']['max_fuel'],
+                  seed=state['options'].get('seed'))
+        sim.satellites = Constellation(**scenario['satellites'])
+        sim.num_satellites = len(sim.satellites)
+        sim.moon.current_angle = scenario['moon_angle']
+        sim.rocket_position = sim.moon.get_position()
+        for name, value in scenario['rocket'].items():
+            setattr(sim.rocket, name, value)
+        sim.aco_options = dict(state['options'])
+        sim.resume_state = state
+        return sim
 
-        return satellites
+    def create_satellites(self):
+        """
+        Uydu filosunu oluşturur: katalog dosyası verildiyse oradan yükler,
+        aksi halde GEO civarında rastgele bir filo üretir
+        """
+        if self.catalog_path:
+            return load_catalog(self.catalog_path)
+        return Constellation.random_geo(self.num_satellites, self.seed)
 
     def set_callback(self, callback):
         """İlerleme durumunu raporlamak için callback fonksiyonu ayarlar"""
         self.progress_callback = callback
 
+    def set_progress_listener(self, listener):
+        """
+        Her ACO iterasyonunun sonunda iterasyon, en iyi maliyet ve en iyi
+        rotayı içeren sözlükle çağrılacak dinleyiciyi ayarlar
+        """
+        self.progress_listener = listener
+
+    def request_stop(self):
+        """Çalışan optimizasyonu bir sonraki karınca sınırında durdurur"""
+        self.stop_requested = True
+        if self.aco is not None:
+            self.aco.request_stop()
+
+    def evaluate_routes(self, routes):
+        """
+        Rotaları bu senaryoda değerlendirir; optimizasyon çalıştıysa onun
+        mesafe indeksi ve maliyet modeli kullanılır
+        Returns:
+            dict: RouteEvaluator.evaluate() sonucu
+        """
+        if self.aco is not None and self.aco.satellites is self.satellites:
+            return self.aco.evaluate_routes(routes)
+        evaluator = RouteEvaluator.exact(self.satellites, self.moon, self.rocket,
+                                         self.aco_options.get('cost_model', 'linear'))
+        return evaluator.evaluate(routes)
+
+    def solver_options(self):
+        """ACO parametreleri (aco_options varsayılanları ezer)"""
+        options = {
+            'num_ants': 50,
+            'iterations': 100,
+            'evaporation_rate': 0.1,
+            'alpha': 1.0,
+            'beta': 2.0,
+            'Q': 100,
+            'telemetry_points': 512,
+            'seed': self.seed
+        }
+        options.update(self.aco_options)
+        return options
+
     def calculate_path(self):
         """Sadece yol hesaplaması yapar, görselleştirme olmadan"""
-        if not hasattr(self, 'progress_callback'):
+        if self.progress_callback is None:
             self.progress_callback = lambda p, m: None
+        if self.rolling_horizon:
+            return self.plan_rolling_horizon(**self.rolling_horizon)
             
         self.progress_callback(0, "ACO algoritması başlatılıyor...")
         
-        # ACO parametrelerini ayarla
+        options = self.solver_options()
         aco = AntColonyOptimization(
             satellites=self.satellites,
             moon=self.moon,
             rocket=self.rocket,
-            options={
-                'num_ants': self.aco_options.get('num_ants', 50),
-                'iterations': self.aco_options.get('iterations', 100),
-                'evaporation_rate': self.aco_options.get('evaporation_rate', 0.1),
-                'alpha': self.aco_options.get('alpha', 1.0),
-                'beta': self.aco_options.get('beta', 2.0),
-                'Q': self.aco_options.get('Q', 100),
-                'time_step': self.time_step
-            }
+            options=options
         )
+        self.aco = aco
+        if self.resume_state is not None:
+            aco.restore_state(self.resume_state)
+        if self.stop_requested:
+            aco.request_stop()
         
         # Her iterasyonda ilerlemeyi bildir
-        total_iterations = self.aco_options.get('iterations', 100)
+        total_iterations = options['iterations']
         current_iteration = 0
 
         def iteration_callback(iteration):
@@ -82,6 +145,8 @@ class Simulation:
             self.progress_callback(percent, f"İterasyon {iteration}/{total_iterations}")
         
         aco.set_iteration_callback(iteration_callback)
+        if self.progress_listener:
+            aco.set_progress_callback(self.progress_listener)
         
         # Optimize edilmiş yolu al
         result = aco.optimize()
@@ -92,6 +157,135 @@ class Simulation:
             
         return result
 
+    def plan_rolling_horizon(self, horizon_visits=10, commit_visits=3, horizon_hours=None,
+                             fuel_reader=None):
+        """
+        Kayan ufuk planlaması: her pencerede yalnızca sonraki horizon_visits
+        ziyaret (ya da horizon_hours saat) ACO ile planlanır, ilk
+        commit_visits ziyaret kesinleştirilir, uydu ve Ay durumu o ana
+        ilerletilir ve önceki pencerenin feromonlarıyla yeniden planlanır.
+        Args:
+            horizon_visits: Pencere başına planlanan en fazla uydu ziyareti
+            commit_visits: Pencere başına kesinleşen uydu ziyareti
+            horizon_hours: Pencere süresi sınırı (None ise yalnızca ziyaret sınırı)
+            fuel_reader: fuel_reader(mission_time, fuel) güncel uydu yakıt
+                ölçümlerini döndürür; None ise yakıt modelle ilerletilir
+        Returns:
+            dict: calculate_path() sonucuyla aynı alanlar ve pencere
+            ayrıntıları ('windows')
+        Raises:
+            ValueError: commit_visits 1'den küçük ya da horizon_visits'ten büyükse
+        """
+        if not 1 <= commit_visits <= horizon_visits:
+            raise ValueError("commit_visits 1 ile horizon_visits arasında olmalı")
+        if self.progress_callback is None:
+            self.progress_callback = lambda p, m: None
+
+        # Planlama durumu kopyalar üzerinde ilerler; rota görev başına göre ifade edilir
+        satellites = self.satellites.copy()
+        moon = Moon()
+        moon.current_angle = self.moon.current_angle
+        served = np.zeros(len(satellites), dtype=bool)
+        route = [0]
+        node = 0
+        fuel = self.rocket.max_fuel
+        mission_time = 0.0
+        pheromones = None
+        windows = []
+        result = None
+
+        while not served.all():
+            self.progress_callback(int(100 * served.mean()),
+                                   f"Pencere {len(windows) + 1}: {int(served.sum())}/{len(served)} uydu planlandı")
+            options = self.solver_options()
+            options.pop('checkpoint_path', None)  # Pencere çözümleri kısa sürer
+            options.pop('scenario_cache', None)  # Her pencerenin geometrisi farklı, tekrar okunmaz
+            options.update({
+                'start_node': node,
+                'start_fuel': fuel,
+                'visited': served.copy(),
+                'max_visits': horizon_visits,
+                'horizon_time': horizon_hours * 3600 if horizon_hours is not None else None
+            })
+            aco = AntColonyOptimization(satellites, moon, self.rocket, options)
+            self.aco = aco
+            if pheromones is not None:
+                aco.warm_start(pheromones)
+            if self.stop_requested:
+                aco.request_stop()
+            if self.progress_listener:
+                aco.set_progress_callback(self.progress_listener)
+            result = aco.optimize()
+
+            path = result['solution']
+            new_visits = [index for index, visit in enumerate(path or []) if index and visit != 0]
+            if not new_visits:
+                break  # Kalan uydulara ulaşılamıyor ya da çözüm durduruldu
+
+            # Kesinleşen önek: ilk commit_visits ziyaret ve aradaki Ay durakları;
+            # planı kalan tüm uyduları kapsayan son pencere tamamen kesinleşir
+            if len(new_visits) == np.count_nonzero(~served):
+                commit = len(path) - 1
+            else:
+                commit = new_visits[min(commit_visits, len(new_visits)) - 1]
+            committed = path[1:commit + 1]
+            elapsed = result['arrival_times'][commit]
+            windows.append({
+                'start_time': mission_time,
+                'planned': path,
+                'committed': committed,
+                'cost': result['cost']
+            })
+
+            route.extend(committed)
+            served[[visit - 1 for visit in committed if visit != 0]] = True
+            node = path[commit]
+            fuel = result['arrival_fuel'][commit]
+            mission_time += elapsed
+
+            satellites.update_positions(elapsed)
+            moon.advance(elapsed)
+            satellites.fuel = satellites.fuel_at(elapsed, aco.fuelConsumptionPerHour)
+            if fuel_reader is not None:
+                satellites.fuel = np.asarray(fuel_reader(mission_time, satellites.fuel.copy()),
+                                             dtype=np.float64)
+            pheromones = aco.pheromones
+            if result['stopped']:
+                break
+
+        self.progress_callback(100, "Kayan ufuk planlaması tamamlandı!")
+        stopped = bool(result and result['stopped'])
+        if len(route) < 2:
+            return {
+                'solution': None,
+                'cost': float('inf'),
+                'distance': float('inf'),
+                'cost_model': self.solver_options().get('cost_model', 'linear'),
+                'fuel_states': [],
+                'time_elapsed': 0,
+                'telemetry': result['telemetry'] if result else None,
+                'stopped': stopped,
+                'windows': windows
+            }
+
+        # Son pencerenin çözücüsü ilerletilmiş durumu tuttuğundan rota
+        # görev başındaki senaryoda değerlendirilir
+        evaluation = RouteEvaluator.exact(self.satellites, self.moon, self.rocket,
+                                          result['cost_model']).evaluate([route])
+        self.best_path = route
+        return {
+            'solution': route,
+            'cost': float(evaluation['cost'][0]),
+            'distance': float(evaluation['distance'][0]),
+            'cost_model': result['cost_model'],
+            'fuel_states': satellites.fuel.tolist(),
+            'time_elapsed': mission_time,
+            'telemetry': result['telemetry'],
+            'stopped': stopped,
+            'complete': bool(served.all()),
+            'windows': windows
+        }
+
     def set_next_target(self):
         """Bir sonraki hedef noktayı belirler"""
         if self.current_path_index < len(self.best_path):
@@ -100,6 +294,12 @@ class Simulation:
                 self.target_position = self.moon.get_position()
             else:
                 self.target_position = self.satellites[next_node-1].current_position
+            # Bacak başına tek yörünge; her karede yeniden hesaplanmaz
+            self.current_trajectory = self.rocket.calculate_trajectory(
+                self.rocket_position,
+                self.target_position,
+                [self.moon]
+            )
             self.movement_progress = 0
             return True
         return False
@@ -118,12 +318,7 @@ class Simulation:
                 return False
         else:
             # Bezier eğrisi üzerinde hareket
-            trajectory = self.rocket.calculate_trajectory(
-                self.rocket_position,
-                self.target_position,
-                [self.moon]
-            )
-            self.rocket_position = trajectory.calculate_point(self.movement_progress)
+            self.rocket_position = self.current_trajectory.calculate_point(self.movement_progress)
         return True
 
     def update(self, frame):
@@ -131,65 +326,25 @@ class Simulation:
         
         # Update positions
         self.moon.update_position(self.time)
-        for sat in self.satellites:
-            sat.update_position(self.time_step)
+        self.satellites.update_positions(self.time_step)
 
         # Update rocket position
         self.update_rocket_position()
 
-        # Clear and redraw
-        self.ax.clear()
-        
-        # Plot Earth
-        u = np.linspace(0, 2 * np.pi, 100)
-        v = np.linspace(0, np.pi, 100)
-        earth_radius = 6371e3
-        x = earth_radius * np.outer(np.cos(u), np.sin(v))
-        y = earth_radius * np.outer(np.sin(u), np.sin(v))
-        z = earth_radius * np.outer(np.ones(np.size(u)), np.cos(v))
-        self.ax.plot_surface(x, y, z, color='blue', alpha=0.1)
-
-        # Plot Moon
-        moon_pos = self.moon.get_position()
-        self.ax.scatter(moon_pos.x, moon_pos.y, moon_pos.z, color='gray', s=100, label='Moon')
-
-        # Plot Satellites
-        for i, sat in enumerate(self.satellites):
-            pos = sat.current_position
-            color = 'green' if i+1 in self.best_path else 'red'
-            self.ax.scatter(pos.x, pos.y, pos.z, color=color, s=20)
-
-        # Plot Rocket
-        self.ax.scatter(self.rocket_position.x, self.rocket_position.y, self.rocket_position.z,
-                       color='yellow', s=100, label='Rocket')
-
-        # Plot current trajectory
-        if self.target_position:
-            trajectory = self.rocket.calculate_trajectory(
-                self.rocket_position,
-                self.target_position,
-                [self.moon]
-            )
-            trajectory_points = [trajectory.calculate_point(t) for t in np.linspace(0, 1, 50)]
-            xs = [p.x for p in trajectory_points]
-            ys = [p.y for p in trajectory_points]
-            zs = [p.z for p in trajectory_points]
-            self.ax.plot(xs, ys, zs, 'y--', alpha=0.5)
-
-        # Set plot limits and labels
-        limit = 450000e3  # 450,000 km
-        self.ax.set_xlim([-limit, limit])
-        self.ax.set_ylim([-limit, limit])
-        self.ax.set_zlim([-limit, limit])
-        self.ax.set_xlabel('X (km)')
-        self.ax.set_ylabel('Y (km)')
-        self.ax.set_zlabel('Z (km)')
-        self.ax.set_title(f'Time: {self.time/3600:.1f} hours\nVisiting: {self.current_path_index}/{len(self.best_path)}')
+        # Kalıcı çiziciyle yalnızca değişen nesneleri güncelle
+        if self.renderer is not None:
+            self.renderer.update(self)
 
     def show_3d_view(self):
         """3D görünümü gösterir"""
-        # Yeni bir pencere oluştur
+        from PyQt5.QtCore import QTimer
         from PyQt5.QtWidgets import QDialog, QVBoxLayout
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 - '3d' projeksiyonunu kaydeder
+        from renderer import MissionRenderer
+
+        # Yeni bir pencere oluştur
         dialog = QDialog()
         dialog.setWindowTitle("3D Görünüm")
         dialog.resize(1000, 800)
@@ -203,16 +358,15 @@ class Simulation:
         layout.addWidget(canvas)
         dialog.setLayout(layout)
         
-        # 3D axes oluştur
+        # 3D axes ve kalıcı çizici oluştur (statik nesneler bir kez çizilir)
         self.ax = fig.add_subplot(111, projection='3d')
+        self.renderer = MissionRenderer(self.ax, canvas)
         
         # Animasyon fonksiyonu
         def update_plot(frame):
             self.update(frame)
-            canvas.draw()
         
         # Timer ile güncelleme
-        from PyQt5.QtCore import QTimer
         timer = QTimer()
         timer.timeout.connect(lambda: update_plot(0))
         timer.start(50)  # 50ms'de bir güncelle
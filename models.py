@@ -1,19 +1,7 @@
 import math
+from functools import lru_cache
 import numpy as np
-from scipy.special import comb
-
-class Point3D:
-    def __init__(self, x, y, z):
-        self.x = x
-        self.y = y
-        self.z = z
-
-    def distance_to(self, other):
-        return math.sqrt(
-            (self.x - other.x) ** 2 +
-            (self.y - other.y) ** 2 +
-            (self.z - other.z) ** 2
-        )
+from geometry import Point3D, as_points_array, midpoints
 
 class Moon:
     def __init__(self):
@@ -26,6 +14,11 @@ class Moon:
         # Ay'ın açısal hızı
         angular_velocity = 2 * math.pi / self.orbital_period
         self.current_angle = (angular_velocity * time) % (2 * math.pi)
+
+    def advance(self, time_step):
+        """Ay'ı mevcut konumundan time_step saniye ilerletir"""
+        angular_velocity = 2 * math.pi / self.orbital_period
+        self.current_angle = (self.current_angle + angular_velocity * time_step) % (2 * math.pi)
         
     def get_position(self):
         x = self.orbit_radius * math.cos(self.current_angle)
@@ -33,21 +26,83 @@ class Moon:
         z = 0  # Ay'ın yörüngesini basitleştirmek için düzlemsel kabul ediyoruz
         return Point3D(x, y, z)
 
+    def positions_at(self, times):
+        """
+        Mevcut konumdan verilen zaman(lar) sonraki konumları durumu
+        değiştirmeden hesaplar
+        Args:
+            times: Saniye cinsinden zaman ya da zaman dizisi
+        Returns:
+            np.ndarray: (3,) veya (T, 3) boyutlu konum dizisi
+        """
+        angle = self.current_angle + (2 * math.pi / self.orbital_period) * np.asarray(times, dtype=np.float64)
+        return np.stack((
+            self.orbit_radius * np.cos(angle),
+            self.orbit_radius * np.sin(angle),
+            np.zeros_like(angle)
+        ), axis=-1)
+
+def bernstein_basis(degree, t):
+    """
+    Bernstein taban polinomlarını verilen t değerleri için hesaplar
+    Args:
+        degree: Eğri derecesi (kontrol noktası sayısı - 1)
+        t: [0, 1] aralığında parametre dizisi
+    Returns:
+        np.ndarray: (M, degree + 1) boyutlu katsayı matrisi
+    """
+    t = np.asarray(t, dtype=np.float64).reshape(-1, 1)
+    i = np.arange(degree + 1)
+    coefficients = np.array([math.comb(degree, k) for k in i], dtype=np.float64)
+    return coefficients * (t ** i) * ((1 - t) ** (degree - i))
+
+
+@lru_cache(maxsize=32)
+def bernstein_matrix(degree, samples):
+    """Eşit aralıklı samples adet t değeri için önbelleğe alınmış Bernstein matrisi"""
+    matrix = bernstein_basis(degree, np.linspace(0, 1, samples))
+    matrix.setflags(write=False)
+    return matrix
+
+
 class BezierTrajectory:
     def __init__(self, control_points):
         self.control_points = control_points
+        self.control_array = as_points_array(control_points)
+        self.control_array.setflags(write=False)
+
+    @property
+    def degree(self):
+        return len(self.control_array) - 1
+
+    def evaluate(self, t):
+        """
+        Bir t dizisi için eğri noktalarını tek matris çarpımıyla hesaplar
+        Returns:
+            np.ndarray: (M, 3) boyutlu nokta dizisi
+        """
+        return bernstein_basis(self.degree, t) @ self.control_array
+
+    def sample(self, count):
+        """Eğri üzerinde eşit parametre aralıklı count nokta, (count, 3) boyutlu"""
+        return bernstein_matrix(self.degree, count) @ self.control_array
     
     def calculate_point(self, t):
-        n = len(self.control_points) - 1
-        point = Point3D(0, 0, 0)
-        
-        for i in range(n + 1):
-            coef = comb(n, i) * (t ** i) * ((1 - t) ** (n - i))
-            point.x += coef * self.control_points[i].x
-            point.y += coef * self.control_points[i].y
-            point.z += coef * self.control_points[i].z
-            
-        return point
+        return Point3D.from_array(self.evaluate(t)[0])
+
+
+@lru_cache(maxsize=256)
+def _cached_trajectory(start, end, body_positions):
+    # Yerçekimi etkisini hesaba katarak ara noktayı belirle
+    mid_point = midpoints(start, end)
+    
+    # Yerçekimi etkisiyle eğrilik ekle
+    gravity_factor = 1000000  # Yerçekimi etkisinin şiddeti
+    for body_pos in as_points_array(body_positions):
+        mid_point += (body_pos - mid_point) / gravity_factor
+    
+    return BezierTrajectory([start, Point3D.from_array(mid_point), end])
+
 
 class Rocket:
     def __init__(self, max_fuel):
@@ -56,6 +111,8 @@ class Rocket:
         self.fuel_consumption_rate = 0.0001  # kg/m
         self.refuel_consumption_rate = 0.1  # kg/kg transferred
         self.speed = 10000  # m/s (36,000 km/h ortalama uzay aracı hızı)
+        self.dry_mass = 5000  # kg, delta-v maliyet modeli için yakıtsız kütle
+        self.specific_impulse = 320  # s, delta-v maliyet modeli için
         
     def calculate_fuel_consumption(self, distance):
         """
@@ -68,28 +125,16 @@ class Rocket:
         return distance * self.fuel_consumption_rate
         
     def calculate_trajectory(self, start_pos, end_pos, gravity_bodies):
-        # Ara kontrol noktaları oluştur
-        control_points = [start_pos]
-        
-        # Yerçekimi etkisini hesaba katarak ara noktaları belirle
-        mid_point = Point3D(
-            (start_pos.x + end_pos.x) / 2,
-            (start_pos.y + end_pos.y) / 2,
-            (start_pos.z + end_pos.z) / 2
+        """
+        İki nokta arasındaki Bezier yörüngesini döndürür. Aynı uç noktalar ve
+        çekim kaynağı konumları için sonuç LRU önbelleğinden gelir.
+        """
+        body_positions = tuple(Point3D.from_array(body.get_position()) for body in gravity_bodies)
+        return _cached_trajectory(
+            Point3D.from_array(start_pos),
+            Point3D.from_array(end_pos),
+            body_positions
         )
-        
-        # Yerçekimi etkisiyle eğrilik ekle
-        for body in gravity_bodies:
-            body_pos = body.get_position()
-            gravity_factor = 1000000  # Yerçekimi etkisinin şiddeti
-            mid_point.x += (body_pos.x - mid_point.x) / gravity_factor
-            mid_point.y += (body_pos.y - mid_point.y) / gravity_factor
-            mid_point.z += (body_pos.z - mid_point.z) / gravity_factor
-        
-        control_points.append(mid_point)
-        control_points.append(end_pos)
-        
-        return BezierTrajectory(control_points)
 
     def has_enough_fuel(self, required_fuel):
         """
@@ -129,4 +174,5 @@ class Satellite:
         return Point3D(x, y, z)
 
     def update_position(self, time_step):
-        self.current_angle += self.orbit_speed * time_step
\ No newline at end of file
+        # orbit_speed çizgisel hızdır (m/s), açısal hız için yarıçapa bölünür
+        self.current_angle += self.orbit_speed / self.orbit_radius * time_step
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Görev animasyonunu ekransız (Agg) olarak PNG karelerine ya da video
+dosyasına çizer; Qt ve canlı pencere gerekmez.
+
+    python offline_render.py gorev.mp4 --satellites 50 --seed 1 --duration 600
+    python offline_render.py kareler/ --timeline templates/timeline.json
+
+Kareler build_timeline() ile önceden örneklenir ve aralıklara bölünerek
+süreç havuzuna dağıtılır. Her işçi şekli ve statik nesneleri bir kez
+kurar, sonra yalnızca hareketli nesneleri günceller (MissionRenderer).
+Video için kareler geçici bir dizine yazılıp ffmpeg ile kodlanır.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+DEFAULT_FPS = 30
+DEFAULT_DPI = 100
+DEFAULT_FIGSIZE = (12, 8)
+FRAME_PATTERN = 'frame_{:06d}.png'
+FFMPEG_PATTERN = 'frame_%06d.png'
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.mov', '.webm', '.gif')
+
+# İşçi sürecinin durumu: zaman çizelgesi ve çizici süreç başına bir kez kurulur
+_worker = {}
+
+
+def read_timeline(manifest_path):
+    """
+    write_timeline() ile yazılmış manifest ve ikili dosyadan zaman
+    çizelgesini okur (çizim için gereken alanlar)
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    bin_path = os.path.join(os.path.dirname(manifest_path), manifest['binary'])
+    data = np.fromfile(bin_path, dtype=np.uint8)
+    timeline = {'path': manifest['path'], 'segments': manifest['segments']}
+    for key, entry in manifest['layout'].items():
+        dtype = np.dtype('<f4' if entry['dtype'] == 'float32' else '<i4')
+        count = int(np.prod(entry['shape']))
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=entry['offset'])
+        timeline[key] = array.reshape(entry['shape'])
+    return timeline
+
+
+def frame_ranges(num_frames, chunks):
+    """Kareleri ardışık ve yaklaşık eşit aralıklara böler"""
+    bounds = np.linspace(0, num_frames, max(1, min(chunks, num_frames)) + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def _init_worker(timeline, figsize, dpi):
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 - '3d' projeksiyonunu kaydeder
+    from renderer import MissionRenderer, leg_frame_ranges
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='3d')
+    _worker['timeline'] = timeline
+    _worker['leg_ranges'] = leg_frame_ranges(timeline['leg'])
+    _worker['canvas'] = canvas
+    _worker['renderer'] = MissionRenderer(ax, canvas)
+
+
+def _render_range(frames, directory):
+    from matplotlib.image import imsave
+
+    start, stop = frames
+    timeline = _worker['timeline']
+    renderer = _worker['renderer']
+    canvas = _worker['canvas']
+    leg_ranges = _worker['leg_ranges']
+    for frame in range(start, stop):
+        renderer.show_frame(timeline, frame, leg_ranges)
+        imsave(os.path.join(directory, FRAME_PATTERN.format(frame)), np.asarray(canvas.buffer_rgba()))
+    return stop - start
+
+
+def render_frames(timeline, directory, workers=None, figsize=DEFAULT_FIGSIZE, dpi=DEFAULT_DPI,
+                  chunks_per_worker=4, progress=None):
+    """
+    Zaman çizelgesinin tüm karelerini PNG olarak yazar
+    Args:
+        timeline: build_timeline() / read_timeline() sonucu
+        directory: Karelerin yazılacağı dizin
+        workers: Süreç sayısı (None ise işlemci sayısı)
+        chunks_per_worker: İşçi başına aralık sayısı; yük dengesi için > 1
+        progress: Tamamlanan her aralıkta (bitti, toplam) ile çağrılır
+    Returns:
+        int: Yazılan kare sayısı
+    """
+    os.makedirs(directory, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    num_frames = len(timeline['times'])
+    ranges = frame_ranges(num_frames, workers * chunks_per_worker)
+
+    done = 0
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(timeline, figsize, dpi)) as executor:
+        for count in executor.map(_render_range, ranges, [directory] * len(ranges)):
+            done += count
+            if progress is not None:
+                progress(done, num_frames)
+    return done
+
+
+def encode_video(directory, output, fps=DEFAULT_FPS, ffmpeg='ffmpeg'):
+    """
+    PNG karelerini ffmpeg ile videoya kodlar
+    Raises:
+        RuntimeError: ffmpeg bulunamazsa ya da hata verirse
+    """
+    executable = shutil.which(ffmpeg)
+    if executable is None:
+        raise RuntimeError("Video için ffmpeg gerekli; kareleri PNG olarak yazmak için dizin verin")
+    command = [executable, '-y', '-loglevel', 'error', '-framerate', str(fps),
+               '-i', os.path.join(directory, FFMPEG_PATTERN)]
+    if not output.lower().endswith('.gif'):
+        # yuv420p için genişlik ve yükseklik çift olmalı
+        command += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p']
+    command.append(output)
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg hatası: {result.stderr.strip()}")
+
+
+def render_timeline(timeline, output, fps=DEFAULT_FPS, workers=None, figsize=DEFAULT_FIGSIZE,
+                    dpi=DEFAULT_DPI, progress=None):
+    """
+    Zaman çizelgesini video dosyasına ya da PNG dizinine çizer
+    Args:
+        output: Uzantısı VIDEO_EXTENSIONS içindeyse video, değilse kare dizini
+    Returns:
+        str: output
+    """
+    if not output.lower().endswith(VIDEO_EXTENSIONS):
+        render_frames(timeline, output, workers, figsize, dpi, progress=progress)
+        return output
+    directory = tempfile.mkdtemp(prefix='mission_frames_',
+                                 dir=os.path.dirname(os.path.abspath(output)))
+    try:
+        render_frames(timeline, directory, workers, figsize, dpi, progress=progress)
+        encode_video(directory, output, fps)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Görev animasyonunu ekransız olarak çizer")
+    parser.add_argument('output', help="Video dosyası (.mp4, .gif, ...) ya da kare dizini")
+    parser.add_argument('--timeline', help="write_timeline() manifesti; verilmezse rota hesaplanır")
+    parser.add_argument('--satellites', type=int, default=10)
+    parser.add_argument('--rocket-fuel', type=float, default=200000)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--catalog', help="Uydu kataloğu (CSV/TLE)")
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--duration', type=float, default=60, help="Video süresi (saniye)")
+    parser.add_argument('--fps', type=int, default=DEFAULT_FPS)
+    parser.add_argument('--workers', type=int, help="Süreç sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI)
+    args = parser.parse_args()
+
+    if args.timeline:
+        timeline = read_timeline(args.timeline)
+    else:
+        from main import Simulation
+        from timeline import build_timeline
+
+        sim = Simulation(num_satellites=args.satellites, rocket_fuel=args.rocket_fuel,
+                         seed=args.seed, catalog_path=args.catalog)
+        sim.aco_options = {'iterations': args.iterations, 'verbose': False}
+        result = sim.calculate_path()
+        if not result['solution']:
+            parser.exit(1, "Geçerli bir rota bulunamadı; çizilecek görev yok\n")
+        timeline = build_timeline(sim.satellites, sim.moon, sim.rocket, result['solution'],
+                                  num_frames=max(2, int(round(args.duration * args.fps))),
+                                  cost_model=result['cost_model'])
+
+    def report(done, total):
+        print(f"\r{done}/{total} kare", end='', flush=True)
+
+    render_timeline(timeline, args.output, args.fps, args.workers, dpi=args.dpi, progress=report)
+    print(f"\n{args.output} yazıldı")
+
+
+if __name__ == '__main__':
+    main()
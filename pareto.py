@@ -0,0 +1,148 @@
+import bisect
+import numpy as np
+
+# Tümü küçültülür; en düşük uydu yakıtı büyütülmek istendiğinden işareti ters
+OBJECTIVES = ('distance', 'time_elapsed', 'total_fuel_consumption', 'min_satellite_fuel')
+DEFAULT_CAPACITY = 100
+
+
+def objective_vector(solution):
+    """Çözümün amaç vektörü (hepsi küçültülecek biçimde)"""
+    fuel_states = solution['fuel_states']
+    return np.array([
+        solution['distance'],
+        solution['time_elapsed'],
+        solution['total_fuel_consumption'],
+        -min(fuel_states) if len(fuel_states) else 0.0
+    ], dtype=np.float64)
+
+
+def crowding_distance(points):
+    """
+    NSGA-II kalabalık mesafesi; uçtaki noktalar sonsuz alır
+    Args:
+        points: (M, K) amaç matrisi
+    """
+    count, dimensions = points.shape
+    distance = np.zeros(count)
+    if count < 3:
+        distance[:] = np.inf
+        return distance
+    for axis in range(dimensions):
+        order = np.argsort(points[:, axis], kind='stable')
+        values = points[order, axis]
+        span = values[-1] - values[0]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+
+def weighted_choice(points, weights):
+    """
+    Amaçlar cephe içinde [0, 1] aralığına ölçeklenir; ağırlıklı toplamı en
+    küçük noktanın indeksi döner
+    """
+    if isinstance(weights, dict):
+        weights = [weights.get(name, 0.0) for name in OBJECTIVES]
+    low = points.min(axis=0)
+    span = points.max(axis=0) - low
+    normalized = (points - low) / np.where(span > 0, span, 1)
+    return int(np.argmin(normalized @ np.asarray(weights, dtype=np.float64)))
+
+
+def select_from_front(front, weights):
+    """
+    Sonuçtaki 'pareto_front' listesinden (ParetoArchive.to_list) ödünleşim
+    seçer; iş sunucusu istemcileri çözücüye ihtiyaç duymadan kullanabilir
+    Returns:
+        dict veya None
+    """
+    if not front:
+        return None
+    points = np.array([[member[name] for name in OBJECTIVES] for member in front], dtype=np.float64)
+    points[:, OBJECTIVES.index('min_satellite_fuel')] *= -1
+    return front[weighted_choice(points, weights)]
+
+
+class ParetoArchive:
+    """
+    Baskın olunmayan çözümler arşivi. Üyeler amaç vektörlerine göre
+    sözlük sırasında tutulur. Yeni noktayı baskılayabilecek üyelerin ilk
+    amacı ondan büyük olamaz, onun baskılayabileceklerinin ilk amacı
+    küçük olamaz; böylece her kontrol bisect ile bulunan tek bir dilimde
+    vektörel yapılır, tüm çiftler karşılaştırılmaz.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.keys = []  # Sıralı amaç tuple'ları
+        self.points = np.empty((0, len(OBJECTIVES)))
+        self.members = []
+
+    def __len__(self):
+        return len(self.members)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def dominated(self, point):
+        """point arşivdeki bir üye tarafından baskılanıyor (ya da eşit) mu"""
+        end = bisect.bisect_right(self.keys, tuple(point))
+        return bool(np.all(self.points[:end] <= point, axis=1).any())
+
+    def add(self, solution):
+        """
+        Çözümü baskın değilse ekler, baskıladığı üyeleri çıkarır
+        Returns:
+            bool: Çözüm arşive girdiyse True
+        """
+        point = objective_vector(solution)
+        if self.dominated(point):
+            return False
+
+        key = tuple(point)
+        start = bisect.bisect_left(self.keys, key)
+        beaten = start + np.flatnonzero(np.all(self.points[start:] >= point, axis=1))
+        for index in beaten[::-1]:
+            del self.keys[index]
+            del self.members[index]
+        self.points = np.delete(self.points, beaten, axis=0)
+
+        position = bisect.bisect_left(self.keys, key)
+        self.keys.insert(position, key)
+        self.members.insert(position, dict(solution))
+        self.points = np.insert(self.points, position, point, axis=0)
+
+        if len(self.members) > self.capacity:
+            self.remove(int(np.argmin(crowding_distance(self.points))))
+        return True
+
+    def remove(self, index):
+        del self.keys[index]
+        del self.members[index]
+        self.points = np.delete(self.points, index, axis=0)
+
+    def select(self, weights):
+        """
+        Ağırlıklara göre arşivden bir ödünleşim seçer; çözücü yeniden çalıştırılmaz
+        Args:
+            weights: OBJECTIVES sırasıyla ağırlıklar ya da ad -> ağırlık sözlüğü
+        Returns:
+            dict veya None: Seçilen üye
+        """
+        if not self.members:
+            return None
+        return self.members[weighted_choice(self.points, weights)]
+
+    def to_list(self):
+        """JSON'a yazılabilir özet: her üye için rota ve amaç değerleri"""
+        return [
+            {
+                'path': list(member['path']),
+                'cost': float(member['cost']),
+                **{name: float(-value if name == 'min_satellite_fuel' else value)
+                   for name, value in zip(OBJECTIVES, point)}
+            }
+            for member, point in zip(self.members, self.points)
+        ]
@@ -0,0 +1,76 @@
+import math
+import numpy as np
+
+DEFAULT_FUEL_BUCKETS = 64
+UNREACHABLE = np.iinfo(np.uint8).max  # Dolu depoyla bile erişilemeyen hedef
+
+
+def orbit_distance_bound(constellation, moon):
+    """
+    Dairesel yörüngedeki iki düğüm arasındaki mesafenin her an geçerli alt
+    sınırı: yörünge yarıçaplarının farkı
+    """
+    radius = np.concatenate(([moon.orbit_radius], constellation.orbit_radius))
+    return np.abs(radius[:, None] - radius[None, :])
+
+
+class ReachabilityIndex:
+    """
+    Yakıt-erişilebilirlik indeksi. Her (kalkış, hedef) çifti için bacağın
+    mümkün olabileceği en düşük yakıt kovası uint8 olarak saklanır; bir
+    düğüm ve yakıt kovası için doğrudan erişilebilen hedefler bu eşikle tek
+    karşılaştırmada bulunur. Gerekli yakıt alt sınırdan hesaplandığından
+    indeks mümkün bir hamleyi asla elemez; kesin kontrol seçimden sonra
+    yapılmaya devam eder.
+    """
+
+    def __init__(self, required_fuel, max_fuel, buckets=DEFAULT_FUEL_BUCKETS):
+        """
+        Args:
+            required_fuel: (N + 1, N + 1) bacak başına gereken en az yakıt (alt sınır)
+            max_fuel: Depo kapasitesi
+            buckets: Yakıt kovası sayısı (en fazla 254)
+        """
+        if not 1 <= buckets < UNREACHABLE:
+            raise ValueError(f"buckets 1 ile {UNREACHABLE - 1} arasında olmalı")
+        self.max_fuel = float(max_fuel)
+        self.buckets = buckets
+        required_fuel = np.asarray(required_fuel, dtype=np.float64)
+
+        # Kova b'nin üst sınırı (b + 1) * max_fuel / buckets; bacak bu sınıra
+        # sığan ilk kovadan itibaren mümkün sayılır
+        first = np.ceil(required_fuel * buckets / self.max_fuel) - 1
+        first = np.clip(first, 0, buckets - 1)
+        first[required_fuel > self.max_fuel] = UNREACHABLE
+        self.first_bucket = first.astype(np.uint8)
+
+        # Ay'da dolu depoyla erişilebilen hedefler (yakıt ikmali üzerinden)
+        self.refuel_reachable = self.first_bucket[0] != UNREACHABLE
+
+    @classmethod
+    def from_table(cls, first_bucket, max_fuel, buckets=DEFAULT_FUEL_BUCKETS):
+        """first_bucket tablosu hazır olan indeks (ör. senaryo önbelleğinden)"""
+        index = cls.__new__(cls)
+        index.max_fuel = float(max_fuel)
+        index.buckets = buckets
+        index.first_bucket = first_bucket
+        index.refuel_reachable = first_bucket[0] != UNREACHABLE
+        return index
+
+    def bucket(self, fuel):
+        return min(self.buckets - 1, max(0, int(math.floor(fuel * self.buckets / self.max_fuel))))
+
+    def direct_mask(self, node, fuel, targets):
+        """node'dan fuel yakıtla doğrudan gidilebilecek olası hedefler"""
+        return self.first_bucket[node, targets] <= self.bucket(fuel)
+
+    def candidate_mask(self, node, fuel, targets):
+        """Doğrudan ya da Ay'da yakıt ikmaliyle gidilebilecek olası hedefler"""
+        return self.direct_mask(node, fuel, targets) | self.refuel_reachable[targets]
+
+    def pruned_fraction(self, node, fuel):
+        """Teşhis için: bu durumda elenen hedeflerin oranı"""
+        targets = np.arange(1, self.first_bucket.shape[1])
+        if not len(targets):
+            return 0.0
+        return 1.0 - float(self.candidate_mask(node, fuel, targets).mean())
@@ -0,0 +1,159 @@
+import numpy as np
+
+EARTH_RADIUS = 6371e3
+VIEW_LIMIT = 450000e3  # 450,000 km
+
+
+def leg_frame_ranges(leg):
+    """
+    Zaman çizelgesinde her bacağın kare aralığı. Kareler zamana göre sıralı
+    olduğundan bir bacağın kareleri ardışıktır.
+    Returns:
+        dict: bacak -> (ilk kare, son kare + 1)
+    """
+    legs, first, counts = np.unique(np.asarray(leg), return_index=True, return_counts=True)
+    return {int(value): (int(start), int(start + count))
+            for value, start, count in zip(legs, first, counts) if value >= 0}
+
+
+class MissionRenderer:
+    """
+    3D görünüm için kalıcı (retained) çizici. Dünya yüzeyi, eksenler ve
+    etiketler bir kez oluşturulur; her karede yalnızca hareketli nesnelerin
+    verisi güncellenir. Arka uç destekliyorsa blitting kullanılır.
+    """
+
+    def __init__(self, ax, canvas, limit=VIEW_LIMIT):
+        self.ax = ax
+        self.canvas = canvas
+        self.background = None
+        self.use_blit = bool(getattr(canvas, 'supports_blit', False))
+
+        self._create_static_artists(limit)
+        self._create_dynamic_artists()
+
+        if self.use_blit:
+            # Görünüm döndürülür veya pencere boyutu değişirse arka planı yenile
+            self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _create_static_artists(self, limit):
+        ax = self.ax
+        u = np.linspace(0, 2 * np.pi, 100)
+        v = np.linspace(0, np.pi, 100)
+        x = EARTH_RADIUS * np.outer(np.cos(u), np.sin(v))
+        y = EARTH_RADIUS * np.outer(np.sin(u), np.sin(v))
+        z = EARTH_RADIUS * np.outer(np.ones(np.size(u)), np.cos(v))
+        ax.plot_surface(x, y, z, color='blue', alpha=0.1)
+
+        ax.set_xlim([-limit, limit])
+        ax.set_ylim([-limit, limit])
+        ax.set_zlim([-limit, limit])
+        ax.set_xlabel('X (km)')
+        ax.set_ylabel('Y (km)')
+        ax.set_zlabel('Z (km)')
+
+    def _create_dynamic_artists(self):
+        ax = self.ax
+        animated = self.use_blit
+        self.moon_artist = ax.scatter([0], [0], [0], color='gray', s=100, label='Moon',
+                                      animated=animated)
+        self.satellite_artist = ax.scatter([], [], [], s=20, depthshade=False, animated=animated)
+        self.rocket_artist = ax.scatter([0], [0], [0], color='yellow', s=100, label='Rocket',
+                                        animated=animated)
+        self.trajectory_artist, = ax.plot([], [], [], 'y--', alpha=0.5, animated=animated)
+        self.title_artist = ax.set_title('', animated=animated)
+        self.dynamic_artists = (self.moon_artist, self.satellite_artist, self.rocket_artist,
+                                self.trajectory_artist, self.title_artist)
+        self._visited_key = None
+
+    def _on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_dynamic_artists()
+
+    def _draw_dynamic_artists(self):
+        for artist in self.dynamic_artists:
+            # draw_artist 3D izdüşümü yapmaz (Axes3D.draw yapar); saçılım
+            # konumları elle izdüşürülmezse ilk karedeki yerlerinde kalır
+            if hasattr(artist, 'do_3d_projection'):
+                artist.do_3d_projection()
+            self.ax.draw_artist(artist)
+
+    def set_satellite_colors(self, num_satellites, path):
+        """Rotadaki uyduları yeşil, diğerlerini kırmızı boyar (yalnızca rota değişince)"""
+        key = (num_satellites, tuple(path or ()))
+        if key == self._visited_key:
+            return
+        self._visited_key = key
+        visited = np.isin(np.arange(1, num_satellites + 1), path or [])
+        colors = np.where(visited[:, None], [0.0, 0.5, 0.0, 1.0], [1.0, 0.0, 0.0, 1.0])
+        self.satellite_artist.set_facecolor(colors)
+        self.satellite_artist.set_edgecolor(colors)
+
+    def update(self, sim):
+        """Simülasyonun güncel durumunu çizer"""
+        moon_pos = sim.moon.get_position()
+        rocket = sim.rocket_position
+        trajectory = None
+        if sim.current_trajectory is not None:
+            trajectory = sim.current_trajectory.sample(50)
+        path_length = len(sim.best_path) if sim.best_path else 0
+        self.show_state(
+            (moon_pos.x, moon_pos.y, moon_pos.z), sim.satellites.positions(),
+            (rocket.x, rocket.y, rocket.z), trajectory, sim.best_path,
+            f'Time: {sim.time/3600:.1f} hours\nVisiting: {sim.current_path_index}/{path_length}'
+        )
+
+    def show_frame(self, timeline, frame, leg_ranges=None):
+        """
+        build_timeline() çıktısının bir karesini çizer. Bacak çizgisi olarak
+        roketin o bacaktaki örnek konumları kullanılır.
+        Args:
+            leg_ranges: leg_frame_ranges() sonucu; çok kare çizilecekse bir
+                kez hesaplanıp verilmeli (None ise her çağrıda hesaplanır)
+        """
+        leg = int(timeline['leg'][frame])
+        trajectory = None
+        if leg >= 0:
+            if leg_ranges is None:
+                leg_ranges = leg_frame_ranges(timeline['leg'])
+            start, stop = leg_ranges[leg]
+            trajectory = timeline['rocket'][start:stop]
+        path = timeline['path']
+        self.show_state(
+            timeline['moon'][frame], timeline['satellites'][frame], timeline['rocket'][frame],
+            trajectory, path,
+            f"Time: {timeline['times'][frame]/3600:.1f} hours\nVisiting: {leg + 1}/{len(path)}"
+        )
+
+    def show_state(self, moon, satellites, rocket, trajectory, path, title):
+        """
+        Args:
+            moon, rocket: (3,) konumlar
+            satellites: (N, 3) konumlar
+            trajectory: (K, 3) bacak noktaları ya da None
+            path: Uyduları boyamak için rota
+        """
+        self.moon_artist._offsets3d = ([moon[0]], [moon[1]], [moon[2]])
+        self.satellite_artist._offsets3d = (satellites[:, 0], satellites[:, 1], satellites[:, 2])
+        self.set_satellite_colors(len(satellites), path)
+        self.rocket_artist._offsets3d = ([rocket[0]], [rocket[1]], [rocket[2]])
+
+        if trajectory is not None:
+            self.trajectory_artist.set_data_3d(trajectory[:, 0], trajectory[:, 1], trajectory[:, 2])
+        else:
+            self.trajectory_artist.set_data_3d([], [], [])
+
+        self.title_artist.set_text(title)
+        self.draw()
+
+    def draw(self):
+        if not self.use_blit:
+            self.canvas.draw_idle()
+            return
+        if self.background is None:
+            # İlk tam çizim arka planı draw_event üzerinden yakalar
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_dynamic_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
@@ -0,0 +1,172 @@
+import numpy as np
+from transfer_cost import create_cost_model
+from distance_tensor import (DistanceTensor, ExactDistances, DEFAULT_BIN_WIDTH, choose_distance_index,
+                             estimate_horizon)
+
+PAD = -1  # Kısa rotaların sonunu dolduran değer
+SATELLITE_FUEL_CONSUMPTION = 0.005  # Uyduların saatlik yakıt tüketimi (çözücüyle aynı)
+FUEL_TOLERANCE = 1e-9  # Kayan nokta yuvarlamasına karşı bağıl pay
+
+
+def pad_routes(routes, pad=PAD):
+    """
+    Rotaları (R, L) boyutlu tamsayı dizisine çevirir
+    Args:
+        routes: Liste listesi (farklı uzunluklarda olabilir) ya da 2 boyutlu dizi
+        pad: Kısa rotaların sonuna eklenen değer
+    Returns:
+        np.ndarray: (R, L) int64 dizi
+    """
+    if isinstance(routes, np.ndarray):
+        if routes.ndim == 1:
+            routes = routes[None, :]
+        return routes.astype(np.int64, copy=False)
+    routes = list(routes)
+    if routes and np.ndim(routes[0]) == 0:  # Tek rota
+        routes = [routes]
+    length = max((len(route) for route in routes), default=0)
+    padded = np.full((len(routes), length), pad, dtype=np.int64)
+    for row, route in enumerate(routes):
+        padded[row, :len(route)] = route
+    return padded
+
+
+class RouteEvaluator:
+    """
+    Verilen rotaları çözücünün mesafe indeksi ve maliyet modeliyle toplu
+    olarak değerlendirir. Rotalar bacak bacak, tüm rotalar için aynı anda
+    ilerletilir; her adımda yalnızca (R,) boyutlu dizi işlemleri yapılır.
+
+    Kurallar çözücüyle aynıdır: rota Ay'da (0) başlar, her bacak kalkış
+    anındaki mesafeyle uçulur, Ay'a varışta depo dolar. Bir bacağın yakıtı
+    roketteki yakıtı aşarsa rota uygulanamaz sayılır.
+    """
+
+    def __init__(self, satellites, moon, rocket, cost_model='linear', distance_index=None,
+                 fuel_consumption_per_hour=SATELLITE_FUEL_CONSUMPTION):
+        """
+        Args:
+            satellites: Constellation
+            cost_model: Model adı ya da hazır maliyet modeli nesnesi
+            distance_index: DistanceTensor / ExactDistances (None ise çözücünün
+                'auto' kuralıyla seçilir)
+        """
+        self.satellites = satellites
+        self.moon = moon
+        self.rocket = rocket
+        self.num_nodes = len(satellites) + 1
+        if isinstance(cost_model, str):
+            cost_model = create_cost_model(cost_model, satellites, moon, rocket)
+        self.cost_model = cost_model
+        if distance_index is None:
+            horizon = estimate_horizon(satellites, moon, rocket)
+            if choose_distance_index('auto', self.num_nodes, horizon) == 'tensor':
+                distance_index = DistanceTensor(satellites, moon, horizon, DEFAULT_BIN_WIDTH)
+            else:
+                distance_index = ExactDistances(satellites, moon)
+        self.distance_index = distance_index
+        self.fuel_consumption_per_hour = fuel_consumption_per_hour
+
+    @classmethod
+    def from_optimizer(cls, aco):
+        """Çözücünün mesafe indeksini ve maliyet modelini paylaşan değerlendirici"""
+        return cls(aco.satellites, aco.moon, aco.rocket, aco.cost_model, aco.distance_index,
+                   aco.fuelConsumptionPerHour)
+
+    @classmethod
+    def exact(cls, satellites, moon, rocket, cost_model='linear'):
+        """Tensör kurmadan her bacağı konumlardan hesaplayan değerlendirici"""
+        return cls(satellites, moon, rocket, cost_model, ExactDistances(satellites, moon))
+
+    def evaluate(self, routes):
+        """
+        Args:
+            routes: Rota listesi ya da PAD ile doldurulmuş (R, L) dizi
+        Returns:
+            dict: Her alan rotalarla aynı sırada bir dizi
+                distance: Toplam mesafe (metre)
+                cost: Maliyet modeline göre rota maliyeti
+                time_elapsed: Görev süresi (saniye)
+                fuel_consumed: Bacaklarda harcanan toplam yakıt
+                fuel_states: (R, N) görev sonunda uyduların yakıt seviyeleri
+                feasible: Rota geçerli ve her bacak mevcut yakıtla uçulabiliyor
+                complete: Her uydu tam olarak bir kez ziyaret ediliyor
+                failed_leg: İlk uygulanamayan bacağın indeksi (yoksa -1)
+        """
+        routes = pad_routes(routes)
+        count, length = routes.shape
+        rows = np.arange(count)
+        present = routes != PAD
+
+        # Yapısal kontroller: Ay'da başlama, düğüm aralığı, ara boşluk olmaması
+        lengths = present.sum(axis=1)
+        valid = (lengths >= 1) & (present == (np.arange(length) < lengths[:, None])).all(axis=1)
+        valid &= (routes[:, 0] == 0) if length else False
+        valid &= ((routes >= 0) & (routes < self.num_nodes) | ~present).all(axis=1)
+        nodes = np.where(valid[:, None] & present, routes, 0)
+
+        # Uydu ziyaret sayıları
+        visits = np.zeros((count, self.num_nodes), dtype=np.int64)
+        np.add.at(visits, (np.repeat(rows, length), nodes.ravel()),
+                  (valid[:, None] & present & (nodes > 0)).ravel().astype(np.int64))
+        repeated = (visits[:, 1:] > 1).any(axis=1)
+        complete = valid & (visits[:, 1:] == 1).all(axis=1)
+
+        distance = np.zeros(count)
+        cost = np.zeros(count)
+        elapsed_time = np.zeros(count)
+        fuel_consumed = np.zeros(count)
+        fuel = np.full(count, float(self.rocket.max_fuel))
+        failed_leg = np.full(count, -1, dtype=np.int64)
+
+        for leg in range(length - 1):
+            active = valid & present[:, leg + 1]
+            if not active.any():
+                break
+            from_nodes = nodes[active, leg]
+            to_nodes = nodes[active, leg + 1]
+            departure = elapsed_time[active]
+            on_board = fuel[active]
+
+            leg_distance = self.distance_index.lookup_pairs(from_nodes, to_nodes, departure)
+            leg_fuel = np.asarray(self.cost_model.fuel(from_nodes, to_nodes, leg_distance,
+                                                       departure, on_board), dtype=np.float64)
+            leg_fuel = np.broadcast_to(leg_fuel, leg_distance.shape)
+
+            short = leg_fuel > on_board * (1 + FUEL_TOLERANCE)
+            failed = np.flatnonzero(active)[short]
+            failed_leg[failed[failed_leg[failed] < 0]] = leg
+
+            distance[active] += leg_distance
+            cost[active] += self.cost_model.leg_cost(leg_distance, leg_fuel)
+            fuel_consumed[active] += leg_fuel
+            elapsed_time[active] = departure + leg_distance / self.rocket.speed
+            # Ay'a varışta depo dolar; yetmeyen bacaktan sonra depo boş sayılır
+            fuel[active] = np.where(to_nodes == 0, float(self.rocket.max_fuel),
+                                    np.maximum(on_board - leg_fuel, 0))
+
+        fuel_states = self.satellites.fuel_at(elapsed_time[:, None], self.fuel_consumption_per_hour)
+        return {
+            'distance': distance,
+            'cost': cost,
+            'time_elapsed': elapsed_time,
+            'fuel_consumed': fuel_consumed,
+            'fuel_states': fuel_states,
+            'feasible': valid & ~repeated & (failed_leg < 0),
+            'complete': complete,
+            'failed_leg': failed_leg
+        }
+
+    def evaluate_route(self, route):
+        """Tek rota için evaluate(); alanlar dizi yerine tekil değerlerdir"""
+        result = self.evaluate([route])
+        return {
+            'distance': float(result['distance'][0]),
+            'cost': float(result['cost'][0]),
+            'time_elapsed': float(result['time_elapsed'][0]),
+            'fuel_consumed': float(result['fuel_consumed'][0]),
+            'fuel_states': result['fuel_states'][0].tolist(),
+            'feasible': bool(result['feasible'][0]),
+            'complete': bool(result['complete'][0]),
+            'failed_leg': int(result['failed_leg'][0])
+        }
@@ -0,0 +1,214 @@
+"""
+Senaryo tabloları için içerik adresli disk önbelleği.
+
+Aynı filo üzerinde ACO parametreleri taranırken mesafe tensörü ve
+erişilebilirlik indeksi her çalışmada yeniden hesaplanmaz. Anahtar,
+tabloyu belirleyen her şeyin (yörünge geometrisi, Ay, roket, tablo
+parametreleri) SHA-256 özetidir; her kayıt bir dizindir ve dizilerini
+bellek eşlemeli .npy dosyaları olarak tutar.
+
+Kayıt geçici bir dizinde hazırlanıp tek bir rename ile yerine konur;
+okuyucular yarım yazılmış bir kaydı hiç görmez. Boyut sınırı aşılınca en
+uzun süredir kullanılmayan kayıtlar silinir. Aynı dizini kullanan işçi
+süreçleri bir kilit dosyası (fcntl) üzerinden eşgüdümlenir.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import uuid
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: kilit yok, atomik rename yine geçerli
+    fcntl = None
+
+SCENARIO_CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scenario_cache')
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+META_NAME = 'meta.json'
+LOCK_NAME = '.lock'
+TMP_PREFIX = '.tmp-'
+
+
+def scenario_key(constellation, moon, rocket=None, **params):
+    """
+    Senaryo tablosunun içerik anahtarı. Uyduların yakıtı konumları ve
+    bacak maliyetlerini etkilemediğinden anahtara girmez; yalnızca yakıtı
+    farklı senaryolar aynı kaydı paylaşır.
+    Args:
+        params: Tabloyu belirleyen ek değerler (JSON'a yazılabilir olmalı)
+    Returns:
+        str: Onaltılık SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{SCENARIO_CACHE_VERSION}".encode())
+    for name in ('orbit_radius', 'angle', 'inclination'):
+        digest.update(np.ascontiguousarray(getattr(constellation, name), dtype=np.float64).tobytes())
+    description = {
+        'moon': [moon.orbit_radius, moon.orbital_period, moon.current_angle],
+        'rocket': None if rocket is None else {
+            name: getattr(rocket, name)
+            for name in ('max_fuel', 'speed', 'fuel_consumption_rate', 'dry_mass', 'specific_impulse')
+        },
+        'params': params
+    }
+    digest.update(json.dumps(description, sort_keys=True, default=float).encode())
+    return digest.hexdigest()
+
+
+class ScenarioCache:
+    """
+    Anahtar -> {ad: dizi} eşlemesi tutan disk önbelleği. Okunan diziler
+    salt okunur bellek eşlemeli (np.memmap) döner; birden çok süreç aynı
+    sayfaları paylaşır.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key)
+
+    @contextlib.contextmanager
+    def lock(self, exclusive=True):
+        """Dizin çapında kilit: okuyucular paylaşımlı, yazma/silme özel"""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, LOCK_NAME), 'a+b') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def get(self, key):
+        """
+        Kaydı bellek eşlemeli olarak açar ve son kullanım zamanını günceller
+        Returns:
+            dict veya None: Ad -> salt okunur dizi
+        """
+        path = self.entry_path(key)
+        # Açık bir memmap, kayıt daha sonra silinse de geçerli kalır;
+        # kilit yalnızca açma sırasında silinmeye karşı tutulur
+        with self.lock(exclusive=False):
+            meta_path = os.path.join(path, META_NAME)
+            if not os.path.exists(meta_path):
+                self.misses += 1
+                return None
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r')
+                      for name in meta['arrays']}
+            os.utime(meta_path)
+        self.hits += 1
+        return arrays
+
+    def put(self, key, arrays):
+        """
+        Kaydı atomik olarak yazar. Aynı anahtarı başka bir süreç önce
+        yazdıysa onun kaydı korunur (içerik aynıdır).
+        Returns:
+            dict: get(key) sonucu
+        """
+        tmp_path = os.path.join(self.directory, f"{TMP_PREFIX}{key}-{uuid.uuid4().hex}")
+        os.makedirs(tmp_path)
+        try:
+            for name, array in arrays.items():
+                with open(os.path.join(tmp_path, f"{name}.npy"), 'wb') as f:
+                    np.save(f, array)
+                    f.flush()
+                    os.fsync(f.fileno())
+            with open(os.path.join(tmp_path, META_NAME), 'w', encoding='utf-8') as f:
+                json.dump({'version': SCENARIO_CACHE_VERSION, 'arrays': list(arrays)}, f)
+            with self.lock():
+                if not os.path.exists(self.entry_path(key)):
+                    os.rename(tmp_path, self.entry_path(key))
+        finally:
+            if os.path.exists(tmp_path):
+                shutil.rmtree(tmp_path, ignore_errors=True)
+        self.evict(keep=key)
+        return self.get(key)
+
+    def get_or_build(self, key, build):
+        """
+        Kayıt varsa okur, yoksa build() ile hesaplayıp yazar
+        Args:
+            build: Argümansız, ad -> dizi sözlüğü döndüren fonksiyon
+        """
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = self.put(key, build())
+        return arrays
+
+    def entries(self):
+        """
+        Returns:
+            list: (son kullanım zamanı, bayt, anahtar) üçlüleri, eskiden yeniye
+        """
+        entries = []
+        for key in os.listdir(self.directory):
+            path = self.entry_path(key)
+            if key.startswith('.') or not os.path.isdir(path):
+                continue
+            try:
+                used = os.stat(os.path.join(path, META_NAME)).st_mtime
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+            except FileNotFoundError:  # Başka bir süreç sildi
+                continue
+            entries.append((used, size, key))
+        entries.sort()
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        """
+        Toplam boyut sınırın altına inene kadar en eski kayıtları siler
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        removed = []
+        with self.lock():
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, key in entries:
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                # Önce adı değiştirilir; silme kilit dışında yapılır
+                doomed = os.path.join(self.directory, f"{TMP_PREFIX}{key}-{uuid.uuid4().hex}")
+                os.rename(self.entry_path(key), doomed)
+                removed.append(doomed)
+                total -= size
+        for path in removed:
+            shutil.rmtree(path, ignore_errors=True)
+        return len(removed)
+
+    def clear(self):
+        with self.lock():
+            keys = [key for _, _, key in self.entries()]
+            for key in keys:
+                shutil.rmtree(self.entry_path(key), ignore_errors=True)
+
+
+def open_cache(cache):
+    """
+    ACO'nun 'scenario_cache' seçeneğini çözer
+    Args:
+        cache: None/False, True (varsayılan dizin), dizin yolu ya da ScenarioCache
+    """
+    if not cache:
+        return None
+    if isinstance(cache, ScenarioCache):
+        return cache
+    return ScenarioCache(DEFAULT_CACHE_DIR if cache is True else cache)
@@ -0,0 +1,235 @@
+import errno
+import functools
+import gzip
+import http.server
+import json
+import os
+import queue
+import threading
+
+DEFAULT_PORT = 8000
+GZIP_MIN_SIZE = 1024  # Bundan küçük dosyalar sıkıştırılmaz
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+STATIC_MAX_AGE = 3600  # static/ altındaki dosyalar için önbellek süresi (saniye)
+KEEPALIVE_INTERVAL = 15  # SSE bağlantısını açık tutma aralığı (saniye)
+
+
+class _ViewerRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Statik dosyaları önbellek başlıkları ve gzip ile, /events'i SSE olarak sunar"""
+
+    def log_message(self, format, *args):
+        # Sunucu loglarını devre dışı bırak
+        pass
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] == '/events':
+            self.handle_events()
+            return
+
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            super().do_GET()
+            return
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        cache_control = self.cache_control(path)
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            self.end_headers()
+            return
+
+        ctype = self.guess_type(path)
+        if ctype.startswith('text/') or ctype in ('application/javascript', 'application/json'):
+            ctype += '; charset=utf-8'
+
+        use_gzip = ('gzip' in self.headers.get('Accept-Encoding', '')
+                    and stat.st_size >= GZIP_MIN_SIZE
+                    and ctype.startswith(COMPRESSIBLE_TYPES))
+        body = self.server.read_file(path, stat, use_gzip)
+
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def cache_control(self, path):
+        # Kütüphane ve stil dosyaları uzun süre, üretilen veriler her seferinde doğrulanır
+        relative = os.path.relpath(path, self.directory)
+        if relative.startswith('static' + os.sep):
+            return f'public, max-age={STATIC_MAX_AGE}'
+        return 'no-cache'
+
+    def handle_events(self):
+        """Server-Sent Events akışı: optimizasyon ilerlemesini tarayıcıya iletir"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        subscriber = self.server.subscribe()
+        try:
+            while True:
+                try:
+                    message = subscriber.get(timeout=KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    message = ': keepalive\n\n'
+                if message is None:  # Sunucu kapanıyor
+                    break
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.unsubscribe(subscriber)
+
+
+class _ViewerHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, handler):
+        super().__init__(address, handler)
+        self.subscribers = set()
+        self.subscribers_lock = threading.Lock()
+        self.gzip_cache = {}
+        self.gzip_cache_lock = threading.Lock()
+
+    def read_file(self, path, stat, use_gzip):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not use_gzip:
+            return data
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self.gzip_cache_lock:
+            compressed = self.gzip_cache.get(key)
+        if compressed is None:
+            compressed = gzip.compress(data, compresslevel=6)
+            with self.gzip_cache_lock:
+                # Aynı dosyanın eski sürümlerini at
+                for old_key in [k for k in self.gzip_cache if k[0] == path]:
+                    del self.gzip_cache[old_key]
+                self.gzip_cache[key] = compressed
+        return compressed
+
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=256)
+        with self.subscribers_lock:
+            self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.subscribers_lock:
+            self.subscribers.discard(subscriber)
+
+    def broadcast(self, message):
+        with self.subscribers_lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # Yavaş istemci: en eski mesajı at, en güncelini koru
+                try:
+                    subscriber.get_nowait()
+                    subscriber.put_nowait(message)
+                except (queue.Empty, queue.Full):
+                    pass
+
+
+class VisualizationServer:
+    """
+    Görüntüleyici için gömülü, çok iş parçacıklı HTTP sunucusu.
+    Bir kez başlatılır; statik dosyaları sunar ve /events üzerinden canlı
+    optimizasyon ilerlemesi yayınlar.
+    """
+
+    def __init__(self, root_dir, host='127.0.0.1', port=DEFAULT_PORT):
+        self.root_dir = root_dir
+        self.host = host
+        self.port = port
+        self.httpd = None
+        self.thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self):
+        return self.httpd is not None
+
+    def start(self):
+        """Sunucuyu başlatır; zaten çalışıyorsa bir şey yapmaz"""
+        with self._lock:
+            if self.httpd is not None:
+                return self
+            handler = functools.partial(_ViewerRequestHandler, directory=self.root_dir)
+            try:
+                httpd = _ViewerHTTPServer((self.host, self.port), handler)
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE:
+                    raise
+                # Port doluysa işletim sisteminin seçtiği boş bir porta geç
+                httpd = _ViewerHTTPServer((self.host, 0), handler)
+            self.port = httpd.server_address[1]
+            self.httpd = httpd
+            self.thread = threading.Thread(target=httpd.serve_forever, name='viewer-server', daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        with self._lock:
+            if self.httpd is None:
+                return
+            self.httpd.broadcast(None)
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+            self.thread = None
+
+    def url(self, path='/'):
+        return f"http://localhost:{self.port}/{path.lstrip('/')}"
+
+    def publish(self, event, data):
+        """Bağlı tüm tarayıcılara bir SSE olayı gönderir (thread-safe)"""
+        if self.httpd is None:
+            return
+        payload = json.dumps(json_safe(data), default=float)
+        self.httpd.broadcast(f"event: {event}\ndata: {payload}\n\n")
+
+
+def json_safe(value):
+    # JavaScript JSON.parse NaN/Infinity kabul etmez
+    if isinstance(value, float) and (value != value or value in (float('inf'), float('-inf'))):
+        return None
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    return value
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def get_server(root_dir=None, port=DEFAULT_PORT):
+    """Süreç başına tek görüntüleyici sunucusunu döndürür, gerekirse başlatır"""
+    global _server
+    with _server_lock:
+        if _server is None:
+            if root_dir is None:
+                root_dir = os.path.dirname(os.path.abspath(__file__))
+            _server = VisualizationServer(root_dir, port=port)
+        return _server.start()
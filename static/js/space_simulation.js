@@ -7,13 +7,23 @@ class SpaceSimulation {
             logarithmicDepthBuffer: true 
         });
         this.clock = new THREE.Clock();
-        this.rocketTrail = [];
         this.maxTrailLength = 50;
+        this.trailHead = 0;   // Halka tampondaki bir sonraki yazma konumu
+        this.trailCount = 0;
+        
+        // Her karede yeniden kullanılan geçici vektörler
+        this.previousPosition = new THREE.Vector3();
+        this.direction = new THREE.Vector3();
+        this.upAxis = new THREE.Vector3(0, 1, 0);
         this.isPlaying = false;
-        this.isFirstMove = true;
         
         this.rocketStartPosition = new THREE.Vector3(384400000, 0, 0);
         
+        // Python tarafında önceden hesaplanmış zaman çizelgesi
+        this.timeline = null;
+        this.frame = 0;
+        this.framesPerSecond = 30;  // Oynatma hızı (kare/saniye)
+        
         this.pathSolution = null;
         this.currentNodeIndex = 0;
         this.totalDistance = 0;
@@ -91,45 +101,10 @@ class SpaceSimulation {
         this.moon.receiveShadow = true;
         this.scene.add(this.moon);
 
-        // Satellites with glow effect
-        this.satellites = [];
-        for (let i = 0; i < 10; i++) {
-            const satGeometry = new THREE.SphereGeometry(200000, 16, 16);
-            const satMaterial = new THREE.MeshPhongMaterial({
-                color: 0x00ff00,
-                emissive: 0x00ff00,
-                emissiveIntensity: 0.5,
-                shininess: 50
-            });
-            const satellite = new THREE.Mesh(satGeometry, satMaterial);
-            
-            // Glow effect
-            const glowGeometry = new THREE.SphereGeometry(250000, 16, 16);
-            const glowMaterial = new THREE.MeshPhongMaterial({
-                color: 0x00ff00,
-                transparent: true,
-                opacity: 0.3,
-                side: THREE.BackSide
-            });
-            const glow = new THREE.Mesh(glowGeometry, glowMaterial);
-            satellite.add(glow);
-            
-            // Orbit parameters ve yakıt değeri
-            const orbitRadius = 42164000 + (Math.random() - 0.5) * 2000000;
-            const inclination = (Math.random() - 0.5) * Math.PI / 32;
-            const phase = Math.random() * Math.PI * 2;
-            const fuel = 60 + Math.random() * 40; // 60-100 arası rastgele yakıt değeri
-            
-            satellite.userData = { 
-                orbitRadius, 
-                inclination, 
-                phase,
-                fuel  // Yakıt değerini ekledik
-            };
-            
-            this.satellites.push(satellite);
-            this.scene.add(satellite);
-        }
+        // Uydular zaman çizelgesi yüklendiğinde oluşturulur
+        this.satelliteMesh = null;
+        this.satelliteGlow = null;
+        this.satelliteCount = 0;
 
         // Rocket with engine glow
         const rocketGeometry = new THREE.ConeGeometry(300000, 1000000, 8);
@@ -156,6 +131,99 @@ class SpaceSimulation {
         this.rocket.position.copy(this.rocketStartPosition);
         
         this.scene.add(this.rocket);
+        
+        this.createRocketTrail();
+    }
+
+    // Tüm uydular tek bir InstancedMesh ile çizilir; parlama efekti aynı
+    // örnek matrislerini paylaşan ikinci bir InstancedMesh'tir
+    createSatellites(count) {
+        this.disposeSatellites();
+        this.satelliteCount = count;
+        if (count === 0) return;
+        
+        const satGeometry = new THREE.SphereGeometry(200000, 16, 16);
+        const satMaterial = new THREE.MeshPhongMaterial({
+            color: 0xffffff,
+            emissive: 0x222222,
+            emissiveIntensity: 0.5,
+            shininess: 50
+        });
+        this.satelliteMesh = new THREE.InstancedMesh(satGeometry, satMaterial, count);
+        this.satelliteMesh.instanceMatrix.setUsage(THREE.DynamicDrawUsage);
+        this.satelliteMesh.frustumCulled = false;  // Örnekler tüm sahneye yayılır
+        
+        const glowGeometry = new THREE.SphereGeometry(250000, 16, 16);
+        const glowMaterial = new THREE.MeshPhongMaterial({
+            color: 0x00ff00,
+            transparent: true,
+            opacity: 0.3,
+            side: THREE.BackSide
+        });
+        this.satelliteGlow = new THREE.InstancedMesh(glowGeometry, glowMaterial, count);
+        this.satelliteGlow.instanceMatrix = this.satelliteMesh.instanceMatrix;
+        this.satelliteGlow.frustumCulled = false;
+        
+        // Yalnızca öteleme içeren birim matrisler
+        const matrices = this.satelliteMesh.instanceMatrix.array;
+        for (let i = 0; i < count; i++) {
+            const m = i * 16;
+            matrices[m] = matrices[m + 5] = matrices[m + 10] = matrices[m + 15] = 1;
+        }
+        
+        this.scene.add(this.satelliteMesh);
+        this.scene.add(this.satelliteGlow);
+    }
+
+    disposeSatellites() {
+        [this.satelliteMesh, this.satelliteGlow].forEach(mesh => {
+            if (!mesh) return;
+            this.scene.remove(mesh);
+            mesh.geometry.dispose();
+            mesh.material.dispose();
+            if (mesh.dispose) mesh.dispose();
+        });
+        this.satelliteMesh = null;
+        this.satelliteGlow = null;
+        this.satelliteCount = 0;
+    }
+
+    setSatelliteColors(visited) {
+        if (!this.satelliteMesh) return;
+        const color = new THREE.Color();
+        for (let i = 0; i < this.satelliteCount; i++) {
+            color.setHex(visited.has(i + 1) ? 0x00ff00 : 0xff0000);
+            this.satelliteMesh.setColorAt(i, color);
+        }
+        this.satelliteMesh.instanceColor.needsUpdate = true;
+    }
+
+    // Roket izi: sabit boyutlu halka tampon, tek BufferGeometry + Points
+    createRocketTrail() {
+        const positions = new Float32Array(this.maxTrailLength * 3);
+        const colors = new Float32Array(this.maxTrailLength * 3);
+        const geometry = new THREE.BufferGeometry();
+        geometry.setAttribute('position', new THREE.BufferAttribute(positions, 3).setUsage(THREE.DynamicDrawUsage));
+        geometry.setAttribute('color', new THREE.BufferAttribute(colors, 3).setUsage(THREE.DynamicDrawUsage));
+        geometry.setDrawRange(0, 0);
+        
+        const material = new THREE.PointsMaterial({
+            size: 200000,
+            vertexColors: true,
+            transparent: true,
+            opacity: 0.8,
+            blending: THREE.AdditiveBlending,
+            depthWrite: false
+        });
+        this.rocketTrail = new THREE.Points(geometry, material);
+        this.rocketTrail.frustumCulled = false;
+        this.scene.add(this.rocketTrail);
+    }
+
+    clearRocketTrail() {
+        this.trailHead = 0;
+        this.trailCount = 0;
+        this.rocketTrail.geometry.setDrawRange(0, 0);
     }
 
     setupLights() {
@@ -201,24 +269,13 @@ class SpaceSimulation {
         
         document.getElementById('reset').addEventListener('click', () => {
             this.clock.stop();
-            this.clock.start();
             this.isPlaying = false;
-            
-            // Reset positions
-            this.moon.position.set(384400000, 0, 0);
-            this.rocket.position.set(0, 0, 0);
+            this.frame = 0;
             
             // Clear rocket trail
-            this.rocketTrail.forEach(point => {
-                this.scene.remove(point);
-            });
-            this.rocketTrail = [];
+            this.clearRocketTrail();
             
-            // Reset satellites
-            this.satellites.forEach(sat => {
-                const { orbitRadius } = sat.userData;
-                sat.position.set(orbitRadius, 0, 0);
-            });
+            this.applyFrame(0);
             
             // Reset camera
             this.camera.position.set(0, 200000000, 200000000);
@@ -228,99 +285,83 @@ class SpaceSimulation {
     }
 
     updateRocketTrail() {
-        // Add current position to trail
-        if (this.rocketTrail.length >= this.maxTrailLength) {
-            const oldPoint = this.rocketTrail.shift();
-            this.scene.remove(oldPoint);
+        // Add current position to trail (en eski noktanın üzerine yazılır)
+        const geometry = this.rocketTrail.geometry;
+        const positions = geometry.attributes.position.array;
+        const colors = geometry.attributes.color.array;
+        const p = this.rocket.position;
+        
+        positions[this.trailHead * 3] = p.x;
+        positions[this.trailHead * 3 + 1] = p.y;
+        positions[this.trailHead * 3 + 2] = p.z;
+        this.trailHead = (this.trailHead + 1) % this.maxTrailLength;
+        this.trailCount = Math.min(this.trailCount + 1, this.maxTrailLength);
+        
+        // Fade out trail points (eski noktalar daha koyu)
+        for (let i = 0; i < this.trailCount; i++) {
+            const age = (this.trailHead - 1 - i + this.maxTrailLength) % this.maxTrailLength;
+            const fade = 1 - i / this.trailCount;
+            colors[age * 3] = 1.0 * fade;
+            colors[age * 3 + 1] = 0.2 * fade;
+            colors[age * 3 + 2] = 0.0;
         }
         
-        const trailGeometry = new THREE.SphereGeometry(100000, 8, 8);
-        const trailMaterial = new THREE.MeshPhongMaterial({
-            color: 0xff3300,
-            emissive: 0xff3300,
-            transparent: true,
-            opacity: 0.5
-        });
-        const trailPoint = new THREE.Mesh(trailGeometry, trailMaterial);
-        trailPoint.position.copy(this.rocket.position);
-        this.scene.add(trailPoint);
-        this.rocketTrail.push(trailPoint);
-        
-        // Fade out trail points
-        this.rocketTrail.forEach((point, index) => {
-            point.material.opacity = 0.5 * (index / this.rocketTrail.length);
-        });
+        geometry.setDrawRange(0, this.trailCount);
+        geometry.attributes.position.needsUpdate = true;
+        geometry.attributes.color.needsUpdate = true;
+    }
+
+    // Python (z yukarı) koordinatlarını three.js (y yukarı) sistemine çevirir
+    setFromArray(object, array, offset) {
+        object.position.set(array[offset], array[offset + 2], -array[offset + 1]);
+    }
+
+    applyFrame(index) {
+        const tl = this.timeline;
+        if (!tl) return;
+        
+        const frame = Math.min(index, tl.numFrames - 1);
+        
+        // Örnek matrislerinin öteleme sütununu doğrudan diziden yaz
+        if (this.satelliteMesh) {
+            const matrices = this.satelliteMesh.instanceMatrix.array;
+            const src = tl.satellites;
+            let offset = frame * tl.numSatellites * 3;
+            for (let i = 0; i < this.satelliteCount; i++, offset += 3) {
+                const m = i * 16;
+                matrices[m + 12] = src[offset];
+                matrices[m + 13] = src[offset + 2];
+                matrices[m + 14] = -src[offset + 1];
+            }
+            this.satelliteMesh.instanceMatrix.needsUpdate = true;
+        }
+        this.setFromArray(this.moon, tl.moon, frame * 3);
+        
+        this.previousPosition.copy(this.rocket.position);
+        this.setFromArray(this.rocket, tl.rocket, frame * 3);
+        
+        // Roketin yönünü hareket yönüne çevir
+        this.direction.subVectors(this.rocket.position, this.previousPosition);
+        if (this.direction.lengthSq() > 0) {
+            this.rocket.quaternion.setFromUnitVectors(this.upAxis, this.direction.normalize());
+        }
+        
+        this.currentNodeIndex = Math.max(tl.leg[frame], 0);
+        this.missionTime = tl.times[frame];
     }
 
     updateObjects() {
-        if (!this.isPlaying) return;
+        if (!this.isPlaying || !this.timeline) return;
         
+        const delta = this.clock.getDelta();
         const time = this.clock.getElapsedTime();
-
+        
+        // Oynatma yalnızca dizi indeksini ilerletir, fizik yeniden hesaplanmaz
+        this.frame = Math.min(this.frame + delta * this.framesPerSecond, this.timeline.numFrames - 1);
+        this.applyFrame(Math.floor(this.frame));
+        
         // Update Earth rotation
         this.earth.rotation.y = time * 0.1;
-
-        // Update Moon position and rotation
-        const moonAngle = time * 0.05;
-        this.moon.position.x = Math.cos(moonAngle) * 384400000;
-        this.moon.position.z = Math.sin(moonAngle) * 384400000;
-        this.moon.rotation.y = moonAngle;
-
-        // Update Satellites
-        this.satellites.forEach(sat => {
-            const { orbitRadius, inclination, phase } = sat.userData;
-            const angle = time * 0.1 + phase;
-            
-            sat.position.x = orbitRadius * Math.cos(angle);
-            sat.position.y = orbitRadius * Math.sin(angle) * Math.sin(inclination);
-            sat.position.z = orbitRadius * Math.sin(angle) * Math.cos(inclination);
-            
-            // Rotate satellite
-            sat.rotation.y += 0.01;
-        });
-
-        // Update Rocket position and trail
-        if (this.pathSolution) {
-            if (this.isFirstMove) {
-                this.rocket.position.copy(this.moon.position);
-                this.isFirstMove = false;
-            } else {
-                const currentNode = this.pathSolution[this.currentNodeIndex];
-                const nextNode = this.pathSolution[this.currentNodeIndex + 1];
-                
-                if (nextNode !== undefined) {
-                    let startPos = currentNode === 0 ? this.moon.position : this.satellites[currentNode - 1].position;
-                    let endPos = nextNode === 0 ? this.moon.position : this.satellites[nextNode - 1].position;
-                    
-                    const progress = (time * 0.1) % 1; // Daha yavaş hareket
-                    
-                    // Daha karmaşık yörünge hesaplaması
-                    const distance = startPos.distanceTo(endPos);
-                    const midHeight = distance * 0.2; // Yörünge yüksekliği
-                    
-                    // İki kontrol noktası kullan
-                    const control1 = new THREE.Vector3().copy(startPos).add(
-                        new THREE.Vector3(0, midHeight, 0)
-                    );
-                    const control2 = new THREE.Vector3().copy(endPos).add(
-                        new THREE.Vector3(0, midHeight, 0)
-                    );
-                    
-                    // Cubic Bezier eğrisi
-                    this.rocket.position.x = this.cubicBezier(startPos.x, control1.x, control2.x, endPos.x, progress);
-                    this.rocket.position.y = this.cubicBezier(startPos.y, control1.y, control2.y, endPos.y, progress);
-                    this.rocket.position.z = this.cubicBezier(startPos.z, control1.z, control2.z, endPos.z, progress);
-                    
-                    // Roketin yönünü hareket yönüne çevir
-                    const tangent = this.calculateTangent(startPos, control1, control2, endPos, progress);
-                    this.rocket.quaternion.setFromUnitVectors(new THREE.Vector3(0, 1, 0), tangent.normalize());
-                    
-                    if (progress >= 0.99) {
-                        this.currentNodeIndex++;
-                    }
-                }
-            }
-        }
         
         // Update rocket trail
         this.updateRocketTrail();
@@ -345,7 +386,7 @@ class SpaceSimulation {
     }
 
     updateMissionInfo() {
-        const time = this.clock.getElapsedTime();
+        const time = this.missionTime || 0;
         let infoText = `
             <b>Simülasyon Zamanı:</b> ${(time/3600).toFixed(1)} saat<br>
         `;
@@ -362,11 +403,11 @@ class SpaceSimulation {
                 infoText += `<br>
                     <b>Mevcut Rota:</b> ${this.pathSolution.join(' → ')}<br>
                     <b>Şu anki Hareket:</b> ${fromInfo} → ${toInfo}<br>
-                    <b>Segment Mesafesi:</b> ${currentSegment.distance.toFixed(0)} km<br>
+                    <b>Segment Mesafesi:</b> ${(currentSegment.distance/1000).toFixed(0)} km<br>
                     <b>Gerekli Yakıt:</b> ${currentSegment.fuel_required.toFixed(1)} birim<br>
                     <b>Tahmini Süre:</b> ${(currentSegment.estimated_time/3600).toFixed(1)} saat<br>
-                    <b>Mevcut Konum Yakıt:</b> ${fromNode === 0 ? "-" : this.satellites[fromNode-1].userData.fuel.toFixed(1)}%<br>
-                    <b>Hedef Konum Yakıt:</b> ${toNode === 0 ? "-" : this.satellites[toNode-1].userData.fuel.toFixed(1)}%<br>
+                    <b>Mevcut Konum Yakıt:</b> ${fromNode === 0 ? "-" : this.satelliteFuel(fromNode - 1, time).toFixed(1)}%<br>
+                    <b>Hedef Konum Yakıt:</b> ${toNode === 0 ? "-" : this.satelliteFuel(toNode - 1, time).toFixed(1)}%<br>
                     <b>Toplam İlerleme:</b> ${((this.currentNodeIndex / (this.pathSolution.length-1)) * 100).toFixed(1)}%<br>
                     <b>Toplam Mesafe:</b> ${(this.totalDistance/1000).toFixed(0)} km<br>
                     <b>Toplam Yakıt Tüketimi:</b> ${this.totalFuelConsumption.toFixed(1)} birim<br>
@@ -378,7 +419,69 @@ class SpaceSimulation {
         document.getElementById('mission-info').innerHTML = infoText;
     }
 
-    // Yeni metod: Simülasyon sonuçlarını ayarla
+    // Optimizasyon ilerlemesini sunucudan Server-Sent Events ile dinler
+    connectProgressStream(url) {
+        if (!window.EventSource) return;
+        const panel = document.getElementById('optimization-info');
+        const formatRoute = (route) => {
+            if (!route) return '-';
+            const text = route.join(' → ');
+            return text.length > 120 ? text.slice(0, 120) + ' …' : text;
+        };
+        
+        this.progressSource = new EventSource(url);
+        this.progressSource.addEventListener('progress', (event) => {
+            const data = JSON.parse(event.data);
+            const cost = data.best_cost === null ? '-' : (data.best_cost / 1000).toFixed(0) + ' km';
+            panel.innerHTML = `<br>
+                <b>Optimizasyon:</b> İterasyon ${data.iteration}/${data.iterations}<br>
+                <b>En İyi Maliyet:</b> ${cost}<br>
+                <b>En İyi Rota:</b> ${formatRoute(data.best_path)}`;
+        });
+        this.progressSource.addEventListener('finished', (event) => {
+            const data = JSON.parse(event.data);
+            const cost = data.best_cost === null ? '-' : (data.best_cost / 1000).toFixed(0) + ' km';
+            panel.innerHTML = `<br>
+                <b>Optimizasyon tamamlandı</b><br>
+                <b>En İyi Maliyet:</b> ${cost}<br>
+                <b>En İyi Rota:</b> ${formatRoute(data.best_path)}`;
+        });
+    }
+
+    satelliteFuel(index, time) {
+        const tl = this.timeline;
+        return Math.max(tl.initialFuel[index] - (time / 3600) * tl.fuelConsumptionPerHour, 0);
+    }
+
+    // Python tarafının yazdığı manifest ve ikili zaman çizelgesini yükler
+    async loadTimeline(manifestUrl) {
+        const manifest = await (await fetch(manifestUrl, { cache: 'no-cache' })).json();
+        const binaryUrl = new URL(manifest.binary, new URL(manifestUrl, window.location.href));
+        const buffer = await (await fetch(binaryUrl, { cache: 'no-cache' })).arrayBuffer();
+        
+        const view = (key) => {
+            const entry = manifest.layout[key];
+            const length = entry.shape.reduce((a, b) => a * b, 1);
+            const ArrayType = entry.dtype === 'int32' ? Int32Array : Float32Array;
+            return new ArrayType(buffer, entry.offset, length);
+        };
+        
+        this.timeline = {
+            numFrames: manifest.num_frames,
+            numSatellites: manifest.num_satellites,
+            times: view('times'),
+            satellites: view('satellites'),
+            moon: view('moon'),
+            rocket: view('rocket'),
+            leg: view('leg'),
+            initialFuel: manifest.initial_fuel,
+            fuelConsumptionPerHour: manifest.fuel_consumption_per_hour
+        };
+        this.setSimulationResult(manifest);
+        this.frame = 0;
+        this.applyFrame(0);
+    }
+
     setSimulationResult(data) {
         if (!data) return;  // Veri kontrolü
         
@@ -389,66 +492,9 @@ class SpaceSimulation {
         this.totalFuelConsumption = data.total_fuel_consumption || 0;
         this.totalTime = data.total_time || 0;
         
-        // Uyduları güncelle
-        if (data.satellites && Array.isArray(data.satellites)) {
-            data.satellites.forEach((satData, index) => {
-                const satellite = this.satellites[index];
-                if (satellite && satData) {
-                    // Uydu özelliklerini güncelle
-                    satellite.userData = {
-                        id: satData.id,
-                        orbitRadius: satData.orbit_radius,
-                        inclination: satData.inclination,
-                        phase: satData.initial_angle,
-                        fuel: satData.fuel,
-                        originalFuel: satData.fuel
-                    };
-                    
-                    // Uyduları renklendir
-                    if (this.pathSolution.includes(satData.id)) {
-                        satellite.material.color.setHex(0x00ff00);
-                        satellite.material.emissive.setHex(0x00ff00);
-                    } else {
-                        satellite.material.color.setHex(0xff0000);
-                        satellite.material.emissive.setHex(0xff0000);
-                    }
-                }
-            });
-        }
-    }
-
-    // Yardımcı metodlar
-    cubicBezier(p0, p1, p2, p3, t) {
-        const oneMinusT = 1 - t;
-        return Math.pow(oneMinusT, 3) * p0 +
-               3 * Math.pow(oneMinusT, 2) * t * p1 +
-               3 * oneMinusT * Math.pow(t, 2) * p2 +
-               Math.pow(t, 3) * p3;
-    }
-
-    calculateTangent(p0, p1, p2, p3, t) {
-        const oneMinusT = 1 - t;
-        return new THREE.Vector3(
-            3 * Math.pow(oneMinusT, 2) * (p1.x - p0.x) +
-            6 * oneMinusT * t * (p2.x - p1.x) +
-            3 * Math.pow(t, 2) * (p3.x - p2.x),
-            3 * Math.pow(oneMinusT, 2) * (p1.y - p0.y) +
-            6 * oneMinusT * t * (p2.y - p1.y) +
-            3 * Math.pow(t, 2) * (p3.y - p2.y),
-            3 * Math.pow(oneMinusT, 2) * (p1.z - p0.z) +
-            6 * oneMinusT * t * (p2.z - p1.z) +
-            3 * Math.pow(t, 2) * (p3.z - p2.z)
-        );
+        // Uyduları oluştur ve rotadakileri yeşil, diğerlerini kırmızı renklendir
+        this.createSatellites(data.num_satellites || 0);
+        this.setSatelliteColors(new Set(this.pathSolution));
+        this.clearRocketTrail();
     }
 }
-
-// Simülasyonu başlat
-window.onload = () => {
-    const simulation = new SpaceSimulation();
-    
-    // Test için örnek bir çözüm
-    // Bu kısmı interface.py'dan gelen gerçek verilerle değiştireceğiz
-    window.setSimulationPath = function(path, distance) {
-        simulation.setSimulationResult(path, distance);
-    };
-}; 
\ No newline at end of file
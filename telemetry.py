@@ -0,0 +1,122 @@
+import math
+import numpy as np
+
+TELEMETRY_METRICS = ('best_so_far', 'iteration_best', 'mean', 'worst', 'entropy', 'stagnation')
+
+
+class DecimatedHistory:
+    """
+    Sabit kapasiteli, min/max seyreltmeli zaman serisi. Kapasite dolduğunda
+    komşu kova çiftleri birleştirilir ve kova genişliği iki katına çıkar;
+    böylece bellek iterasyon sayısından bağımsız kalır.
+    """
+
+    def __init__(self, metrics, capacity=512):
+        if capacity < 2 or capacity % 2:
+            raise ValueError("capacity çift ve en az 2 olmalı")
+        self.metrics = tuple(metrics)
+        self.capacity = capacity
+        self.stride = 1  # Kova başına iterasyon sayısı
+        self.size = 0
+        self.iterations = np.zeros(capacity, dtype=np.int64)  # Kovanın ilk iterasyonu
+        self.counts = np.zeros(capacity, dtype=np.int64)
+        self.minimum = np.zeros((capacity, len(self.metrics)))
+        self.maximum = np.zeros((capacity, len(self.metrics)))
+        self.last = np.zeros((capacity, len(self.metrics)))
+
+    def append(self, iteration, values):
+        values = np.asarray(values, dtype=np.float64)
+        last = self.size - 1
+        if self.size and self.counts[last] < self.stride:
+            # Geçerli karıncası olmayan iterasyonlar NaN kaydeder; fmin/fmax onları atlar
+            np.fmin(self.minimum[last], values, out=self.minimum[last])
+            np.fmax(self.maximum[last], values, out=self.maximum[last])
+            self.last[last] = values
+            self.counts[last] += 1
+            return
+
+        if self.size == self.capacity:
+            self._compact()
+        index = self.size
+        self.iterations[index] = iteration
+        self.counts[index] = 1
+        self.minimum[index] = values
+        self.maximum[index] = values
+        self.last[index] = values
+        self.size += 1
+
+    def _compact(self):
+        half = self.capacity // 2
+        self.iterations[:half] = self.iterations[0::2]
+        self.counts[:half] = self.counts[0::2] + self.counts[1::2]
+        self.minimum[:half] = np.fmin(self.minimum[0::2], self.minimum[1::2])
+        self.maximum[:half] = np.fmax(self.maximum[0::2], self.maximum[1::2])
+        self.last[:half] = self.last[1::2]
+        self.size = half
+        self.stride *= 2
+
+    def series(self, metric, kind='last'):
+        """Bir metriğin kova dizisini döndürür (kind: 'min', 'max' veya 'last')"""
+        column = self.metrics.index(metric)
+        source = {'min': self.minimum, 'max': self.maximum, 'last': self.last}[kind]
+        return source[:self.size, column]
+
+    def to_dict(self):
+        result = {
+            'stride': self.stride,
+            'iteration': self.iterations[:self.size].tolist()
+        }
+        for metric in self.metrics:
+            result[metric] = {
+                'min': self.series(metric, 'min').tolist(),
+                'max': self.series(metric, 'max').tolist(),
+                'last': self.series(metric, 'last').tolist()
+            }
+        return result
+
+
+def pheromone_entropy(pheromones):
+    """
+    Feromon matrisinin satır bazında normalize edilmiş Shannon entropisi.
+    1 tekdüze (keşif), 0'a yakın değerler tek kenara yakınsamış koloni demektir.
+    """
+    matrix = np.asarray(pheromones, dtype=np.float64)
+    n = matrix.shape[1]
+    if n < 2:
+        return 0.0
+    probabilities = matrix / matrix.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(probabilities > 0, probabilities * np.log(probabilities), 0.0)
+    return float(-terms.sum(axis=1).mean() / math.log(n))
+
+
+class ConvergenceTelemetry:
+    """Her iterasyonun yakınsama ölçümlerini sabit bellekle kaydeder"""
+
+    def __init__(self, capacity=512):
+        self.history = DecimatedHistory(TELEMETRY_METRICS, capacity)
+        self.latest = None
+
+    def record(self, iteration, costs, best_cost, pheromones, stagnation):
+        """
+        Args:
+            iteration: İterasyon numarası (1 tabanlı)
+            costs: Bu iterasyondaki geçerli karınca çözümlerinin maliyetleri
+            best_cost: Şimdiye kadarki en iyi maliyet
+            pheromones: Güncel feromon matrisi
+            stagnation: Durağanlık sayacı
+        """
+        if len(costs):
+            costs = np.asarray(costs, dtype=np.float64)
+            iteration_best, mean, worst = costs.min(), costs.mean(), costs.max()
+        else:
+            iteration_best = mean = worst = float('nan')
+        best = best_cost if best_cost is not None else float('nan')
+        values = (best, iteration_best, mean, worst, pheromone_entropy(pheromones), stagnation)
+        self.history.append(iteration, values)
+        self.latest = {'iteration': iteration}
+        self.latest.update({name: float(value) for name, value in zip(TELEMETRY_METRICS, values)})
+        return self.latest
+
+    def to_dict(self):
+        return self.history.to_dict()
@@ -1,7 +0,0 @@
-if (typeof window.setSimulationPath === "function") {
-    window.setSimulationPath({"path": [0, 10, 8, 5, 9, 6, 7, 4, 1, 3, 2], "cost": 856086956.3752592, "satellites": [{"id": 1, "orbit_radius": 42599163.063635826, "inclination": -0.0012976541880632619, "initial_angle": 0.0, "fuel": 64.16206841472741, "position": {"x": 42599163.063635826, "y": 0.0, "z": -0.0}}, {"id": 2, "orbit_radius": 42469905.372342266, "inclination": -0.015483586124693131, "initial_angle": 0.6283185307179586, "fuel": 61.07746860542144, "position": {"x": 34358875.19572078, "y": 24960191.74906592, "z": -386504.1661508819}}, {"id": 3, "orbit_radius": 42487088.33564043, "inclination": -0.005854810137762784, "initial_angle": 1.2566370614359172, "fuel": 69.12204581476487, "position": {"x": 13129232.337222494, "y": 40406929.65956137, "z": -236577.60461178076}}, {"id": 4, "orbit_radius": 42440553.01136156, "inclination": -0.016179492635159373, "initial_angle": 1.8849555921538759, "fuel": 71.33729240542243, "position": {"x": -13114852.13118157, "y": 40358081.53218535, "z": -653030.2664600344}}, {"id": 5, "orbit_radius": 42350409.27755767, "inclination": 0.006311193112469564, "initial_angle": 2.5132741228718345, "fuel": 63.2378861070674, "position": {"x": -34262200.82427859, "y": 24892450.24610538, "z": 157103.14641802586}}, {"id": 6, "orbit_radius": 41779507.893644646, "inclination": -0.011689905682282096, "initial_angle": 3.141592653589793, "fuel": 63.7439410294255, "position": {"x": -41779507.893644646, "y": 5.116164469384181e-09, "z": -5.9810204559433e-11}}, {"id": 7, "orbit_radius": 42379225.153201066, "inclination": -0.015728459647705896, "initial_angle": 3.7699111843077517, "fuel": 60.96967850429083, "position": {"x": -34285513.3573819, "y": -24906802.45332045, "z": 391777.9444627644}}, {"id": 8, "orbit_radius": 41764260.73437413, "inclination": -0.01463067518974823, "initial_angle": 4.39822971502571, "fuel": 74.42118795070004, "position": {"x": -12905866.324427933, "y": -39715921.2118673, "z": 581112.2073495662}}, {"id": 9, "orbit_radius": 42033099.31528783, "inclination": -0.00538117995615791, "initial_angle": 5.026548245743669, "fuel": 70.14398700127062, "position": {"x": 12988942.014673898, "y": -39975274.21294158, "z": 215116.2207210807}}, {"id": 10, "orbit_radius": 41986440.186280504, "inclination": 0.0021700481624512638, "initial_angle": 5.654866776461628, "fuel": 64.14358567265509, "position": {"x": 33967743.64400816, "y": -24678952.229703348, "z": -53554.59900213186}}], "segments": [{"from_node": 0, "to_node": 10, "distance": 351300184.8078117, "fuel_required": 351300.1848078117, "estimated_time": 35130.01848078117}, {"from_node": 10, "to_node": 8, "distance": 49230565.19682378, "fuel_required": 49230.56519682379, "estimated_time": 4923.056519682378}, {"from_node": 8, "to_node": 5, "distance": 68047883.65118083, "fuel_required": 68047.88365118083, "estimated_time": 6804.788365118084}, {"from_node": 5, "to_node": 9, "distance": 80252698.03314228, "fuel_required": 80252.69803314228, "estimated_time": 8025.269803314229}, {"from_node": 9, "to_node": 6, "distance": 67805987.41076106, "fuel_required": 67805.98741076107, "estimated_time": 6780.598741076105}, {"from_node": 6, "to_node": 7, "distance": 26012732.50767849, "fuel_required": 26012.73250767849, "estimated_time": 2601.273250767849}, {"from_node": 7, "to_node": 4, "distance": 68620649.97210158, "fuel_required": 68620.64997210159, "estimated_time": 6862.064997210158}, {"from_node": 4, "to_node": 1, "distance": 68798638.6683325, "fuel_required": 68798.63866833251, "estimated_time": 6879.8638668332505}, {"from_node": 1, "to_node": 3, "distance": 50012525.93596273, "fuel_required": 50012.52593596273, "estimated_time": 5001.252593596273}, {"from_node": 3, "to_node": 2, "distance": 26254940.98162819, "fuel_required": 26254.94098162819, "estimated_time": 2625.4940981628192}], "total_fuel_consumption": 856336.807165423, "total_time": 85633.68071654232});
-} else {
-    setTimeout(() => {
-        window.setSimulationPath({"path": [0, 10, 8, 5, 9, 6, 7, 4, 1, 3, 2], "cost": 856086956.3752592, "satellites": [{"id": 1, "orbit_radius": 42599163.063635826, "inclination": -0.0012976541880632619, "initial_angle": 0.0, "fuel": 64.16206841472741, "position": {"x": 42599163.063635826, "y": 0.0, "z": -0.0}}, {"id": 2, "orbit_radius": 42469905.372342266, "inclination": -0.015483586124693131, "initial_angle": 0.6283185307179586, "fuel": 61.07746860542144, "position": {"x": 34358875.19572078, "y": 24960191.74906592, "z": -386504.1661508819}}, {"id": 3, "orbit_radius": 42487088.33564043, "inclination": -0.005854810137762784, "initial_angle": 1.2566370614359172, "fuel": 69.12204581476487, "position": {"x": 13129232.337222494, "y": 40406929.65956137, "z": -236577.60461178076}}, {"id": 4, "orbit_radius": 42440553.01136156, "inclination": -0.016179492635159373, "initial_angle": 1.8849555921538759, "fuel": 71.33729240542243, "position": {"x": -13114852.13118157, "y": 40358081.53218535, "z": -653030.2664600344}}, {"id": 5, "orbit_radius": 42350409.27755767, "inclination": 0.006311193112469564, "initial_angle": 2.5132741228718345, "fuel": 63.2378861070674, "position": {"x": -34262200.82427859, "y": 24892450.24610538, "z": 157103.14641802586}}, {"id": 6, "orbit_radius": 41779507.893644646, "inclination": -0.011689905682282096, "initial_angle": 3.141592653589793, "fuel": 63.7439410294255, "position": {"x": -41779507.893644646, "y": 5.116164469384181e-09, "z": -5.9810204559433e-11}}, {"id": 7, "orbit_radius": 42379225.153201066, "inclination": -0.015728459647705896, "initial_angle": 3.7699111843077517, "fuel": 60.96967850429083, "position": {"x": -34285513.3573819, "y": -24906802.45332045, "z": 391777.9444627644}}, {"id": 8, "orbit_radius": 41764260.73437413, "inclination": -0.01463067518974823, "initial_angle": 4.39822971502571, "fuel": 74.42118795070004, "position": {"x": -12905866.324427933, "y": -39715921.2118673, "z": 581112.2073495662}}, {"id": 9, "orbit_radius": 42033099.31528783, "inclination": -0.00538117995615791, "initial_angle": 5.026548245743669, "fuel": 70.14398700127062, "position": {"x": 12988942.014673898, "y": -39975274.21294158, "z": 215116.2207210807}}, {"id": 10, "orbit_radius": 41986440.186280504, "inclination": 0.0021700481624512638, "initial_angle": 5.654866776461628, "fuel": 64.14358567265509, "position": {"x": 33967743.64400816, "y": -24678952.229703348, "z": -53554.59900213186}}], "segments": [{"from_node": 0, "to_node": 10, "distance": 351300184.8078117, "fuel_required": 351300.1848078117, "estimated_time": 35130.01848078117}, {"from_node": 10, "to_node": 8, "distance": 49230565.19682378, "fuel_required": 49230.56519682379, "estimated_time": 4923.056519682378}, {"from_node": 8, "to_node": 5, "distance": 68047883.65118083, "fuel_required": 68047.88365118083, "estimated_time": 6804.788365118084}, {"from_node": 5, "to_node": 9, "distance": 80252698.03314228, "fuel_required": 80252.69803314228, "estimated_time": 8025.269803314229}, {"from_node": 9, "to_node": 6, "distance": 67805987.41076106, "fuel_required": 67805.98741076107, "estimated_time": 6780.598741076105}, {"from_node": 6, "to_node": 7, "distance": 26012732.50767849, "fuel_required": 26012.73250767849, "estimated_time": 2601.273250767849}, {"from_node": 7, "to_node": 4, "distance": 68620649.97210158, "fuel_required": 68620.64997210159, "estimated_time": 6862.064997210158}, {"from_node": 4, "to_node": 1, "distance": 68798638.6683325, "fuel_required": 68798.63866833251, "estimated_time": 6879.8638668332505}, {"from_node": 1, "to_node": 3, "distance": 50012525.93596273, "fuel_required": 50012.52593596273, "estimated_time": 5001.252593596273}, {"from_node": 3, "to_node": 2, "distance": 26254940.98162819, "fuel_required": 26254.94098162819, "estimated_time": 2625.4940981628192}], "total_fuel_consumption": 856336.807165423, "total_time": 85633.68071654232});
-    }, 1000);
-}
@@ -0,0 +1,25 @@
+import numpy as np
+from catalog import load_catalog
+
+TLE = """SAT-1
+1 00001U
+2 1 0.1 10.0 0.0 0.0 20.0 1.0027
+SAT-2
+1 00002U
+2 2 0.2 40.0 0.0 0.0 50.0 1.0027
+"""
+
+
+def test_default_fuel_is_part_of_cache_key(tmp_path):
+    catalog = tmp_path / 'fleet.tle'
+    catalog.write_text(TLE)
+    cache_dir = str(tmp_path / 'cache')
+
+    first = load_catalog(str(catalog), cache_dir=cache_dir, default_fuel=50.0)
+    second = load_catalog(str(catalog), cache_dir=cache_dir, default_fuel=80.0)
+    again = load_catalog(str(catalog), cache_dir=cache_dir, default_fuel=50.0)
+
+    assert np.all(first.fuel == 50.0)
+    assert np.all(second.fuel == 80.0)
+    assert np.all(again.fuel == 50.0)
+    assert np.array_equal(first.orbit_radius, second.orbit_radius)
@@ -0,0 +1,44 @@
+import itertools
+from ant_colony import AntColonyOptimization
+from checkpoint import load_checkpoint, resume_optimization
+from constellation import Constellation
+from models import Moon, Rocket
+
+NUM_ANTS = 8
+
+
+def optimize(options, stop_after=None):
+    # Küçük arşiv: kalabalık mesafesiyle üye atma da devam sırasında tekrarlanmalı
+    options = dict({'num_ants': NUM_ANTS, 'iterations': 8, 'verbose': False, 'seed': 4,
+                    'multi_objective': True, 'pareto_capacity': 3}, **options)
+    aco = AntColonyOptimization(Constellation.random_geo(8, 4), Moon(), Rocket(60000), options)
+    if stop_after is not None:
+        # Durdurma isteği iterasyonun ortasında, belirli bir karıncadan sonra gelir
+        construct_solution = aco.construct_solution
+        calls = itertools.count(1)
+
+        def construct():
+            if next(calls) == stop_after:
+                aco.request_stop()
+            return construct_solution()
+        aco.construct_solution = construct
+    return aco.optimize()
+
+
+def test_resume_after_mid_iteration_stop_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / 'run.ckpt')
+    uninterrupted = optimize({})
+
+    stopped = optimize({'checkpoint_path': path, 'checkpoint_every': 100},
+                       stop_after=3 * NUM_ANTS + 4)
+    assert stopped['stopped']
+    state = load_checkpoint(path)
+    assert state['iteration'] == 3
+    # Yarım iterasyonun karıncaları kayıtlı arşive girmemeli
+    assert state['pareto_archive'].to_list() == optimize({'iterations': 3})['pareto_front']
+
+    resumed = resume_optimization(path, {'verbose': False})
+    assert not resumed['stopped']
+    assert resumed['solution'] == uninterrupted['solution']
+    assert resumed['cost'] == uninterrupted['cost']
+    assert resumed['pareto_front'] == uninterrupted['pareto_front']
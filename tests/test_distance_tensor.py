@@ -0,0 +1,37 @@
+import pytest
+from ant_colony import AntColonyOptimization
+from constellation import Constellation
+from distance_tensor import DistanceTensor, ExactDistances, choose_distance_index
+from main import Simulation
+from models import Moon, Rocket
+
+
+def test_tensor_refuses_to_exceed_max_bytes():
+    constellation = Constellation.random_geo(100, 1)
+    bin_bytes = 101 * 101 * 4
+    with pytest.raises(ValueError):
+        DistanceTensor(constellation, Moon(), 36000, max_bytes=bin_bytes)
+    tensor = DistanceTensor(constellation, Moon(), 36000, max_bytes=3 * bin_bytes)
+    assert tensor.nbytes <= 3 * bin_bytes
+
+
+def test_auto_falls_back_to_exact_for_large_tensors():
+    assert choose_distance_index('auto', 11, 36000) == 'tensor'
+    assert choose_distance_index('auto', 1001, 1e6) == 'exact'
+    assert choose_distance_index('tensor', 1001, 1e6) == 'tensor'
+    with pytest.raises(ValueError):
+        choose_distance_index('grid', 11, 36000)
+
+
+def test_optimizer_uses_exact_distances_above_threshold():
+    options = {'verbose': False, 'reachability': False, 'seed_heuristics': False}
+    aco = AntColonyOptimization(Constellation.random_geo(1000, 1), Moon(), Rocket(200000), options)
+    assert isinstance(aco.distance_index, ExactDistances)
+
+
+def test_simulation_passes_bin_width_only_through_distance_bin_width():
+    # Animasyon adımı (Simulation.time_step) tensör kova genişliği değildir
+    sim = Simulation(num_satellites=5, seed=1)
+    assert 'time_step' not in sim.solver_options()
+    sim.aco_options = {'distance_bin_width': 1800}
+    assert sim.solver_options()['distance_bin_width'] == 1800
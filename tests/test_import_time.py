@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('matplotlib', 'mpl_toolkits', 'PyQt5', 'scipy')
+# Ölçülen değer ~0.1 s; yavaş CI makineleri için geniş pay
+MAX_IMPORT_SECONDS = 1.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{'elapsed': elapsed, 'heavy': heavy}}))
+"""
+
+
+def probe(module):
+    """Modülü temiz bir yorumlayıcıda içe aktarır"""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_main_import_skips_plotting_and_qt():
+    result = probe('main')
+    assert result['heavy'] == []
+    assert result['elapsed'] < MAX_IMPORT_SECONDS
+
+
+def test_solver_core_imports_only_numpy():
+    for module in ('models', 'ant_colony'):
+        assert probe(module)['heavy'] == []
@@ -0,0 +1,104 @@
+import json
+import os
+import queue
+import time
+import urllib.error
+import urllib.request
+import pytest
+from job_server import JobControl, JobScheduler, JobServer, _run_job, validate_job_request
+
+# BaseManager sunucusu durdurulurken thread içinde sys.exit(0) çağırır; uyarı
+# thread'in bittiği sonraki teste de düşebildiğinden modül genelinde susturulur
+pytestmark = pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+
+
+def test_catalog_path_rejected_without_catalog_dir(tmp_path):
+    catalog = tmp_path / 'fleet.csv'
+    catalog.write_text('id,orbit_radius,initial_angle,inclination,fuel\n')
+    with pytest.raises(ValueError):
+        validate_job_request({'scenario': {'catalog_path': str(catalog)}})
+
+
+def test_catalog_path_confined_to_catalog_dir(tmp_path):
+    allowed = tmp_path / 'catalogs'
+    allowed.mkdir()
+    (allowed / 'fleet.csv').write_text('id,orbit_radius,initial_angle,inclination,fuel\n')
+    (tmp_path / 'secret.txt').write_text('gizli')
+
+    scenario, _, _ = validate_job_request({'scenario': {'catalog_path': 'fleet.csv'}}, str(allowed))
+    assert scenario['catalog_path'] == os.path.realpath(allowed / 'fleet.csv')
+    for path in ('../secret.txt', str(tmp_path / 'secret.txt')):
+        with pytest.raises(ValueError):
+            validate_job_request({'scenario': {'catalog_path': path}}, str(allowed))
+
+
+def test_running_job_without_final_event_fails_after_budget():
+    scheduler = JobScheduler(num_workers=0, grace_period=0).start()
+    try:
+        job = scheduler.submit({}, {}, 0.5)
+        # Uzak bir işçi işi alıp sonra kopmuş gibi
+        scheduler.events.put(('started', job['id'], {'worker': 'remote'}))
+        deadline = time.time() + 10
+        while scheduler.get(job['id'])['status'] != 'failed' and time.time() < deadline:
+            time.sleep(0.2)
+        assert scheduler.get(job['id'])['status'] == 'failed'
+        assert scheduler.control.is_cancelled(job['id'])
+    finally:
+        scheduler.stop()
+
+
+def test_bad_catalog_fails_job_without_killing_worker(tmp_path):
+    catalog = tmp_path / 'broken.csv'
+    catalog.write_text('id,orbit_radius\nsat-1,abc\n')
+    events = queue.Queue()
+    task = {'id': 'job-1', 'scenario': {'catalog_path': str(catalog)}, 'options': {},
+            'time_budget': 5}
+
+    _run_job(task, events, JobControl(), 'local-0')
+
+    assert events.get_nowait()[0] == 'started'
+    kind, job_id, payload = events.get_nowait()
+    assert (kind, job_id) == ('failed', 'job-1')
+    assert 'Katalog' in payload['error']
+
+
+@pytest.mark.parametrize('request_body', [
+    {'scenario': {'num_satellites': True}},
+    {'scenario': {'num_satellites': 100000}},
+    {'scenario': {'seed': False}},
+    {'scenario': {'rocket_fuel': float('inf')}},
+    {'options': {'iterations': 10 ** 9}},
+    {'options': {'num_ants': 0}},
+    {'options': {'telemetry_points': 10 ** 7}},
+    {'options': {'evaporation_rate': 1}},
+    {'options': {'evaporation_rate': 0}},
+    {'options': {'alpha': True}},
+    {'time_budget': True},
+])
+def test_out_of_range_values_rejected(request_body):
+    with pytest.raises(ValueError):
+        validate_job_request(request_body)
+
+
+def test_limits_accept_typical_request():
+    scenario, options, time_budget = validate_job_request({
+        'scenario': {'num_satellites': 50, 'rocket_fuel': 200000, 'seed': 1},
+        'options': {'iterations': 200, 'num_ants': 50, 'evaporation_rate': 0.1, 'alpha': 1.0},
+        'time_budget': 60
+    })
+    assert scenario['num_satellites'] == 50 and options['iterations'] == 200
+    assert time_budget == 60.0
+
+
+def test_http_rejects_out_of_range_values_with_400():
+    server = JobServer(JobScheduler(num_workers=0), port=0).start()
+    try:
+        body = json.dumps({'scenario': {'num_satellites': 100000}}).encode('utf-8')
+        request = urllib.request.Request(server.url('/jobs'), data=body, method='POST',
+                                         headers={'Content-Type': 'application/json'})
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request, timeout=5)
+        assert error.value.code == 400
+        assert server.scheduler.list() == []
+    finally:
+        server.stop()
@@ -0,0 +1,30 @@
+import numpy as np
+from matplotlib.image import imread
+
+from offline_render import FRAME_PATTERN, render_frames
+
+
+def moving_timeline(num_frames=20):
+    """Roket Ay'da bekler, bacak çizgisi yok: kareler yalnızca işaretçilerin konumuyla ayrışır"""
+    angles = np.linspace(0, np.pi, num_frames)
+    ring = np.stack([np.cos(angles), np.sin(angles), np.zeros(num_frames)], axis=1)
+    moon = 3.8e8 * ring
+    satellites = np.stack([1.0e8 * ring, 2.0e8 * ring[:, [1, 0, 2]]], axis=1)
+    return {
+        'times': np.linspace(0, 3600, num_frames),
+        'satellites': satellites,
+        'moon': moon,
+        'rocket': moon.copy(),
+        'leg': np.full(num_frames, -1, dtype=np.int32),
+        'path': []
+    }
+
+
+def test_first_and_last_frames_differ(tmp_path):
+    assert render_frames(moving_timeline(), str(tmp_path), workers=1, figsize=(4, 3), dpi=50) == 20
+
+    first = imread(str(tmp_path / FRAME_PATTERN.format(0)))
+    last = imread(str(tmp_path / FRAME_PATTERN.format(19)))
+    # Başlıktaki saat her karede değişir; yalnızca altındaki çizim alanı karşılaştırılır
+    plot_area = slice(first.shape[0] // 5, None)
+    assert not np.array_equal(first[plot_area], last[plot_area])
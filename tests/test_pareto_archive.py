@@ -0,0 +1,33 @@
+import numpy as np
+from ant_colony import AntColonyOptimization
+from constellation import Constellation
+from models import Moon, Rocket
+
+
+def test_archive_members_share_one_fuel_measure():
+    # Kısıtlı yakıt: karınca rotaları Ay dönüşleri içerir
+    options = {'num_ants': 10, 'iterations': 3, 'verbose': False, 'seed': 2,
+               'multi_objective': True, 'seed_heuristics': True}
+    aco = AntColonyOptimization(Constellation.random_geo(12, 5), Moon(), Rocket(90000), options)
+    aco.optimize()
+
+    members = list(aco.pareto_archive)
+    assert members
+    evaluation = aco.evaluate_routes([member['path'] for member in members])
+    for row, member in enumerate(members):
+        assert np.isclose(member['total_fuel_consumption'], evaluation['fuel_consumed'][row])
+        assert np.isclose(member['time_elapsed'], evaluation['time_elapsed'][row])
+        assert np.allclose(member['fuel_states'], evaluation['fuel_states'][row])
+
+
+def test_single_objective_run_skips_archive():
+    options = {'num_ants': 10, 'iterations': 3, 'verbose': False, 'seed': 2, 'seed_heuristics': True}
+    aco = AntColonyOptimization(Constellation.random_geo(12, 5), Moon(), Rocket(90000), options)
+    rescored = []
+    evaluate_routes = aco.evaluate_routes
+    aco.evaluate_routes = lambda routes: rescored.append(routes) or evaluate_routes(routes)
+    result = aco.optimize()
+
+    assert result['solution']
+    assert rescored == []
+    assert result['pareto_front'] == []
@@ -0,0 +1,38 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+
+from renderer import MissionRenderer, leg_frame_ranges
+
+
+def test_leg_frame_ranges_match_mask():
+    leg = np.array([-1, 0, 0, 0, 1, 1, 2, 2, 2, 2, -1], dtype=np.int32)
+    ranges = leg_frame_ranges(leg)
+    assert set(ranges) == {0, 1, 2}
+    for value, (start, stop) in ranges.items():
+        assert np.array_equal(np.flatnonzero(leg == value), np.arange(start, stop))
+
+
+def render(renderer, canvas, offset):
+    satellites = np.array([[1.0e8, 0.0, 0.0], [0.0, 1.5e8, 0.0], [0.0, 0.0, 2.0e8]]) + offset
+    renderer.show_state((3.8e8 - offset, 0.0, 0.0), satellites, (offset, offset, 0.0),
+                        None, [1], 'frame')
+    return np.array(canvas.buffer_rgba())
+
+
+def test_blitted_frames_move_3d_markers():
+    fig = Figure(figsize=(4, 3), dpi=50)
+    canvas = FigureCanvasAgg(fig)
+    renderer = MissionRenderer(fig.add_subplot(111, projection='3d'), canvas)
+    assert renderer.use_blit
+
+    render(renderer, canvas, 0.0)  # İlk kare tam çizim yapar
+    first = render(renderer, canvas, 0.0)
+    moved = render(renderer, canvas, 1.5e8)
+    back = render(renderer, canvas, 0.0)
+    assert not np.array_equal(first, moved)
+    assert np.array_equal(first, back)
@@ -0,0 +1,31 @@
+import math
+import numpy as np
+from telemetry import ConvergenceTelemetry, DecimatedHistory
+
+
+def test_nan_iteration_does_not_poison_merged_buckets():
+    history = DecimatedHistory(('cost',), capacity=4)
+    for iteration, value in enumerate([math.nan, 5, 3, 4, 2, 1, 6, 7, 8, 9], start=1):
+        history.append(iteration, [value])
+
+    minimum = history.series('cost', 'min')
+    maximum = history.series('cost', 'max')
+    assert not np.isnan(minimum).any()
+    assert not np.isnan(maximum).any()
+    # İlk kova 1-4. iterasyonlar: NaN atlanır, gerçek değerler korunur
+    assert minimum[0] == 3 and maximum[0] == 5
+
+
+def test_run_whose_first_iteration_is_empty():
+    telemetry = ConvergenceTelemetry(capacity=4)
+    pheromones = np.ones((3, 3))
+    telemetry.record(1, [], None, pheromones, 0)  # Geçerli karınca yok
+    for iteration in range(2, 11):
+        costs = [100.0 - iteration, 110.0 - iteration]
+        telemetry.record(iteration, costs, min(costs), pheromones, 0)
+
+    series = telemetry.to_dict()
+    for metric in ('iteration_best', 'mean', 'worst', 'best_so_far'):
+        assert not any(math.isnan(value) for value in series[metric]['min'])
+        assert not any(math.isnan(value) for value in series[metric]['max'])
+    assert series['worst']['max'][0] == 108.0
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+from constellation import Constellation
+from models import Moon, Rocket
+from route_evaluator import RouteEvaluator
+from timeline import build_timeline
+
+
+@pytest.mark.parametrize('cost_model', ['linear', 'delta_v'])
+def test_leg_fuel_matches_route_evaluator(cost_model):
+    satellites = Constellation.random_geo(6, 3)
+    moon, rocket = Moon(), Rocket(200000)
+    path = [0, 1, 2, 0, 3, 4, 5, 6]  # Ay dönüşünde depo dolar
+
+    timeline = build_timeline(satellites, moon, rocket, path, num_frames=10, cost_model=cost_model)
+    evaluation = RouteEvaluator.exact(satellites, moon, rocket, cost_model).evaluate([path])
+
+    fuel = [segment['fuel_required'] for segment in timeline['segments']]
+    assert np.isclose(sum(fuel), evaluation['fuel_consumed'][0])
+    assert np.isclose(timeline['times'][-1], evaluation['time_elapsed'][0])
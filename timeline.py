@@ -0,0 +1,152 @@
+import json
+import os
+import numpy as np
+from constellation import node_positions
+from geometry import Point3D, distances_from
+from transfer_cost import create_cost_model
+
+TIMELINE_VERSION = 1
+DEFAULT_FRAMES = 600
+
+
+def route_schedule(satellites, moon, rocket, path, cost_model='linear'):
+    """
+    Rotadaki her bacağın kalkış/varış zamanlarını çözücünün yayıcısıyla,
+    yakıtını RouteEvaluator gibi çözücünün maliyet modeliyle hesaplar
+    (Ay'a varışta depo dolar)
+    Args:
+        cost_model: Sonuçtaki 'cost_model' adı ya da hazır maliyet modeli
+    Returns:
+        list: Her bacak için sözlük (from_node, to_node, departure, arrival,
+        distance, fuel_required, estimated_time)
+    """
+    if isinstance(cost_model, str):
+        cost_model = create_cost_model(cost_model, satellites, moon, rocket)
+    segments = []
+    elapsed_time = 0.0
+    fuel_on_board = float(rocket.max_fuel)
+    for from_node, to_node in zip(path[:-1], path[1:]):
+        positions = node_positions(satellites, moon, elapsed_time)
+        distance = float(distances_from(positions[from_node], positions[to_node][None])[0])
+        travel_time = distance / rocket.speed
+        fuel = np.broadcast_to(cost_model.fuel(int(from_node), np.array([to_node]), np.array([distance]),
+                                               elapsed_time, fuel_on_board), (1,))
+        fuel_required = float(fuel[0])
+        segments.append({
+            'from_node': int(from_node),
+            'to_node': int(to_node),
+            'departure': elapsed_time,
+            'arrival': elapsed_time + travel_time,
+            'distance': distance,
+            'fuel_required': fuel_required,
+            'estimated_time': travel_time
+        })
+        elapsed_time += travel_time
+        fuel_on_board = float(rocket.max_fuel) if to_node == 0 else fuel_on_board - fuel_required
+    return segments
+
+
+def build_timeline(satellites, moon, rocket, path, num_frames=DEFAULT_FRAMES,
+                   fuel_consumption_per_hour=0.005, cost_model='linear'):
+    """
+    Görevin tamamını eşit zaman aralıklarıyla örnekler
+    Args:
+        satellites: Constellation
+        moon: Moon
+        rocket: Rocket
+        path: Düğüm listesi (0 Ay)
+        num_frames: Örnek (kare) sayısı
+        cost_model: Bacak yakıtları için çözücünün maliyet modeli (sonuçtaki
+            'cost_model')
+    Returns:
+        dict: times (F,), satellites (F, N, 3), moon (F, 3), rocket (F, 3),
+        leg (F,) ve segment bilgileri
+    """
+    segments = route_schedule(satellites, moon, rocket, path, cost_model) if path else []
+    duration = segments[-1]['arrival'] if segments else 0.0
+    times = np.linspace(0, duration, max(num_frames, 2))
+
+    positions = node_positions(satellites, moon, times)
+    rocket_positions = positions[:, 0, :].copy()  # Bacak dışında roket Ay'da bekler
+    leg = np.full(len(times), -1, dtype=np.int32)
+
+    for index, segment in enumerate(segments):
+        mask = (times >= segment['departure']) & (times <= segment['arrival'])
+        if not mask.any():
+            continue
+        start = node_positions(satellites, moon, segment['departure'])[segment['from_node']]
+        end = node_positions(satellites, moon, segment['arrival'])[segment['to_node']]
+        trajectory = rocket.calculate_trajectory(Point3D.from_array(start), Point3D.from_array(end), [moon])
+        span = max(segment['estimated_time'], 1e-9)
+        rocket_positions[mask] = trajectory.evaluate((times[mask] - segment['departure']) / span)
+        leg[mask] = index
+
+    return {
+        'times': times,
+        'satellites': positions[:, 1:, :],
+        'moon': positions[:, 0, :],
+        'rocket': rocket_positions,
+        'leg': leg,
+        'path': [int(node) for node in path] if path else [],
+        'segments': segments,
+        'satellite_ids': satellites.ids.tolist(),
+        'initial_fuel': satellites.fuel.tolist(),
+        'fuel_consumption_per_hour': fuel_consumption_per_hour
+    }
+
+
+def write_timeline(timeline, directory, name='timeline'):
+    """
+    Zaman çizelgesini küçük bir JSON manifest ve little-endian ikili dosya
+    olarak yazar. Görüntüleyici diziyi Float32Array/Int32Array olarak okur.
+    Returns:
+        tuple: (manifest yolu, ikili dosya yolu)
+    """
+    os.makedirs(directory, exist_ok=True)
+    bin_name = f"{name}.bin"
+    arrays = [
+        ('times', np.asarray(timeline['times'], dtype='<f4')),
+        ('satellites', np.asarray(timeline['satellites'], dtype='<f4')),
+        ('moon', np.asarray(timeline['moon'], dtype='<f4')),
+        ('rocket', np.asarray(timeline['rocket'], dtype='<f4')),
+        ('leg', np.asarray(timeline['leg'], dtype='<i4'))
+    ]
+
+    layout = {}
+    offset = 0
+    bin_path = os.path.join(directory, bin_name)
+    tmp_path = f"{bin_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        for key, array in arrays:
+            layout[key] = {
+                'offset': offset,
+                'dtype': 'float32' if array.dtype.kind == 'f' else 'int32',
+                'shape': list(array.shape)
+            }
+            f.write(array.tobytes())
+            offset += array.nbytes
+
+    manifest = {
+        'version': TIMELINE_VERSION,
+        'binary': bin_name,
+        'num_frames': len(timeline['times']),
+        'num_satellites': len(timeline['satellite_ids']),
+        'duration': float(timeline['times'][-1]),
+        'layout': layout,
+        'path': timeline['path'],
+        'cost': float(sum(s['distance'] for s in timeline['segments'])),
+        'total_fuel_consumption': float(sum(s['fuel_required'] for s in timeline['segments'])),
+        'total_time': float(timeline['times'][-1]),
+        'segments': timeline['segments'],
+        'satellite_ids': timeline['satellite_ids'],
+        'initial_fuel': timeline['initial_fuel'],
+        'fuel_consumption_per_hour': timeline['fuel_consumption_per_hour']
+    }
+    manifest_path = os.path.join(directory, f"{name}.json")
+    with open(f"{manifest_path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+    # Görüntüleyici yarım yazılmış dosya görmesin
+    os.replace(tmp_path, bin_path)
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+    return manifest_path, bin_path
@@ -0,0 +1,222 @@
+import math
+import numpy as np
+from constellation import GM_EARTH
+
+STANDARD_GRAVITY = 9.80665  # m/s^2
+PHASING_REVOLUTIONS = 2  # Faz düzeltmesi için faz yörüngesinde tur sayısı
+
+
+def hohmann_delta_v(r1, r2, inclination_change, mu=GM_EARTH):
+    """
+    Dairesel yörüngeler arası Hohmann transferi; düzlem değişikliği daha
+    yavaş olan dış yörünge yakmasıyla birleştirilir
+    Args:
+        r1, r2: Kalkış ve varış yörünge yarıçapları (metre)
+        inclination_change: Eğim farkı (radyan)
+    Returns:
+        np.ndarray: Toplam delta-v (m/s)
+    """
+    r1 = np.asarray(r1, dtype=np.float64)
+    r2 = np.asarray(r2, dtype=np.float64)
+    inner = np.minimum(r1, r2)
+    outer = np.maximum(r1, r2)
+    transfer_axis = inner + outer
+
+    v_inner = np.sqrt(mu / inner)
+    v_outer = np.sqrt(mu / outer)
+    v_periapsis = np.sqrt(mu * 2 * outer / (inner * transfer_axis))
+    v_apoapsis = np.sqrt(mu * 2 * inner / (outer * transfer_axis))
+
+    inner_burn = v_periapsis - v_inner
+    # Kosinüs kuralı: hız büyüklüğü ve yön değişimi tek yakmada
+    outer_burn = np.sqrt(np.maximum(
+        v_apoapsis ** 2 + v_outer ** 2
+        - 2 * v_apoapsis * v_outer * np.cos(inclination_change), 0))
+    return inner_burn + outer_burn
+
+
+def phasing_lead_offset(r1, r2, mu=GM_EARTH):
+    """
+    Hohmann transferi boyunca hedefin roketten fazladan kat ettiği açı;
+    varışta hedefin öndeliği (kalkış fazı + bu değer) mod 2π olur
+    """
+    r1 = np.asarray(r1, dtype=np.float64)
+    r2 = np.asarray(r2, dtype=np.float64)
+    transfer_time = math.pi * np.sqrt(((r1 + r2) / 2) ** 3 / mu)
+    return transfer_time * np.sqrt(mu / r2 ** 3) - math.pi
+
+
+def phasing_burn(r2, lead, revolutions=PHASING_REVOLUTIONS, mu=GM_EARTH):
+    """
+    r2 yörüngesinde lead radyan öndeki hedefe yetişmek için faz manevrası
+    Returns:
+        np.ndarray: İki yakma dahil delta-v (m/s)
+    """
+    r2 = np.asarray(r2, dtype=np.float64)
+    target_period = 2 * math.pi * np.sqrt(r2 ** 3 / mu)
+    # Yetişmek (kısa periyot) ya da geride kalmak (uzun periyot); ucuz olanı seç
+    catch_up = target_period * (1 - lead / (2 * math.pi * revolutions))
+    fall_back = target_period * (1 + (2 * math.pi - lead) / (2 * math.pi * revolutions))
+    v_circular = np.sqrt(mu / r2)
+
+    def burn(period):
+        semi_major = np.cbrt(mu * (period / (2 * math.pi)) ** 2)
+        return 2 * np.abs(np.sqrt(mu * (2 / r2 - 1 / semi_major)) - v_circular)
+
+    return np.minimum(burn(catch_up), burn(fall_back))
+
+
+def phasing_delta_v(r1, r2, phase, revolutions=PHASING_REVOLUTIONS, mu=GM_EARTH):
+    """
+    Hohmann varışında hedefle buluşmak için gereken faz düzeltmesi
+    Args:
+        r1, r2: Kalkış ve varış yörünge yarıçapları (metre)
+        phase: Kalkışta hedefin roketten açısal önü (radyan)
+        revolutions: Faz yörüngesinde geçirilecek tur sayısı
+    """
+    lead = np.remainder(phase + phasing_lead_offset(r1, r2, mu), 2 * math.pi)
+    return phasing_burn(r2, lead, revolutions, mu)
+
+
+def transfer_delta_v(r1, r2, phase, inclination_change, revolutions=PHASING_REVOLUTIONS,
+                     mu=GM_EARTH):
+    """Hohmann + düzlem değişikliği + faz düzeltmesinin toplam delta-v'si"""
+    return (hohmann_delta_v(r1, r2, inclination_change, mu)
+            + phasing_delta_v(r1, r2, phase, revolutions, mu))
+
+
+def propellant_mass(delta_v, wet_mass, specific_impulse):
+    """
+    Tsiolkovsky roket denklemi: delta_v için harcanan yakıt kütlesi
+    Args:
+        delta_v: m/s
+        wet_mass: Yakıt dahil başlangıç kütlesi (kg)
+        specific_impulse: Özgül itki (saniye)
+    """
+    exhaust_velocity = specific_impulse * STANDARD_GRAVITY
+    return wet_mass * -np.expm1(-np.asarray(delta_v) / exhaust_velocity)
+
+
+class TransferCostTable:
+    """
+    Düğüm çiftleri için önceden hesaplanmış transfer tabloları. Yarıçap ve
+    eğim düğüm başına sabit olduğundan Hohmann + düzlem değişikliği
+    maliyeti ve faz öndeliği kayması çift başına bir kez hesaplanır; zamana
+    bağlı tek girdi olan faz farkı, varış düğümü başına düzgün bir ızgarada
+    doğrusal interpolasyonla okunur. İç döngüde yalnızca dizi indeksleme
+    ve birkaç aritmetik işlem kalır.
+    """
+
+    def __init__(self, radius, inclination, phase_points=256, revolutions=PHASING_REVOLUTIONS):
+        radius = np.asarray(radius, dtype=np.float64)
+        inclination = np.asarray(inclination, dtype=np.float64)
+        r1 = radius[:, None]
+        r2 = radius[None, :]
+        self.transfer = hohmann_delta_v(r1, r2, np.abs(inclination[None, :] - inclination[:, None]))
+        self.lead_offset = phasing_lead_offset(r1, r2)
+
+        self.phase_points = phase_points
+        self.phase_scale = (phase_points - 1) / (2 * math.pi)
+        leads = np.linspace(0, 2 * math.pi, phase_points)
+        self.phasing = phasing_burn(radius[:, None], leads[None, :], revolutions)
+
+    def delta_v(self, from_node, to_nodes, phase):
+        lead = np.remainder(phase + self.lead_offset[from_node, to_nodes], 2 * math.pi)
+        position = lead * self.phase_scale
+        index = np.minimum(position.astype(np.intp), self.phase_points - 2)
+        weight = position - index
+        phasing = ((1 - weight) * self.phasing[to_nodes, index]
+                   + weight * self.phasing[to_nodes, index + 1])
+        return self.transfer[from_node, to_nodes] + phasing
+
+
+class LinearCostModel:
+    """Mesafeyle orantılı yakıt (Rocket.calculate_fuel_consumption)"""
+    name = 'linear'
+
+    def __init__(self, satellites, moon, rocket):
+        self.rocket = rocket
+
+    def fuel(self, from_node, to_nodes, distance, elapsed_time, fuel_on_board):
+        return self.rocket.calculate_fuel_consumption(distance)
+
+    def leg_cost(self, distance, fuel):
+        """Rota maliyetine eklenen değer: metre"""
+        return distance
+
+    def required_fuel(self, distance_bound):
+        """Bacak başına gereken en az yakıt; mesafe alt sınırından"""
+        return self.rocket.calculate_fuel_consumption(distance_bound)
+
+    def static_leg_costs(self, distances):
+        """Zamandan bağımsız yaklaşık bacak maliyetleri (kurucu sezgiseller için)"""
+        return distances
+
+
+class DeltaVCostModel:
+    """
+    Düğümler arası dairesel yörünge transferlerinin delta-v'sinden
+    Tsiolkovsky denklemiyle yakıt hesaplar. Ay, Ay yörüngesi yarıçapında
+    ve sıfır eğimli bir düğüm olarak ele alınır.
+    """
+    name = 'delta_v'
+
+    def __init__(self, satellites, moon, rocket, **table_options):
+        self.rocket = rocket
+        self.radius = np.concatenate(([moon.orbit_radius], satellites.orbit_radius))
+        self.inclination = np.concatenate(([0.0], satellites.inclination))
+        self.angle = np.concatenate(([moon.current_angle], satellites.angle))
+        self.angular_velocity = np.concatenate(([2 * math.pi / moon.orbital_period],
+                                                satellites.angular_velocity))
+        self.table = TransferCostTable(self.radius, self.inclination, **table_options)
+
+    def node_angles(self, nodes, elapsed_time):
+        """Düğümlerin elapsed_time anındaki yörünge içi açıları"""
+        return self.angle[nodes] + self.angular_velocity[nodes] * elapsed_time
+
+    def delta_v(self, from_node, to_nodes, elapsed_time):
+        phase = self.node_angles(to_nodes, elapsed_time) - self.node_angles(from_node, elapsed_time)
+        return self.table.delta_v(from_node, to_nodes, phase)
+
+    def fuel(self, from_node, to_nodes, distance, elapsed_time, fuel_on_board):
+        wet_mass = self.rocket.dry_mass + fuel_on_board
+        return propellant_mass(self.delta_v(from_node, to_nodes, elapsed_time), wet_mass,
+                               self.rocket.specific_impulse)
+
+    def leg_cost(self, distance, fuel):
+        """Rota maliyetine eklenen değer: harcanan yakıt (kg)"""
+        return fuel
+
+    def required_fuel(self, distance_bound):
+        """
+        Bacak başına gereken en az yakıt. Faz düzeltmesi negatif olamadığından
+        Hohmann + düzlem değişikliği alt sınırdır; f >= (kuru + f) * k
+        koşulu f >= kuru * k / (1 - k) demektir.
+        """
+        ratio = -np.expm1(-self.table.transfer / (self.rocket.specific_impulse * STANDARD_GRAVITY))
+        with np.errstate(divide='ignore'):
+            return self.rocket.dry_mass * ratio / (1 - ratio)
+
+    def static_leg_costs(self, distances):
+        """Faz düzeltmesi hariç, dolu depoyla yapılan transferin yakıtı"""
+        wet_mass = self.rocket.dry_mass + self.rocket.max_fuel
+        return propellant_mass(self.table.transfer, wet_mass, self.rocket.specific_impulse)
+
+
+COST_MODELS = {
+    LinearCostModel.name: LinearCostModel,
+    DeltaVCostModel.name: DeltaVCostModel
+}
+
+
+def create_cost_model(name, satellites, moon, rocket):
+    """
+    Adı verilen maliyet modelini oluşturur
+    Raises:
+        ValueError: Bilinmeyen model adı
+    """
+    try:
+        model = COST_MODELS[name]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen maliyet modeli: {name} (seçenekler: {sorted(COST_MODELS)})")
+    return model(satellites, moon, rocket)